@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark the precomputed coverage index against the legacy per-entry corpus scans.
+
+Both implementations run over the same API index and reference corpus; the script
+fails if they disagree on any entry.
+
+    python3 benchmarks/bench_coverage.py --index references/api-index-generated.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import re
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.find_uncovered_apis import (
+    TOKEN_RE,
+    ApiEntry,
+    CorpusIndex,
+    build_corpus_index,
+    coverage_phrases,
+    has_method_call,
+    has_qualified,
+    is_covered,
+    load_api_index,
+    load_reference_docs,
+)
+
+LEGACY_QUALIFIED_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*\.\s*([A-Za-z_][A-Za-z0-9_]*)")
+LEGACY_METHOD_CALL_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*(?:<[^>\n]+>)?\s*\(")
+DEFAULT_EXCLUDES = [
+    "api-index-generated.md",
+    "api-index-*-generated.md",
+    "api-coverage-*.md",
+    "*-breaking-changes-and-new-api-catalog.md",
+]
+
+
+def legacy_build_corpus_index(corpus: str) -> CorpusIndex:
+    return CorpusIndex(
+        corpus=corpus,
+        tokens=frozenset(TOKEN_RE.findall(corpus)),
+        qualified=frozenset((left, right) for left, right in LEGACY_QUALIFIED_RE.findall(corpus)),
+        method_calls=frozenset(LEGACY_METHOD_CALL_RE.findall(corpus)),
+    )
+
+
+def legacy_has_token(index: CorpusIndex, token: str) -> bool:
+    if " " not in token and token in index.tokens:
+        return True
+    if token not in index.corpus:
+        return False
+    pattern = re.compile(rf"(?<![A-Za-z0-9_]){re.escape(token)}(?![A-Za-z0-9_])")
+    return bool(pattern.search(index.corpus))
+
+
+def legacy_is_covered(entry: ApiEntry, index: CorpusIndex) -> bool:
+    if entry.kind == "type":
+        if f"`{entry.symbol}`" in index.corpus:
+            return True
+        return legacy_has_token(index, entry.symbol)
+
+    if entry.kind == "indexer":
+        return "this[" in index.corpus
+
+    if entry.kind == "operator":
+        text = f"operator {entry.symbol}"
+        if f"`{text}`" in index.corpus:
+            return True
+        return legacy_has_token(index, text)
+
+    if entry.kind in {"method", "delegate"}:
+        if entry.container and has_qualified(index, entry.container, entry.symbol):
+            return True
+        if has_method_call(index, entry.symbol):
+            return True
+        return f"`{entry.symbol}`" in index.corpus
+
+    if entry.container and has_qualified(index, entry.container, entry.symbol):
+        return True
+
+    if f"`{entry.symbol}`" in index.corpus:
+        return True
+
+    if len(entry.symbol) >= 8 and entry.symbol[:1].isupper():
+        return legacy_has_token(index, entry.symbol)
+
+    return False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare legacy and precomputed API coverage matching.")
+    parser.add_argument("--index", type=pathlib.Path, default=ROOT / "references" / "api-index-generated.md")
+    parser.add_argument("--references-dir", type=pathlib.Path, default=ROOT / "references")
+    args = parser.parse_args()
+
+    index_path = args.index.resolve()
+    entries = load_api_index(index_path)
+    docs, corpus = load_reference_docs(args.references_dir.resolve(), index_path, None, DEFAULT_EXCLUDES)
+
+    start = time.perf_counter()
+    legacy_index = legacy_build_corpus_index(corpus)
+    legacy = [entry for entry in entries if not legacy_is_covered(entry, legacy_index)]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = build_corpus_index(corpus, coverage_phrases(entries))
+    build_seconds = time.perf_counter() - start
+    current = [entry for entry in entries if not is_covered(entry, index)]
+    current_seconds = time.perf_counter() - start
+
+    print(f"Entries: {len(entries)}; reference docs: {len(docs)} ({len(corpus) / 1_000_000:.1f} MB)")
+    print(f"Legacy scans:         {legacy_seconds:.3f}s ({len(legacy)} not covered)")
+    print(f"Precomputed index:    {current_seconds:.3f}s ({len(current)} not covered; build {build_seconds:.3f}s)")
+    print(f"Speedup:              {legacy_seconds / current_seconds:.1f}x")
+
+    if legacy != current:
+        print("error: implementations disagree on covered entries", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark one `git show` process per file against a batched `git cat-file` session.
+
+Reads every control source file of a ref twice: by spawning `git show <ref>:<path>`
+per file (the control docs generator's former read path), and through
+`GitTreeReader`, which streams all blobs through one `git cat-file --batch`
+process. The script fails if the two reads disagree on any file.
+
+    python3 benchmarks/bench_git_reads.py --repo ../Avalonia --git-ref 11.3.12
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import subprocess
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.generate_control_reference_docs import CONTROL_SOURCE_PATTERNS, list_control_files
+from scripts.tree_readers import GitTreeReader
+
+
+def spawn_reads(repo: pathlib.Path, git_ref: str, files: list[str]) -> list[bytes]:
+    return [subprocess.check_output(["git", "-C", str(repo), "show", f"{git_ref}:{rel}"]) for rel in files]
+
+
+def batched_reads(repo: pathlib.Path, git_ref: str) -> tuple[list[str], list[bytes]]:
+    tree = GitTreeReader(repo, git_ref)
+    try:
+        files = list_control_files(tree)
+        return files, [tree.read_bytes(rel) for rel in files]
+    finally:
+        tree.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare per-file git spawns with a batched blob reader.")
+    parser.add_argument("--repo", type=pathlib.Path, required=True, help="Path to Avalonia git repository.")
+    parser.add_argument("--git-ref", default="HEAD", help="Git ref/tag to read.")
+    args = parser.parse_args()
+
+    repo = args.repo.resolve()
+    try:
+        start = time.perf_counter()
+        files, batched = batched_reads(repo, args.git_ref)
+        batched_seconds = time.perf_counter() - start
+    except RuntimeError as ex:
+        print(f"error: {ex}", file=sys.stderr)
+        return 4
+    if not files:
+        print(f"error: no files match {', '.join(CONTROL_SOURCE_PATTERNS)} at {args.git_ref}", file=sys.stderr)
+        return 3
+
+    start = time.perf_counter()
+    spawned = spawn_reads(repo, args.git_ref, files)
+    spawn_seconds = time.perf_counter() - start
+
+    size = sum(len(data) for data in batched)
+    print(f"Files: {len(files)} ({size / 1_000_000:.1f} MB)")
+    print(f"git show per file: {spawn_seconds:.3f}s")
+    print(f"cat-file --batch:  {batched_seconds:.3f}s (including ls-tree)")
+    print(f"Speedup:           {spawn_seconds / batched_seconds:.1f}x")
+
+    if spawned != batched:
+        print("error: readers disagree on file content", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark blocked rename/move detection against exhaustive pairwise scoring.
+
+Loads two committed API index documents, diffs them like the migration report,
+then pairs removed with added items twice: with `detect_renames` (blocked) and
+by scoring every removed/added rename or move pair with the same features and
+greedy matching.
+
+    python3 benchmarks/bench_renames.py \\
+        --old references/api-index-generated.md \\
+        --new references/api-index-12.0.0-rc1-generated.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.find_uncovered_apis import load_api_index
+from scripts.generate_api_index import area_for
+from scripts.generate_api_migration_report import (
+    DEFAULT_RENAME_THRESHOLD,
+    ApiItem,
+    dedupe_items,
+    detect_renames,
+    diff_added_items,
+    diff_removed_items,
+    is_rename_or_move,
+    jaccard,
+    member_place,
+    rename_features,
+    signature_shape,
+)
+
+
+def load_items(path: pathlib.Path) -> list[ApiItem]:
+    return dedupe_items(
+        [
+            ApiItem(
+                area=area_for(entry.source_file),
+                source_file=entry.source_file,
+                namespace=entry.namespace,
+                container=entry.container,
+                kind=entry.kind,
+                symbol=entry.symbol,
+                signature=entry.signature,
+            )
+            for entry in load_api_index(path)
+        ]
+    )
+
+
+def pairwise_renames(
+    removed_items: list[ApiItem],
+    added_items: list[ApiItem],
+    threshold: float,
+) -> list[tuple[ApiItem, ApiItem, float]]:
+    # Signatures changed in place are left out, as in `detect_renames`.
+    in_place = {member_place(item) for item in removed_items} & {member_place(item) for item in added_items}
+    removed_items = [item for item in removed_items if member_place(item) not in in_place]
+    added_items = [item for item in added_items if member_place(item) not in in_place]
+    removed_features = [rename_features(item, signature_shape(item)) for item in removed_items]
+    added_features = [rename_features(item, signature_shape(item)) for item in added_items]
+    scored = [
+        (jaccard(left, right), removed_index, added_index)
+        for removed_index, left in enumerate(removed_features)
+        for added_index, right in enumerate(added_features)
+        if is_rename_or_move(removed_items[removed_index], added_items[added_index])
+    ]
+
+    pairs: list[tuple[ApiItem, ApiItem, float]] = []
+    paired_removed: set[int] = set()
+    paired_added: set[int] = set()
+    for score, removed_index, added_index in sorted(scored, key=lambda entry: (-entry[0], entry[1], entry[2])):
+        if score < threshold:
+            break
+        if removed_index in paired_removed or added_index in paired_added:
+            continue
+        paired_removed.add(removed_index)
+        paired_added.add(added_index)
+        pairs.append((removed_items[removed_index], added_items[added_index], score))
+    return pairs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare blocked and pairwise rename/move detection.")
+    parser.add_argument("--old", type=pathlib.Path, default=ROOT / "references" / "api-index-generated.md")
+    parser.add_argument("--new", type=pathlib.Path, default=ROOT / "references" / "api-index-12.0.0-rc1-generated.md")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_RENAME_THRESHOLD)
+    args = parser.parse_args()
+
+    old_items = load_items(args.old.resolve())
+    new_items = load_items(args.new.resolve())
+    removed_items = diff_removed_items(old_items, new_items)
+    added_items = diff_added_items(old_items, new_items)
+    print(f"Removed: {len(removed_items)}; added: {len(added_items)}")
+
+    start = time.perf_counter()
+    blocked = detect_renames(removed_items, added_items, args.threshold)
+    blocked_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pairwise = pairwise_renames(removed_items, added_items, args.threshold)
+    pairwise_seconds = time.perf_counter() - start
+
+    blocked_pairs = {(candidate.removed, candidate.added) for candidate in blocked}
+    pairwise_pairs = {(removed, added) for removed, added, _ in pairwise}
+    relations = {relation: sum(candidate.relation == relation for candidate in blocked) for relation in ("rename", "move")}
+
+    print(
+        f"Blocked:  {blocked_seconds:.3f}s, {len(blocked)} pairs "
+        f"({relations['rename']} renames, {relations['move']} moves)"
+    )
+    print(f"Pairwise: {pairwise_seconds:.3f}s, {len(pairwise)} pairs above {args.threshold}")
+    print(f"Blocked pairs also chosen pairwise: {len(blocked_pairs & pairwise_pairs)}/{len(blocked_pairs)}")
+    print(f"Speedup: {pairwise_seconds / blocked_seconds:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Measure the extra memory used to render large generated reports.
+
+For each report size the API index and migration report renderers run in a fresh
+child process, once buffered the legacy way (collect lines, join, write) and once
+streamed through `write_lines_atomic`. The child reports the peak RSS growth and
+the tracemalloc peak of the rendering step alone, on top of the report data that
+both variants hold in memory anyway.
+
+    python3 benchmarks/bench_report_memory.py --sizes 25000 50000 100000 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.generate_api_index import iter_markdown_lines
+from scripts.generate_api_migration_report import ApiItem, iter_report_lines
+from scripts.output_files import write_lines_atomic
+
+SIGNATURES_PER_FILE = 100
+MODES = ("legacy", "stream")
+REPORTS = ("index", "report")
+
+
+def synthetic_index(size: int) -> dict[str, list[tuple[str, str | None, list[str]]]]:
+    by_area: dict[str, list[tuple[str, str | None, list[str]]]] = {}
+    for file_index in range(max(1, size // SIGNATURES_PER_FILE)):
+        signatures = [
+            f"public static readonly StyledProperty<double> Value{i}Property = "
+            f"AvaloniaProperty.Register<Control{file_index}, double>(nameof(Value{i}));"
+            for i in range(SIGNATURES_PER_FILE)
+        ]
+        area = f"Area {file_index % 12}"
+        by_area.setdefault(area, []).append((f"src/Area/File{file_index}.cs", "Avalonia.Controls", signatures))
+    return by_area
+
+
+def synthetic_items(size: int) -> list[ApiItem]:
+    return [
+        ApiItem(
+            area=f"Area {i % 12}",
+            source_file=f"src/Area/File{i // SIGNATURES_PER_FILE}.cs",
+            namespace="Avalonia.Controls",
+            container=f"Control{i // SIGNATURES_PER_FILE}",
+            kind="member",
+            symbol=f"Value{i}Property",
+            signature=f"public static readonly StyledProperty<double> Value{i}Property = AvaloniaProperty.Register();",
+        )
+        for i in range(size)
+    ]
+
+
+def max_rss_bytes() -> int:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_child(report: str, mode: str, size: int) -> dict[str, int]:
+    if report == "index":
+        by_area = synthetic_index(size)
+        total = sum(len(sigs) for entries in by_area.values() for _, _, sigs in entries)
+        render = lambda: iter_markdown_lines(by_area, "repo", "index.md", len(by_area), total, max_per_file=10**9)
+    else:
+        items = synthetic_items(size)
+        render = lambda: iter_report_lines(pathlib.Path("repo"), "v1", "v2", [], items, items[: size // 10])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = pathlib.Path(temp_dir) / "out.md"
+        rss_before = max_rss_bytes()
+        tracemalloc.start()
+        if mode == "legacy":
+            lines = list(render())
+            output.write_text("\n".join(lines), encoding="utf-8")
+            del lines
+        else:
+            write_lines_atomic(output, render())
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rss_growth = max_rss_bytes() - rss_before
+        output_bytes = output.stat().st_size
+
+    return {"rss_growth": rss_growth, "traced_peak": traced_peak, "output_bytes": output_bytes}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare buffered and streamed report rendering memory.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25_000, 50_000, 100_000, 200_000])
+    parser.add_argument("--child", nargs=3, metavar=("REPORT", "MODE", "SIZE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        report, mode, size = args.child
+        print(json.dumps(run_child(report, mode, int(size))))
+        return 0
+
+    print(f"{'report':<8} {'signatures':>10} {'output MB':>10} {'mode':<7} {'RSS growth MB':>14} {'traced peak MB':>15}")
+    for report in REPORTS:
+        for size in args.sizes:
+            for mode in MODES:
+                result = subprocess.run(
+                    [sys.executable, str(pathlib.Path(__file__).resolve()), "--child", report, mode, str(size)],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                )
+                stats = json.loads(result.stdout)
+                print(
+                    f"{report:<8} {size:>10} {stats['output_bytes'] / 1e6:>10.1f} {mode:<7} "
+                    f"{stats['rss_growth'] / 1e6:>14.1f} {stats['traced_peak'] / 1e6:>15.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
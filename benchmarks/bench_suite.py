@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Throughput benchmarks for the parsers over a seeded synthetic Avalonia-scale corpus.
+
+For each `--files` size the suite writes a fresh corpus (see `synthetic_corpus.py`)
+and times, best of `--repeat` runs:
+
+- `extract_signatures`: the API index view of every source file,
+- `extract_api_items`: the migration report view of every source file,
+- `collect_types`: control type collection over `src/Avalonia.Controls*`,
+- `parse_api_index`: parsing the API index markdown generated from the corpus,
+- `coverage`: building the corpus index over the reference docs and checking
+  every index entry against it.
+
+Results are written as JSON with `--output`. With `--baseline`, each stage is
+compared against a previous results file for the same seed and sizes, and the run
+fails when any stage is more than `--max-regression` slower. Stages faster than
+`--min-seconds` in the baseline are reported but never fail the run, since their
+timings are mostly noise:
+
+    python3 benchmarks/bench_suite.py --files 1000 10000 --output bench-results.json
+    python3 benchmarks/bench_suite.py --files 1000 10000 --baseline bench-results.json --max-regression 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+import pathlib
+import platform
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.synthetic_corpus import generate_corpus
+from scripts.find_uncovered_apis import build_corpus_index, coverage_phrases, is_covered, load_reference_docs, parse_api_index
+from scripts.generate_api_index import extract_signatures, write_markdown
+from scripts.generate_api_migration_report import extract_api_items
+from scripts.generate_control_reference_docs import collect_types, list_control_files
+from scripts.tree_readers import FilesystemTreeReader
+
+RESULTS_FORMAT = "avalonia-benchmark-results"
+RESULTS_VERSION = 1
+STAGES = ("extract_signatures", "extract_api_items", "collect_types", "parse_api_index", "coverage")
+
+
+def best_of(repeat: int, func: Callable[[], int]) -> tuple[float, int]:
+    """Run `func` `repeat` times; return the fastest wall time and the item count it reported."""
+    best = float("inf")
+    items = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        items = func()
+        best = min(best, time.perf_counter() - start)
+    return best, items
+
+
+def run_size(files: int, seed: int, repeat: int) -> dict[str, object]:
+    with tempfile.TemporaryDirectory(prefix="avalonia-bench-") as temp_dir:
+        root = pathlib.Path(temp_dir)
+        corpus = generate_corpus(root, files, seed)
+        paths = [root / rel for rel in corpus.files]
+        tree = FilesystemTreeReader(root)
+        control_files = list_control_files(tree)
+
+        index_path = root / "api-index-generated.md"
+        write_markdown(index_path, tree, "synthetic", corpus.files, max_per_file=1_000_000)
+        entries = parse_api_index(index_path)
+        _, reference_corpus = load_reference_docs(root / "references", index_path, None, [])
+
+        def coverage() -> int:
+            index = build_corpus_index(reference_corpus, coverage_phrases(entries))
+            return sum(is_covered(entry, index) for entry in entries)
+
+        stages: dict[str, Callable[[], int]] = {
+            "extract_signatures": lambda: sum(len(extract_signatures(path)[1]) for path in paths),
+            "extract_api_items": lambda: sum(len(extract_api_items(root, path)) for path in paths),
+            "collect_types": lambda: len(collect_types(tree, control_files)),
+            "parse_api_index": lambda: len(parse_api_index(index_path)),
+            "coverage": coverage,
+        }
+
+        results: dict[str, dict[str, float | int]] = {}
+        for stage in STAGES:
+            seconds, items = best_of(repeat, stages[stage])
+            results[stage] = {"seconds": round(seconds, 6), "items": items}
+            print(f"{files:>7} files  {stage:<20} {seconds:>9.3f}s  {items:>9} items  {items / seconds:>11.0f} items/s")
+
+    return {
+        "files": files,
+        "source_bytes": corpus.source_bytes,
+        "doc_bytes": corpus.doc_bytes,
+        "stages": results,
+    }
+
+
+def compare_to_baseline(
+    results: dict[str, object],
+    baseline: dict[str, object],
+    max_regression: float,
+    min_seconds: float = 0.0,
+) -> list[str]:
+    """Return one message per stage that is more than `max_regression` slower than the baseline."""
+    baseline_runs = {run["files"]: run for run in baseline["runs"]}
+    regressions: list[str] = []
+    for run in results["runs"]:
+        previous = baseline_runs.get(run["files"])
+        if previous is None:
+            print(f"warning: baseline has no run with {run['files']} files", file=sys.stderr)
+            continue
+        for stage, current in run["stages"].items():
+            before = previous["stages"].get(stage)
+            if before is None or before["seconds"] <= 0:
+                continue
+            ratio = current["seconds"] / before["seconds"]
+            print(f"{run['files']:>7} files  {stage:<20} {ratio:>6.2f}x baseline")
+            if ratio > 1 + max_regression and before["seconds"] >= min_seconds:
+                regressions.append(
+                    f"{stage} with {run['files']} files: {current['seconds']:.3f}s vs baseline "
+                    f"{before['seconds']:.3f}s ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time the parsers over seeded synthetic Avalonia-scale corpora.")
+    parser.add_argument("--files", type=int, nargs="+", default=[1000], help="Corpus sizes in C# files (default: 1000).")
+    parser.add_argument("--seed", type=int, default=12, help="Seed for the corpus generator (default: 12).")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions per stage; the best run is kept.")
+    parser.add_argument("--output", type=pathlib.Path, help="Write the results as JSON to this path.")
+    parser.add_argument("--baseline", type=pathlib.Path, help="Compare against a previous results JSON file.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="With --baseline, fail when a stage is slower than the baseline by more than this fraction (default: 0.25).",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.05,
+        help="With --baseline, never fail on stages that took less than this in the baseline (default: 0.05).",
+    )
+    args = parser.parse_args()
+
+    if any(files < 1 for files in args.files) or args.repeat < 1:
+        print("error: --files and --repeat must be positive integers", file=sys.stderr)
+        return 2
+
+    baseline = None
+    if args.baseline is not None:
+        try:
+            baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as ex:
+            print(f"error: cannot read baseline {args.baseline}: {ex}", file=sys.stderr)
+            return 2
+        if baseline.get("format") != RESULTS_FORMAT or baseline.get("version") != RESULTS_VERSION:
+            print(f"error: {args.baseline} is not a {RESULTS_FORMAT} v{RESULTS_VERSION} file", file=sys.stderr)
+            return 2
+        if baseline.get("seed") != args.seed:
+            print(f"error: baseline seed {baseline.get('seed')} does not match --seed {args.seed}", file=sys.stderr)
+            return 2
+
+    results = {
+        "format": RESULTS_FORMAT,
+        "version": RESULTS_VERSION,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": [run_size(files, args.seed, args.repeat) for files in args.files],
+    }
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to: {args.output}")
+
+    if baseline is not None:
+        regressions = compare_to_baseline(results, baseline, args.max_regression, args.min_seconds)
+        if regressions:
+            for message in regressions:
+                print(f"error: regression in {message}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Benchmark parsing of API-compat suppression files.
+
+Writes a synthetic `api/*.nupkg.xml` fixture where every suppression is repeated
+once per target framework (as in Avalonia 12), then parses it in fresh child
+processes: with the legacy whole-document `ET.fromstring` reader, with the
+streaming `iterparse` reader, and with the streaming reader across worker
+processes. Wall time and memory are measured in separate runs, since tracemalloc
+slows parsing down. The script fails if the readers disagree.
+
+    python3 benchmarks/bench_suppressions.py --suppressions 100000 --jobs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import pathlib
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.generate_api_migration_report import (
+    SuppressionEntry,
+    normalize_package_name,
+    parse_suppression_documents,
+)
+from scripts.tree_readers import FilesystemTreeReader
+
+TARGET_FRAMEWORKS = ("net6.0", "net8.0", "netstandard2.0", "net10.0")
+DIAGNOSTICS = ("CP0001", "CP0002", "CP0006", "CP0008", "CP0009")
+MODES = ("legacy", "stream", "parallel")
+
+
+def write_fixture(api_dir: pathlib.Path, suppressions: int, packages: int) -> None:
+    """Write `suppressions` entries spread over `packages` files, one copy per framework."""
+    per_package = max(1, suppressions // (packages * len(TARGET_FRAMEWORKS)))
+    for package_index in range(packages):
+        package = f"Avalonia.Package{package_index}"
+        lines = ['<?xml version="1.0" encoding="utf-8"?>', "<Suppressions>"]
+        for framework in TARGET_FRAMEWORKS:
+            for i in range(per_package):
+                lines.append(
+                    "  <Suppression>"
+                    f"<DiagnosticId>{DIAGNOSTICS[i % len(DIAGNOSTICS)]}</DiagnosticId>"
+                    f"<Target>M:Avalonia.Controls.Control{i // 50}.Member{i}(System.Int32)</Target>"
+                    f"<Left>baseline/{package}/lib/{framework}/{package}.dll</Left>"
+                    f"<Right>current/{package}/lib/{framework}/{package}.dll</Right>"
+                    "</Suppression>"
+                )
+        lines.append("</Suppressions>")
+        (api_dir / f"{package}.nupkg.xml").write_text("\n".join(lines), encoding="utf-8")
+
+
+def legacy_parse_suppression_documents(documents: list[tuple[str, bytes]]) -> list[SuppressionEntry]:
+    entries: list[SuppressionEntry] = []
+
+    for rel, data in documents:
+        package = normalize_package_name(pathlib.PurePosixPath(rel))
+        root = ET.fromstring(data)
+
+        for node in root.findall("Suppression"):
+            diagnostic_id = (node.findtext("DiagnosticId") or "").strip()
+            target = (node.findtext("Target") or "").strip()
+            left = (node.findtext("Left") or "").strip()
+            right = (node.findtext("Right") or "").strip()
+            if not diagnostic_id or not target:
+                continue
+            entries.append(SuppressionEntry(package, diagnostic_id, target, left, right))
+
+    deduped: list[SuppressionEntry] = []
+    seen: set[tuple[str, str, str]] = set()
+    for entry in entries:
+        key = (entry.package, entry.diagnostic_id, entry.target)
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(entry)
+    return deduped
+
+
+def max_rss_bytes() -> int:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_child(api_dir: pathlib.Path, mode: str, jobs: int, measure: str) -> dict[str, object]:
+    tree = FilesystemTreeReader(api_dir)
+    documents = [(rel, tree.read_bytes(rel)) for rel in tree.list_files(["*.xml"])]
+
+    rss_before = max_rss_bytes()
+    if measure == "memory":
+        tracemalloc.start()
+    start = time.perf_counter()
+    if mode == "legacy":
+        entries = legacy_parse_suppression_documents(documents)
+    else:
+        entries = parse_suppression_documents(documents, jobs if mode == "parallel" else 1)
+    seconds = time.perf_counter() - start
+    traced_peak = 0
+    if measure == "memory":
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    digest = hashlib.sha256(repr(entries).encode("utf-8")).hexdigest()
+    return {
+        "seconds": seconds,
+        "traced_peak": traced_peak,
+        "rss_growth": max_rss_bytes() - rss_before,
+        "entries": len(entries),
+        "digest": digest,
+    }
+
+
+def run_mode(api_dir: pathlib.Path, mode: str, jobs: int, measure: str) -> dict[str, object]:
+    result = subprocess.run(
+        [sys.executable, str(pathlib.Path(__file__).resolve()), "--child", str(api_dir), mode, str(jobs), measure],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare legacy and streaming suppression XML parsing.")
+    parser.add_argument("--suppressions", type=int, default=100_000, help="Total suppressions, duplicates included.")
+    parser.add_argument("--packages", type=int, default=8, help="Number of package files.")
+    parser.add_argument("--jobs", type=int, default=4, help="Worker processes for the parallel mode.")
+    parser.add_argument("--child", nargs=4, metavar=("API_DIR", "MODE", "JOBS", "MEASURE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        api_dir, mode, jobs, measure = args.child
+        print(json.dumps(run_child(pathlib.Path(api_dir), mode, int(jobs), measure)))
+        return 0
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        api_dir = pathlib.Path(temp_dir)
+        write_fixture(api_dir, args.suppressions, args.packages)
+        fixture_mb = sum(path.stat().st_size for path in api_dir.iterdir()) / 1e6
+        print(f"Fixture: {args.suppressions} suppressions in {args.packages} files ({fixture_mb:.1f} MB)")
+        print(f"{'mode':<9} {'seconds':>8} {'traced peak MB':>15} {'RSS growth MB':>14} {'entries':>8}")
+
+        digests: set[str] = set()
+        for mode in MODES:
+            timed = run_mode(api_dir, mode, args.jobs, "time")
+            traced = run_mode(api_dir, mode, args.jobs, "memory")
+            digests.update([timed["digest"], traced["digest"]])
+            print(
+                f"{mode:<9} {timed['seconds']:>8.3f} {traced['traced_peak'] / 1e6:>15.1f} "
+                f"{timed['rss_growth'] / 1e6:>14.1f} {timed['entries']:>8}"
+            )
+
+    if len(digests) != 1:
+        print("error: readers disagree on the parsed suppressions", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
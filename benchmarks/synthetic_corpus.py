@@ -0,0 +1,281 @@
+"""Seeded generator for Avalonia-shaped C# source trees and reference corpora.
+
+The generated tree mirrors the layout the scripts expect (`src/<Assembly>/**/*.cs`,
+control assemblies under `src/Avalonia.Controls*`) and the constructs the parsers
+have to cope with: file-scoped and block namespaces, nested types, interfaces,
+attributes, XML doc comments, multi-line generic signatures with constraints,
+styled/direct property registrations, events, operators, indexers, `#if` blocks, and
+strings or comments containing braces. The same seed always yields the same bytes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import pathlib
+import random
+
+ASSEMBLIES = (
+    "Avalonia.Base",
+    "Avalonia.Controls",
+    "Avalonia.Controls",
+    "Avalonia.Controls",
+    "Avalonia.Controls.DataGrid",
+    "Avalonia.Controls.ColorPicker",
+    "Avalonia.Markup.Xaml",
+    "Avalonia.Themes.Fluent",
+    "Skia/Avalonia.Skia",
+    "Windows/Avalonia.Win32",
+)
+FOLDERS = ("", "Primitives", "Presenters", "Templates", "Utils", "Automation/Peers")
+WORDS = (
+    "Button", "Panel", "Layout", "Scroll", "Text", "Item", "Content", "Selection", "Visual", "Input",
+    "Focus", "Template", "Header", "Popup", "Menu", "Border", "Grid", "Stack", "Presenter", "Track",
+    "Range", "Thumb", "Toggle", "Calendar", "Picker", "Color", "Brush", "Geometry", "Pointer", "Key",
+)
+VALUE_TYPES = ("bool", "int", "double", "string", "object?", "Thickness", "IBrush?", "TimeSpan", "Size", "Orientation")
+BASE_CONTROLS = ("Control", "TemplatedControl", "ContentControl", "ItemsControl", "Panel", "Decorator")
+
+
+@dataclass
+class SyntheticCorpus:
+    root: pathlib.Path
+    files: list[str] = field(default_factory=list)
+    docs: list[str] = field(default_factory=list)
+    source_bytes: int = 0
+    doc_bytes: int = 0
+
+
+def type_name(rng: random.Random, index: int) -> str:
+    return f"{rng.choice(WORDS)}{rng.choice(WORDS)}{index}"
+
+
+def member_name(rng: random.Random) -> str:
+    return f"{rng.choice(WORDS)}{rng.choice(WORDS)}"
+
+
+def render_property(rng: random.Random, owner: str, lines: list[str]) -> str:
+    name = member_name(rng)
+    value_type = rng.choice(VALUE_TYPES)
+    lines.append("        /// <summary>")
+    lines.append(f"        /// Defines the <see cref=\"{name}\"/> property.")
+    lines.append("        /// </summary>")
+    if rng.random() < 0.7:
+        lines.append(f"        public static readonly StyledProperty<{value_type}> {name}Property =")
+        lines.append(f"            AvaloniaProperty.Register<{owner}, {value_type}>(")
+        lines.append(f"                nameof({name}),")
+        lines.append("                defaultBindingMode: BindingMode.OneWay);")
+        lines.append("")
+        lines.append(f"        public {value_type} {name}")
+        lines.append("        {")
+        lines.append(f"            get => GetValue({name}Property);")
+        lines.append(f"            set => SetValue({name}Property, value);")
+        lines.append("        }")
+    else:
+        lines.append(f"        public static readonly DirectProperty<{owner}, {value_type}> {name}Property =")
+        lines.append(f"            AvaloniaProperty.RegisterDirect<{owner}, {value_type}>(nameof({name}), o => o.{name});")
+        lines.append("")
+        lines.append(f"        public {value_type} {name} {{ get; private set; }}")
+    lines.append("")
+    return name
+
+
+def render_method(rng: random.Random, lines: list[str]) -> str:
+    name = member_name(rng)
+    roll = rng.random()
+    lines.append("        /// <summary>Performs the operation; see <c>{ braces }</c> in docs.</summary>")
+    if roll < 0.3:
+        lines.append(f"        public TResult {name}<TSource, TResult>(")
+        lines.append("            IEnumerable<TSource> source,")
+        lines.append("            Func<TSource, int, TResult> selector,")
+        lines.append("            CancellationToken cancellationToken = default)")
+        lines.append("            where TSource : class")
+        lines.append("            where TResult : notnull")
+        lines.append("        {")
+        lines.append('            var text = "{ not a brace }";')
+        lines.append("            return selector(source.First(), text.Length); // }")
+        lines.append("        }")
+    elif roll < 0.6:
+        lines.append(f"        public virtual void {name}(RoutedEventArgs e) {{ }}")
+    elif roll < 0.8:
+        lines.append(f"        protected override Size {name}Override(Size availableSize)")
+        lines.append("        {")
+        lines.append("            /* { block comment } */")
+        lines.append("            return availableSize;")
+        lines.append("        }")
+    else:
+        lines.append(f"        public static bool Try{name}(string? value, out int result) => int.TryParse(value, out result);")
+        name = f"Try{name}"
+    lines.append("")
+    return name
+
+
+def render_type(rng: random.Random, name: str, base: str, indent: str, members: list[str]) -> list[str]:
+    lines: list[str] = []
+    lines.append(f"{indent}/// <summary>Synthetic <see cref=\"{base}\"/> for benchmarks.</summary>")
+    if rng.random() < 0.3:
+        lines.append(f"{indent}[TemplatePart(\"PART_{name}\", typeof(ContentPresenter))]")
+    modifiers = "public abstract partial class" if rng.random() < 0.1 else "public class"
+    interfaces = ", IDisposable" if rng.random() < 0.3 else ""
+    lines.append(f"{indent}{modifiers} {name} : {base}{interfaces}")
+    lines.append(f"{indent}{{")
+
+    body: list[str] = []
+    for _ in range(rng.randint(2, 6)):
+        members.append(render_property(rng, name, body))
+    body.append(f"        public static readonly RoutedEvent<RoutedEventArgs> {name}ChangedEvent =")
+    body.append(f"            RoutedEvent.Register<{name}, RoutedEventArgs>(nameof({name}Changed), RoutingStrategies.Bubble);")
+    body.append("")
+    body.append(f"        public event EventHandler<RoutedEventArgs>? {name}Changed;")
+    body.append("")
+    for _ in range(rng.randint(2, 6)):
+        members.append(render_method(rng, body))
+    if rng.random() < 0.2:
+        body.append("        public object? this[int index] => null;")
+        body.append("")
+    if rng.random() < 0.2:
+        body.append(f"        public static bool operator ==({name}? left, {name}? right) => ReferenceEquals(left, right);")
+        body.append(f"        public static bool operator !=({name}? left, {name}? right) => !(left == right);")
+        body.append("")
+    if rng.random() < 0.3:
+        body.append("#if NET6_0_OR_GREATER")
+        body.append(f"        public void {member_name(rng)}Modern() {{ }}")
+        body.append("#endif")
+        body.append("")
+    body.append("        private int _counter;")
+    body.append("        internal void Reset() => _counter = 0;")
+    if rng.random() < 0.4:
+        body.append("")
+        body.append(f"        public enum {name}Mode")
+        body.append("        {")
+        body.append("            None,")
+        body.append("            Auto,")
+        body.append("        }")
+        body.append("")
+        body.append(f"        public sealed class {name}Options")
+        body.append("        {")
+        body.append(f"            public {name}Mode Mode {{ get; init; }}")
+        body.append("        }")
+    if interfaces:
+        body.append("")
+        body.append("        public void Dispose() { }")
+
+    for line in body:
+        # Body lines are written for a block namespace; directives and blank lines stay unindented.
+        if not line or line.startswith("#"):
+            lines.append(line)
+        else:
+            lines.append(line if indent else line[4:])
+    lines.append(f"{indent}}}")
+    return lines
+
+
+def render_interface(rng: random.Random, name: str, indent: str) -> list[str]:
+    return [
+        f"{indent}public interface I{name}",
+        f"{indent}{{",
+        f"{indent}    event EventHandler? {name}Invalidated;",
+        f"{indent}    bool Is{member_name(rng)} {{ get; }}",
+        f"{indent}    T Resolve<T>(string key)",
+        f"{indent}        where T : class;",
+        f"{indent}}}",
+    ]
+
+
+def render_file(
+    rng: random.Random,
+    index: int,
+    assembly: str,
+    folder: str,
+    known_types: list[str],
+) -> tuple[str, list[str], str]:
+    name = type_name(rng, index)
+    members: list[str] = []
+    namespace = ".".join(part for part in (assembly.split("/")[-1], folder.replace("/", ".")) if part)
+    is_control = assembly.split("/")[-1].startswith("Avalonia.Controls")
+    if is_control and known_types and rng.random() < 0.6:
+        base = rng.choice(known_types)
+    else:
+        base = rng.choice(BASE_CONTROLS) if is_control else "AvaloniaObject"
+
+    lines = [
+        "// Licensed under the MIT license. { header braces }",
+        "using System;",
+        "using System.Collections.Generic;",
+        "using Avalonia.Controls.Primitives;",
+        "",
+    ]
+    if rng.random() < 0.5:
+        lines.append(f"namespace {namespace};")
+        lines.append("")
+        lines.extend(render_type(rng, name, base, "", members))
+        if rng.random() < 0.3:
+            lines.append("")
+            lines.extend(render_interface(rng, name, ""))
+    else:
+        lines.append(f"namespace {namespace}")
+        lines.append("{")
+        lines.extend(render_type(rng, name, base, "    ", members))
+        if rng.random() < 0.3:
+            lines.append("")
+            lines.extend(render_interface(rng, name, "    "))
+        lines.append("}")
+    lines.append("")
+    if is_control:
+        known_types.append(name)
+    return name, members, "\n".join(lines)
+
+
+def render_doc(rng: random.Random, index: int, types: list[tuple[str, list[str]]]) -> str:
+    """A markdown page that mentions a sample of types and members in the ways the coverage pass matches."""
+    sample = rng.sample(types, min(len(types), 40))
+    lines = [f"# Synthetic Reference {index}", ""]
+    for name, members in sample:
+        # About a third of the mentions name members that do not exist, like stale docs.
+        member = rng.choice(members) if members and rng.random() < 0.7 else member_name(rng)
+        roll = rng.random()
+        if roll < 0.3:
+            lines.append(f"Use `{name}` to host content; set `{name}.{member}` as needed.")
+        elif roll < 0.6:
+            lines.append(f"Call {name}.{member}() after layout, or compare with operator == when needed.")
+        else:
+            lines.append(f"The {name} control mirrors this[0] indexers and {member}(value) calls.")
+        lines.append("")
+    lines.append("```csharp")
+    lines.append(f"var control = new {sample[0][0] if sample else 'Button'}();")
+    lines.append("```")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def generate_corpus(root: pathlib.Path, files: int, seed: int, docs: int | None = None) -> SyntheticCorpus:
+    """Write `files` C# sources under `root/src` and reference docs under `root/references`."""
+    rng = random.Random(seed)
+    corpus = SyntheticCorpus(root=root)
+    known_types: list[str] = []
+    types: list[tuple[str, list[str]]] = []
+
+    for index in range(files):
+        assembly = rng.choice(ASSEMBLIES)
+        folder = rng.choice(FOLDERS)
+        name, members, text = render_file(rng, index, assembly, folder, known_types)
+        rel = "/".join(part for part in ("src", assembly, folder, f"{name}.cs") if part)
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        path.write_bytes(data)
+        corpus.files.append(rel)
+        corpus.source_bytes += len(data)
+        types.append((name, members))
+
+    doc_count = docs if docs is not None else max(1, files // 10)
+    for index in range(doc_count):
+        rel = f"references/{index:04d}-synthetic.md"
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = render_doc(rng, index, types).encode("utf-8")
+        path.write_bytes(data)
+        corpus.docs.append(rel)
+        corpus.doc_bytes += len(data)
+
+    corpus.files.sort()
+    return corpus
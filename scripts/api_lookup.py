@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""Look up symbols in the generated API index files through a prebuilt on-disk index.
+
+For every index markdown (for example `references/api-index-generated.md`) a binary
+`.lookup` file is kept next to it (ignored by git). It holds the parsed entries as
+JSON records, the sorted lowercase lookup keys of every entry (`Symbol`,
+`Container.Symbol` and, when known, the namespace-qualified forms), and an
+open-addressing hash table over those keys. The file is memory-mapped, so opening
+it costs the same for any index size, and only the records a query returns are
+decoded. Exact queries are one hash probe; prefix queries binary-search the sorted
+keys.
+
+The `.lookup` file records the size, mtime and SHA-256 of its markdown and is
+rebuilt when the markdown content changes.
+
+    python3 scripts/api_lookup.py ClientSizeProperty DispatcherPriority
+    python3 scripts/api_lookup.py TopLevel.Client --prefix
+    python3 scripts/api_lookup.py Window.Title --index references/api-index-12.0.0-rc1-generated.md
+"""
+
+from __future__ import annotations
+
+import argparse
+from array import array
+from collections.abc import Iterable
+from dataclasses import asdict, astuple
+import json
+import mmap
+import pathlib
+import sys
+import time
+import zlib
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.find_uncovered_apis import ApiEntry, load_api_index
+from scripts.output_files import file_sha256, write_bytes_atomic
+
+LOOKUP_FORMAT = "avalonia-api-lookup"
+LOOKUP_VERSION = 1
+LOOKUP_SECTIONS = ("records", "record_offsets", "key_blob", "key_table", "ids", "slots")
+# key_table holds four uint32 per key: key offset, key length, first id index, id count.
+KEY_TABLE_STRIDE = 4
+SECTION_ALIGNMENT = 8
+DEFAULT_LIMIT = 20
+DEFAULT_INDEXES = [pathlib.Path("references/api-index-generated.md")]
+
+
+def lookup_path_for(index_path: pathlib.Path) -> pathlib.Path:
+    return index_path.with_suffix(".lookup")
+
+
+def lookup_keys(entry: ApiEntry) -> set[str]:
+    """Lowercase keys an entry is found under: its symbol, `Container.Symbol`, and namespace-qualified forms."""
+    qualified = f"{entry.container}.{entry.symbol}" if entry.container else entry.symbol
+    keys = {entry.symbol.lower(), qualified.lower()}
+    if entry.namespace:
+        keys.add(f"{entry.namespace}.{qualified}".lower())
+    return keys
+
+
+def build_lookup_bytes(entries: list[ApiEntry], header: dict[str, object]) -> bytes:
+    """Serialize `entries` with their key table and hash table; `header` is extended with the layout."""
+    records = bytearray()
+    record_offsets = array("I", [0])
+    for entry in entries:
+        records += json.dumps(astuple(entry), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        record_offsets.append(len(records))
+
+    ids_by_key: dict[bytes, list[int]] = {}
+    for entry_id, entry in enumerate(entries):
+        for key in lookup_keys(entry):
+            ids_by_key.setdefault(key.encode("utf-8"), []).append(entry_id)
+
+    keys = sorted(ids_by_key)
+    key_blob = bytearray()
+    key_table = array("I")
+    ids = array("I")
+    for key in keys:
+        # Types first, so `DispatcherPriority` lists the struct before its operators.
+        key_ids = sorted(ids_by_key[key], key=lambda entry_id: (entries[entry_id].kind != "type", entry_id))
+        key_table.extend((len(key_blob), len(key), len(ids), len(key_ids)))
+        key_blob += key
+        ids.extend(key_ids)
+
+    slot_count = 8
+    while slot_count < 2 * len(keys):
+        slot_count *= 2
+    slots = array("I", [0]) * slot_count
+    for key_index, key in enumerate(keys):
+        slot = zlib.crc32(key) & (slot_count - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = key_index + 1
+
+    payloads = {
+        "records": bytes(records),
+        "record_offsets": record_offsets.tobytes(),
+        "key_blob": bytes(key_blob),
+        "key_table": key_table.tobytes(),
+        "ids": ids.tobytes(),
+        "slots": slots.tobytes(),
+    }
+    body = bytearray()
+    layout: dict[str, list[int]] = {}
+    for name in LOOKUP_SECTIONS:
+        body += b"\0" * (-len(body) % SECTION_ALIGNMENT)
+        layout[name] = [len(body), len(payloads[name])]
+        body += payloads[name]
+
+    header = {
+        **header,
+        "format": LOOKUP_FORMAT,
+        "version": LOOKUP_VERSION,
+        "byteorder": sys.byteorder,
+        "entries": len(entries),
+        "keys": len(keys),
+        "sections": layout,
+    }
+    return json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n" + bytes(body)
+
+
+class ApiLookup:
+    """Read-only view of a `.lookup` file."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self._handle = path.open("rb")
+        try:
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._handle.close()
+            raise ValueError(f"{path} is empty") from None
+        self._views: list[memoryview] = []
+        try:
+            end = self._map.find(b"\n")
+            self.header = json.loads(self._map[:end]) if end > 0 else {}
+            if (
+                not isinstance(self.header, dict)
+                or self.header.get("format") != LOOKUP_FORMAT
+                or self.header.get("version") != LOOKUP_VERSION
+                or self.header.get("byteorder") != sys.byteorder
+            ):
+                raise ValueError(f"{path} is not a {LOOKUP_FORMAT} v{LOOKUP_VERSION} file")
+            base = end + 1
+            whole = memoryview(self._map)
+            self._views.append(whole)
+            sections = {}
+            for name in LOOKUP_SECTIONS:
+                offset, length = self.header["sections"][name]
+                sections[name] = whole[base + offset : base + offset + length]
+                self._views.append(sections[name])
+            self._records = sections["records"]
+            self._key_blob = sections["key_blob"]
+            self._record_offsets = self._cast(sections["record_offsets"])
+            self._key_table = self._cast(sections["key_table"])
+            self._ids = self._cast(sections["ids"])
+            self._slots = self._cast(sections["slots"])
+            self._key_count = len(self._key_table) // KEY_TABLE_STRIDE
+        except BaseException:
+            self.close()
+            raise
+
+    def _cast(self, view: memoryview) -> memoryview:
+        cast = view.cast("I")
+        self._views.append(cast)
+        return cast
+
+    def _key(self, key_index: int) -> bytes:
+        offset = self._key_table[key_index * KEY_TABLE_STRIDE]
+        length = self._key_table[key_index * KEY_TABLE_STRIDE + 1]
+        return bytes(self._key_blob[offset : offset + length])
+
+    def _key_ids(self, key_index: int) -> list[int]:
+        start = self._key_table[key_index * KEY_TABLE_STRIDE + 2]
+        count = self._key_table[key_index * KEY_TABLE_STRIDE + 3]
+        return list(self._ids[start : start + count])
+
+    def entry(self, entry_id: int) -> ApiEntry:
+        start = self._record_offsets[entry_id]
+        end = self._record_offsets[entry_id + 1]
+        return ApiEntry(*json.loads(bytes(self._records[start:end])))
+
+    def find_key(self, key: str) -> int | None:
+        """Index of `key` (already lowercase) in the sorted key table, via the hash table."""
+        encoded = key.encode("utf-8")
+        mask = len(self._slots) - 1
+        slot = zlib.crc32(encoded) & mask
+        while True:
+            value = self._slots[slot]
+            if value == 0:
+                return None
+            if self._key(value - 1) == encoded:
+                return value - 1
+            slot = (slot + 1) & mask
+
+    def exact(self, query: str) -> list[ApiEntry]:
+        """Entries whose symbol, `Container.Symbol` or qualified name equals `query`, case-insensitively.
+
+        Entries whose symbol matches the query's case come first.
+        """
+        key_index = self.find_key(query.lower())
+        if key_index is None:
+            return []
+        entries = [self.entry(entry_id) for entry_id in self._key_ids(key_index)]
+        symbol = query.rsplit(".", 1)[-1]
+        return sorted(entries, key=lambda entry: entry.symbol != symbol)
+
+    def prefix(self, query: str, limit: int = DEFAULT_LIMIT) -> list[ApiEntry]:
+        """Up to `limit` entries with a lookup key that starts with `query`, in key order."""
+        wanted = query.lower().encode("utf-8")
+        low, high = 0, self._key_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < wanted:
+                low = middle + 1
+            else:
+                high = middle
+
+        seen: set[int] = set()
+        entry_ids: list[int] = []
+        for key_index in range(low, self._key_count):
+            if len(entry_ids) >= limit or not self._key(key_index).startswith(wanted):
+                break
+            for entry_id in self._key_ids(key_index):
+                if entry_id not in seen and len(entry_ids) < limit:
+                    seen.add(entry_id)
+                    entry_ids.append(entry_id)
+        return [self.entry(entry_id) for entry_id in entry_ids]
+
+    def find(self, query: str, limit: int = DEFAULT_LIMIT, prefix: bool = False) -> tuple[str, list[ApiEntry]]:
+        """Exact matches, or prefix matches when there are none (or `prefix` is set)."""
+        if not prefix:
+            entries = self.exact(query)
+            if entries:
+                return "exact", entries[:limit]
+        return "prefix", self.prefix(query, limit)
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        if not self._map.closed:
+            self._map.close()
+        self._handle.close()
+
+    def __enter__(self) -> ApiLookup:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def read_lookup_header(path: pathlib.Path) -> dict[str, object] | None:
+    try:
+        with path.open("rb") as handle:
+            header = json.loads(handle.readline())
+    except (OSError, ValueError):
+        return None
+    return header if isinstance(header, dict) else None
+
+
+def lookup_is_current(lookup_path: pathlib.Path, index_path: pathlib.Path) -> bool:
+    """Whether the `.lookup` file was built from the current index content (by size and mtime, else by hash)."""
+    header = read_lookup_header(lookup_path)
+    if header is None or header.get("format") != LOOKUP_FORMAT or header.get("version") != LOOKUP_VERSION:
+        return False
+    stat = index_path.stat()
+    if header.get("markdown_size") == stat.st_size and header.get("markdown_mtime_ns") == stat.st_mtime_ns:
+        return True
+    return header.get("markdown_sha256") == file_sha256(index_path)
+
+
+def write_lookup(index_path: pathlib.Path, lookup_path: pathlib.Path) -> int:
+    """Parse the index markdown (or its fresh JSONL sidecar) and write its `.lookup` file; return the entry count."""
+    stat = index_path.stat()
+    entries = load_api_index(index_path)
+    header = {
+        "markdown_sha256": file_sha256(index_path),
+        "markdown_size": stat.st_size,
+        "markdown_mtime_ns": stat.st_mtime_ns,
+    }
+    write_bytes_atomic(lookup_path, build_lookup_bytes(entries, header))
+    return len(entries)
+
+
+def open_lookup(index_path: pathlib.Path, rebuild: bool = False) -> tuple[ApiLookup, bool]:
+    """Open the `.lookup` file of an index markdown, building it first when missing or stale."""
+    lookup_path = lookup_path_for(index_path)
+    built = rebuild or not lookup_is_current(lookup_path, index_path)
+    if built:
+        write_lookup(index_path, lookup_path)
+    try:
+        return ApiLookup(lookup_path), built
+    except ValueError:
+        if built:
+            raise
+        write_lookup(index_path, lookup_path)
+        return ApiLookup(lookup_path), True
+
+
+def format_entry(entry: ApiEntry) -> list[str]:
+    name = f"{entry.container}.{entry.symbol}" if entry.container else entry.symbol
+    return [
+        f"{name} ({entry.kind})",
+        f"  signature: {entry.signature}",
+        f"  source:    {entry.source_file}",
+        f"  namespace: {entry.namespace or '-'}",
+        f"  container: {entry.container or '-'}",
+    ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Look up symbols, prefixes and Container.Member names in the generated API index files."
+    )
+    parser.add_argument("query", nargs="+", help="Symbol, Container.Member, namespace-qualified name, or prefix.")
+    parser.add_argument(
+        "--index",
+        type=pathlib.Path,
+        action="append",
+        default=None,
+        help="Generated API index markdown to search. Can be used multiple times (default: references/api-index-generated.md).",
+    )
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help=f"Maximum results per query (default: {DEFAULT_LIMIT}).")
+    parser.add_argument("--prefix", action="store_true", help="Treat every query as a prefix.")
+    parser.add_argument("--json", action="store_true", help="Print one JSON object per result.")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the .lookup files even when they are current.")
+    return parser.parse_args()
+
+
+def print_results(index_path: pathlib.Path, query: str, mode: str, entries: Iterable[ApiEntry], as_json: bool) -> None:
+    for entry in entries:
+        if as_json:
+            print(json.dumps({"index": index_path.as_posix(), "query": query, "match": mode, **asdict(entry)}))
+        else:
+            print("\n".join(format_entry(entry)))
+
+
+def main() -> int:
+    args = parse_args()
+    index_paths: list[pathlib.Path] = args.index or DEFAULT_INDEXES
+    if args.limit < 1:
+        print("error: --limit must be a positive integer", file=sys.stderr)
+        return 2
+    missing = [path for path in index_paths if not path.is_file()]
+    if missing:
+        print(f"error: index markdown not found: {missing[0]}", file=sys.stderr)
+        return 2
+
+    found = 0
+    for index_path in index_paths:
+        start = time.perf_counter()
+        lookup, built = open_lookup(index_path, args.rebuild)
+        loaded = time.perf_counter()
+        with lookup:
+            for query in args.query:
+                query_start = time.perf_counter()
+                mode, entries = lookup.find(query, args.limit, args.prefix)
+                elapsed = time.perf_counter() - query_start
+                found += len(entries)
+                if not args.json:
+                    print(f"== {query} in {index_path.as_posix()}: {len(entries)} {mode} match(es) ({elapsed * 1000:.2f} ms)")
+                print_results(index_path, query, mode, entries, args.json)
+        action = "Built" if built else "Loaded"
+        print(
+            f"{action} {lookup_path_for(index_path).as_posix()} ({lookup.header['entries']} entries, "
+            f"{lookup.header['keys']} keys) in {(loaded - start) * 1000:.2f} ms",
+            file=sys.stderr,
+        )
+    return 0 if found else 3
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
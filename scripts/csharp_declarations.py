@@ -0,0 +1,508 @@
+"""Shared C# declaration engine for the Avalonia generators.
+
+`parse_source` walks a file once (on top of `csharp_lexer.iter_code_lines`) and emits
+one `Declaration` record per public type, delegate and member, with its namespace,
+enclosing public types, kind, symbol, modifiers, base list and signature.
+
+The generators are thin renderers over these records:
+- `generate_api_index.py` prints declaration heads/signatures per file,
+- `generate_api_migration_report.py` diffs records between two refs,
+- `generate_control_reference_docs.py` groups members under control types.
+
+`scan_sources` parses many files (optionally in a process pool) and shares one
+parse-cache entry per file content between all three generators. `scan_trees` does
+the same for several trees at once, reading them in parallel threads and parsing
+content shared between them only once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+import pathlib
+import re
+import sys
+import time
+from typing import TypeVar
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.csharp_lexer import iter_code_lines
+from scripts.find_uncovered_apis import find_outer_parameter_paren, normalize_symbol, parse_signature
+from scripts.parse_cache import ParseCache, content_digest
+from scripts.profiling import current_profiler
+from scripts.tree_readers import TreeReader
+
+# Bump when Declaration output changes (including find_uncovered_apis.parse_signature)
+# so cached parse results are ignored.
+PARSER_VERSION = "3"
+CACHE_EXTRACTOR = "csharp_declarations.parse_source"
+# Each worker receives several chunks so a few very large files do not leave the pool idle.
+CHUNKS_PER_JOB = 4
+T = TypeVar("T")
+
+NAMESPACE_RE = re.compile(r"^\s*namespace\s+([A-Za-z_][A-Za-z0-9_.]*)\s*(?:[;{]|$)")
+PUBLIC_RE = re.compile(r"^\s*public\s+")
+ACCESS_MODIFIER_RE = re.compile(r"^\s*(public|internal|private|protected)\b")
+TYPE_START_RE = re.compile(
+    r"^\s*(public|internal|private|protected)\s+"
+    r"(?:new\s+|unsafe\s+|abstract\s+|sealed\s+|static\s+|partial\s+|readonly\s+|ref\s+)*"
+    r"(class|interface|struct|enum|record(?:\s+class|\s+struct)?)\b"
+)
+DELEGATE_START_RE = re.compile(
+    r"^\s*(public|internal|private|protected)\s+"
+    r"(?:new\s+|unsafe\s+|static\s+|partial\s+|readonly\s+|ref\s+)*delegate\b"
+)
+TYPE_NAME_RE = re.compile(
+    r"\b(?:class|interface|struct|enum|record(?:\s+class|\s+struct)?)\s+([A-Za-z_@][A-Za-z0-9_`]*)"
+)
+DECLARATION_START_RE = re.compile(
+    r"^\s*(?:"
+    r"event\b|"
+    r"static\b|"
+    r"abstract\b|"
+    r"sealed\b|"
+    r"partial\b|"
+    r"delegate\b|"
+    r"new\b|"
+    r"unsafe\b|"
+    r"readonly\b|"
+    r"ref\b|"
+    r"[A-Za-z_@]"
+    r")"
+)
+MODIFIERS = frozenset(
+    {
+        "public",
+        "internal",
+        "private",
+        "protected",
+        "new",
+        "unsafe",
+        "abstract",
+        "sealed",
+        "static",
+        "partial",
+        "readonly",
+        "ref",
+        "virtual",
+        "override",
+        "extern",
+        "async",
+        "const",
+        "volatile",
+        "required",
+    }
+)
+
+
+@dataclass(frozen=True)
+class Declaration:
+    line: int
+    namespace: str | None
+    containers: tuple[str, ...]
+    kind: str
+    type_kind: str | None
+    symbol: str
+    modifiers: tuple[str, ...]
+    bases: tuple[str, ...]
+    head: str
+    signature: str
+
+    @property
+    def container(self) -> str | None:
+        return ".".join(self.containers) if self.containers else None
+
+
+@dataclass(frozen=True)
+class ParsedSource:
+    namespace: str | None
+    declarations: tuple[Declaration, ...]
+
+    def to_payload(self) -> list[object]:
+        return [
+            self.namespace,
+            [
+                [
+                    item.line,
+                    item.namespace,
+                    list(item.containers),
+                    item.kind,
+                    item.type_kind,
+                    item.symbol,
+                    list(item.modifiers),
+                    list(item.bases),
+                    item.head,
+                    item.signature,
+                ]
+                for item in self.declarations
+            ],
+        ]
+
+    @classmethod
+    def from_payload(cls, payload: list[object]) -> ParsedSource:
+        namespace, rows = payload
+        return cls(
+            namespace=namespace,
+            declarations=tuple(
+                Declaration(
+                    line=line,
+                    namespace=item_namespace,
+                    containers=tuple(containers),
+                    kind=kind,
+                    type_kind=type_kind,
+                    symbol=symbol,
+                    modifiers=tuple(modifiers),
+                    bases=tuple(bases),
+                    head=head,
+                    signature=signature,
+                )
+                for line, item_namespace, containers, kind, type_kind, symbol, modifiers, bases, head, signature in rows
+            ),
+        )
+
+
+EMPTY_SOURCE = ParsedSource(namespace=None, declarations=())
+
+
+@dataclass(frozen=True)
+class TypeScope:
+    name: str
+    is_public: bool
+    is_interface: bool
+    brace_depth: int
+
+
+@dataclass
+class PendingDeclaration:
+    line: int
+    parts: list[str]
+    namespace: str | None
+    containers: tuple[str, ...]
+    access: str | None = None
+    type_kind: str | None = None
+
+
+def normalize_signature(raw: str) -> str:
+    sig = " ".join(raw.replace("\t", " ").split())
+    return sig.strip()
+
+
+def declaration_terminated(sig: str) -> bool:
+    return ";" in sig or "=>" in sig or "{" in sig
+
+
+def decode_source(data: bytes) -> str | None:
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def leading_modifiers(signature: str) -> tuple[str, ...]:
+    modifiers: list[str] = []
+    for word in signature.split():
+        if word not in MODIFIERS:
+            break
+        modifiers.append(word)
+    return tuple(modifiers)
+
+
+def split_top_level(text: str, separator: str) -> list[str]:
+    parts: list[str] = []
+    depth = 0
+    start = 0
+    for i, ch in enumerate(text):
+        if ch in "<([":
+            depth += 1
+        elif ch in ">)]":
+            depth = max(0, depth - 1)
+        elif ch == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def base_list(signature: str, name_end: int) -> tuple[str, ...]:
+    """Return the declared base types of a type declaration, as written in source."""
+    decl = re.split(r"{|;", signature, maxsplit=1)[0]
+    tail = decl[name_end:]
+
+    depth = 0
+    colon = -1
+    for i, ch in enumerate(tail):
+        if ch in "<(":
+            depth += 1
+        elif ch in ">)":
+            depth = max(0, depth - 1)
+        elif ch == ":" and depth == 0:
+            colon = i
+            break
+    if colon == -1:
+        return ()
+
+    bases_text = re.split(r"\bwhere\b", tail[colon + 1 :], maxsplit=1)[0]
+    bases: list[str] = []
+    for part in split_top_level(bases_text, ","):
+        # Record primary-constructor base calls, e.g. `Base(x)`, as the base type only.
+        paren = find_outer_parameter_paren(part)
+        base = (part[:paren] if paren != -1 else part).strip()
+        if base:
+            bases.append(base)
+    return tuple(bases)
+
+
+def type_declaration(pending: PendingDeclaration, signature: str) -> Declaration:
+    name_match = TYPE_NAME_RE.search(signature)
+    if pending.type_kind == "delegate" or name_match is None:
+        kind, symbol = parse_signature(signature)
+        return Declaration(
+            line=pending.line,
+            namespace=pending.namespace,
+            containers=pending.containers,
+            kind="delegate" if pending.type_kind == "delegate" else kind,
+            type_kind=pending.type_kind,
+            symbol=symbol,
+            modifiers=leading_modifiers(signature),
+            bases=(),
+            head=normalize_signature(pending.parts[0]),
+            signature=signature,
+        )
+
+    return Declaration(
+        line=pending.line,
+        namespace=pending.namespace,
+        containers=pending.containers,
+        kind="type",
+        type_kind=pending.type_kind,
+        symbol=normalize_symbol(name_match.group(1).lstrip("@")),
+        modifiers=leading_modifiers(signature),
+        bases=base_list(signature, name_match.end()),
+        head=normalize_signature(pending.parts[0]),
+        signature=signature,
+    )
+
+
+def member_declaration(pending: PendingDeclaration, signature: str) -> Declaration:
+    kind, symbol = parse_signature(signature)
+    return Declaration(
+        line=pending.line,
+        namespace=pending.namespace,
+        containers=pending.containers,
+        kind=kind,
+        type_kind=None,
+        symbol=symbol,
+        modifiers=leading_modifiers(signature),
+        bases=(),
+        head=normalize_signature(pending.parts[0]),
+        signature=signature,
+    )
+
+
+def is_implicit_interface_member_start(line: str, stripped: str, scope: TypeScope | None) -> bool:
+    if scope is None or not (scope.is_public and scope.is_interface):
+        return False
+    if stripped.startswith(("[", "}", "#")) or stripped.startswith("public:"):
+        return False
+    return ACCESS_MODIFIER_RE.match(line) is None and DECLARATION_START_RE.match(line) is not None
+
+
+def parse_source(text: str | None) -> ParsedSource:
+    """Parse one C# file into public declaration records.
+
+    `ParsedSource.namespace` is the last namespace declared in the file; each record
+    also carries the namespace in effect where it was declared.
+    """
+    if text is None:
+        return EMPTY_SOURCE
+
+    namespace: str | None = None
+    type_stack: list[TypeScope] = []
+    pending_type: PendingDeclaration | None = None
+    pending_member: PendingDeclaration | None = None
+    declarations: list[Declaration] = []
+
+    for number, line, clean, depth, end_depth in iter_code_lines(text):
+        ns_match = NAMESPACE_RE.match(line)
+        if ns_match:
+            namespace = ns_match.group(1)
+
+        stripped = line.lstrip()
+
+        if pending_type is None and pending_member is None:
+            start = TYPE_START_RE.match(line) or DELEGATE_START_RE.match(line)
+            if start:
+                type_kind = start.group(2) if start.re is TYPE_START_RE else "delegate"
+                pending_type = PendingDeclaration(
+                    line=number,
+                    parts=[],
+                    namespace=namespace,
+                    containers=tuple(scope.name for scope in type_stack if scope.is_public),
+                    access=start.group(1),
+                    type_kind=" ".join(type_kind.split()),
+                )
+
+        if pending_type is not None:
+            pending_type.parts.append(line)
+            if "{" in clean or ";" in clean:
+                signature = normalize_signature(" ".join(pending_type.parts))
+                parent_public = type_stack[-1].is_public if type_stack else True
+                is_public = pending_type.access == "public" and parent_public
+                declaration = type_declaration(pending_type, signature)
+
+                if is_public:
+                    declarations.append(declaration)
+                if declaration.kind == "type" and "{" in clean:
+                    type_stack.append(
+                        TypeScope(
+                            name=declaration.symbol,
+                            is_public=is_public,
+                            is_interface=pending_type.type_kind == "interface",
+                            brace_depth=depth + 1,
+                        )
+                    )
+                pending_type = None
+        else:
+            current_scope = type_stack[-1] if type_stack else None
+
+            if pending_member is None:
+                if (
+                    current_scope is not None
+                    and current_scope.is_public
+                    and depth == current_scope.brace_depth
+                    and (PUBLIC_RE.match(line) or is_implicit_interface_member_start(line, stripped, current_scope))
+                    and not stripped.startswith("public:")
+                ):
+                    pending_member = PendingDeclaration(
+                        line=number,
+                        parts=[line],
+                        namespace=namespace,
+                        containers=tuple(scope.name for scope in type_stack if scope.is_public),
+                    )
+            else:
+                pending_member.parts.append(line)
+
+            if pending_member is not None:
+                signature = normalize_signature(" ".join(pending_member.parts))
+                if declaration_terminated(signature):
+                    declarations.append(member_declaration(pending_member, signature))
+                    pending_member = None
+
+        while type_stack and end_depth < type_stack[-1].brace_depth:
+            type_stack.pop()
+
+    if pending_member is not None:
+        signature = normalize_signature(" ".join(pending_member.parts))
+        declarations.append(member_declaration(pending_member, signature))
+
+    return ParsedSource(namespace=namespace, declarations=tuple(declarations))
+
+
+def timed_parse_source(text: str | None) -> tuple[ParsedSource, float]:
+    start = time.perf_counter()
+    parsed = parse_source(text)
+    return parsed, time.perf_counter() - start
+
+
+def parse_in_pool(
+    texts: list[str | None],
+    jobs: int,
+    parse: Callable[[str | None], T] = parse_source,
+) -> list[T]:
+    """Run `parse` (a picklable module-level function) over `texts`, returning results in input order."""
+    if jobs <= 1 or len(texts) < 2:
+        return [parse(text) for text in texts]
+
+    chunk_size = max(1, len(texts) // (jobs * CHUNKS_PER_JOB))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(parse, texts, chunksize=chunk_size))
+
+
+def scan_sources(
+    tree: TreeReader,
+    files: list[str],
+    jobs: int = 1,
+    cache: ParseCache | None = None,
+) -> list[ParsedSource]:
+    """Parse `files` from `tree` in order, reusing cached results for byte-identical content."""
+    return scan_trees([(tree, files)], jobs, cache)[0]
+
+
+def read_files(tree: TreeReader, files: list[str]) -> list[bytes]:
+    return [tree.read_bytes(rel) for rel in files]
+
+
+def scan_trees(
+    requests: list[tuple[TreeReader, list[str]]],
+    jobs: int = 1,
+    cache: ParseCache | None = None,
+) -> list[list[ParsedSource]]:
+    """Like `scan_sources` for several `(tree, files)` pairs, in one parse pass.
+
+    Each tree is read in its own thread, so the trees must not be in use elsewhere
+    meanwhile. Content that is byte-identical within or across the trees is parsed
+    once, and all misses share one pool of `jobs` worker processes.
+    """
+    if len(requests) == 1:
+        contents = [read_files(*requests[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+            contents = list(executor.map(lambda request: read_files(*request), requests))
+
+    results: list[list[ParsedSource | None]] = [[None] * len(files) for _, files in requests]
+    missing: list[tuple[list[tuple[int, int]], str]] = []
+    missing_by_digest: dict[str, list[tuple[int, int]]] = {}
+    texts: list[str | None] = []
+
+    for request_index, datas in enumerate(contents):
+        for index, data in enumerate(datas):
+            digest = content_digest(data)
+            duplicates = missing_by_digest.get(digest)
+            if duplicates is not None:
+                duplicates.append((request_index, index))
+                continue
+            if cache is not None:
+                cached = cache.get(CACHE_EXTRACTOR, PARSER_VERSION, digest)
+                if cached is not None:
+                    results[request_index][index] = ParsedSource.from_payload(cached)
+                    continue
+            missing_by_digest[digest] = [(request_index, index)]
+            missing.append((missing_by_digest[digest], digest))
+            texts.append(decode_source(data))
+
+    profiler = current_profiler()
+    if profiler.enabled:
+        outcomes = parse_in_pool(texts, jobs, timed_parse_source)
+        for (positions, _), (_, seconds) in zip(missing, outcomes):
+            request_index, index = positions[0]
+            profiler.record_file(requests[request_index][1][index], seconds)
+        parsed_sources = [parsed for parsed, _ in outcomes]
+    else:
+        parsed_sources = parse_in_pool(texts, jobs)
+
+    for (positions, digest), parsed in zip(missing, parsed_sources):
+        for request_index, index in positions:
+            results[request_index][index] = parsed
+        if cache is not None:
+            cache.put(CACHE_EXTRACTOR, PARSER_VERSION, digest, parsed.to_payload())
+
+    return results
+
+
+def parse_cached(data: bytes, cache: ParseCache | None) -> ParsedSource:
+    """Parse a single file's content through the shared parse cache."""
+    if cache is None:
+        return parse_source(decode_source(data))
+
+    digest = content_digest(data)
+    cached = cache.get(CACHE_EXTRACTOR, PARSER_VERSION, digest)
+    if cached is not None:
+        return ParsedSource.from_payload(cached)
+
+    parsed = parse_source(decode_source(data))
+    cache.put(CACHE_EXTRACTOR, PARSER_VERSION, digest, parsed.to_payload())
+    return parsed
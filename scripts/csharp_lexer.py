@@ -0,0 +1,110 @@
+"""Single-pass C# lexer shared by the Avalonia source generators.
+
+The generators need two views of every source line:
+- `text`: the code with comments removed, used to build declaration signatures,
+- `clean`: the same code with string and char literals collapsed to `""`/`''`,
+  used for brace counting.
+
+`iter_code_lines` produces both views for a whole file buffer with one regex scan.
+It understands line/block comments and regular, verbatim (`@"..."`), interpolated
+(`$"..."`, `$@"..."`) and raw (triple-quoted) string literals, including ones that
+span several lines, so braces inside literals never disturb brace depth. Literals
+that span lines are collapsed in both views so their content is never mistaken
+for declarations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import re
+from typing import NamedTuple
+
+TOKEN_RE = re.compile(
+    r"""
+    (?=[/"'@$])
+    (?:
+        (?P<line_comment>//[^\n]*)
+      | (?P<block_comment>/\*.*?(?:\*/|\Z))
+      | (?P<raw_string>\$*(?P<quotes>"{3,}).*?(?:(?P=quotes)|\Z))
+      | (?P<verbatim_string>(?:\$+@|@\$+|@)"(?:[^"]|"")*(?:"|\Z))
+      | (?P<interpolated_string>\$+"(?:\{\{|\{(?:[^{}"\n]|"(?:[^"\\\n]|\\.)*")*\}|[^"\\\n]|\\.)*"?)
+      | (?P<string>"(?:[^"\\\n]|\\.)*"?)
+      | (?P<char>'(?:[^'\\\n]|\\.)*'?)
+    )
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+NEUTRAL_LITERALS = {
+    "raw_string": '""',
+    "verbatim_string": '""',
+    "interpolated_string": '""',
+    "string": '""',
+    "char": "''",
+}
+
+
+class CodeLine(NamedTuple):
+    number: int
+    text: str
+    clean: str
+    depth: int
+    end_depth: int
+
+
+def split_code(source: str) -> tuple[str, str]:
+    """Return `(text, clean)` buffers for `source`, both with the original line structure."""
+    text_parts: list[str] = []
+    clean_parts: list[str] = []
+    pos = 0
+
+    for match in TOKEN_RE.finditer(source):
+        start = match.start()
+        if start > pos:
+            chunk = source[pos:start]
+            text_parts.append(chunk)
+            clean_parts.append(chunk)
+
+        token = match.group()
+        kind = match.lastgroup
+        if kind == "line_comment":
+            pass
+        elif kind == "block_comment":
+            newlines = "\n" * token.count("\n")
+            text_parts.append(newlines)
+            clean_parts.append(newlines)
+        elif "\n" in token:
+            neutral = NEUTRAL_LITERALS[kind] + "\n" * token.count("\n")
+            text_parts.append(neutral)
+            clean_parts.append(neutral)
+        else:
+            text_parts.append(token)
+            clean_parts.append(NEUTRAL_LITERALS[kind])
+        pos = match.end()
+
+    if pos < len(source):
+        chunk = source[pos:]
+        text_parts.append(chunk)
+        clean_parts.append(chunk)
+
+    return "".join(text_parts), "".join(clean_parts)
+
+
+def iter_code_lines(source: str) -> Iterator[CodeLine]:
+    """Yield non-blank, comment-free lines together with their brace depth.
+
+    `depth` is the brace depth before the line and `end_depth` the depth after it.
+    """
+    if source.startswith("\ufeff"):
+        source = source[1:]
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+
+    text, clean = split_code(source)
+    depth = 0
+    for number, (line, clean_line) in enumerate(zip(text.split("\n"), clean.split("\n")), start=1):
+        if not line or line.isspace():
+            continue
+        end_depth = depth + clean_line.count("{") - clean_line.count("}")
+        yield CodeLine(number, line, clean_line, depth, end_depth)
+        depth = end_depth
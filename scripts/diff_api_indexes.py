@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Diff two generated API index files without the Avalonia repository.
+
+Both markdown indexes are streamed through `find_uncovered_apis.parse_api_index_lines`,
+sorted by `(source file, signature)` and merge-joined in one linear pass. Signatures
+that only changed source file, but keep their namespace, container and text, count
+as unchanged, as in `generate_api_migration_report.py`. The added and removed
+signatures are rendered with the migration report's own sections:
+
+    python3 scripts/diff_api_indexes.py \
+      --from-index references/api-index-generated.md \
+      --to-index references/api-index-12.0.0-rc1-generated.md \
+      --output /tmp/api-index-diff.md
+
+Files whose signatures were cut off by `--max-per-file` in either index are left
+out of the diff, since their missing signatures would read as additions or removals.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+import datetime as dt
+import pathlib
+import re
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.find_uncovered_apis import INDEX_SOURCE_RE, ApiEntry, display_path, parse_api_index_lines
+from scripts.generate_api_index import area_for
+from scripts.generate_api_migration_report import (
+    DEFAULT_RENAME_THRESHOLD,
+    ApiItem,
+    RenameCandidate,
+    build_added_api_section,
+    build_rename_section,
+    detect_renames,
+)
+from scripts.output_files import write_lines_atomic
+
+INDEX_REPOSITORY_RE = re.compile(r"^- Repository: `([^`]+)`\s*$")
+INDEX_OMITTED_RE = re.compile(r"^- `\.\.\. \d+ more signatures omitted\b")
+
+
+@dataclass
+class ApiIndex:
+    path: pathlib.Path
+    label: str
+    items: list[ApiItem]
+    truncated: set[str] = field(default_factory=set)
+
+
+def observe_index_lines(lines: Iterable[str], index: ApiIndex) -> Iterator[str]:
+    """Pass `lines` through while recording the index's repository label and truncated files."""
+    current_source: str | None = None
+    for line in lines:
+        stripped = line.strip()
+        source_match = INDEX_SOURCE_RE.match(stripped)
+        if source_match:
+            current_source = source_match.group(1)
+        elif current_source is None:
+            repository_match = INDEX_REPOSITORY_RE.match(stripped)
+            if repository_match:
+                index.label = repository_match.group(1)
+        elif INDEX_OMITTED_RE.match(stripped):
+            index.truncated.add(current_source)
+        yield line
+
+
+def api_item(entry: ApiEntry) -> ApiItem:
+    return ApiItem(
+        area=area_for(entry.source_file),
+        source_file=entry.source_file,
+        namespace=entry.namespace,
+        container=entry.container,
+        kind=entry.kind,
+        symbol=entry.symbol,
+        signature=entry.signature,
+    )
+
+
+def merge_key(item: ApiItem) -> tuple[str, str]:
+    return (item.source_file, item.signature)
+
+
+def read_api_index(path: pathlib.Path) -> ApiIndex:
+    """Stream one index file into items sorted by `merge_key`."""
+    index = ApiIndex(path=path, label=display_path(path), items=[])
+    with path.open(encoding="utf-8") as handle:
+        entries = parse_api_index_lines(observe_index_lines(handle, index))
+    index.items = sorted((api_item(entry) for entry in entries), key=merge_key)
+    return index
+
+
+def merge_diff(old_items: list[ApiItem], new_items: list[ApiItem]) -> tuple[list[ApiItem], list[ApiItem]]:
+    """Return `(added, removed)` for two lists sorted by `merge_key`."""
+    added: list[ApiItem] = []
+    removed: list[ApiItem] = []
+    old_pos = new_pos = 0
+    while old_pos < len(old_items) and new_pos < len(new_items):
+        old_key = merge_key(old_items[old_pos])
+        new_key = merge_key(new_items[new_pos])
+        if old_key == new_key:
+            old_pos += 1
+            new_pos += 1
+        elif old_key < new_key:
+            removed.append(old_items[old_pos])
+            old_pos += 1
+        else:
+            added.append(new_items[new_pos])
+            new_pos += 1
+    removed.extend(old_items[old_pos:])
+    added.extend(new_items[new_pos:])
+
+    # A signature that only moved to another file is not an API change.
+    moved = {item.unique_key for item in added} & {item.unique_key for item in removed}
+    if moved:
+        added = [item for item in added if item.unique_key not in moved]
+        removed = [item for item in removed if item.unique_key not in moved]
+    return added, removed
+
+
+def diff_api_indexes(old: ApiIndex, new: ApiIndex) -> tuple[list[ApiItem], list[ApiItem], list[str]]:
+    """Return `(added, removed, skipped_files)`, leaving out files truncated in either index."""
+    skipped = old.truncated | new.truncated
+    if not skipped:
+        added, removed = merge_diff(old.items, new.items)
+        return added, removed, []
+    added, removed = merge_diff(
+        [item for item in old.items if item.source_file not in skipped],
+        [item for item in new.items if item.source_file not in skipped],
+    )
+    return added, removed, sorted(skipped)
+
+
+def iter_report_lines(
+    old: ApiIndex,
+    new: ApiIndex,
+    added_items: list[ApiItem],
+    removed_items: list[ApiItem],
+    renames: list[RenameCandidate],
+    skipped_files: list[str],
+) -> Iterator[str]:
+    now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
+    yield "# Avalonia API Index Diff (Generated)"
+    yield ""
+    yield f"- Generated at (UTC): `{now}`"
+    yield f"- From index: `{display_path(old.path)}` (`{old.label}`)"
+    yield f"- To index: `{display_path(new.path)}` (`{new.label}`)"
+    yield ""
+    yield "## Coverage Contract"
+    yield ""
+    yield "- Both lists come from the public signatures captured in the two generated API index files; no source tree is scanned."
+    yield "- Namespaces and containers are the ones recorded by the index, so nested types are attributed to the last type declared before them."
+    yield "- There are no `api/*.xml` suppressions here; use `scripts/generate_api_migration_report.py` for the official breaking-change list."
+    yield "- Likely renames and moves pair removed with added signatures by name and signature similarity; they are hints, not part of either list."
+    if skipped_files:
+        yield f"- Files left out because an index omitted some of their signatures (`--max-per-file`): `{len(skipped_files)}`"
+        for source_file in skipped_files:
+            yield f"  - `{source_file}`"
+    yield ""
+
+    yield from build_rename_section(renames)
+    yield from build_added_api_section("Added Public APIs", added_items)
+    yield from build_added_api_section("Removed Public Signatures (Parser View)", removed_items)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Diff two generated API index files into added/removed public API sections."
+    )
+    parser.add_argument("--from-index", type=pathlib.Path, required=True, help="Baseline generated API index markdown.")
+    parser.add_argument("--to-index", type=pathlib.Path, required=True, help="Target generated API index markdown.")
+    parser.add_argument("--output", type=pathlib.Path, required=True, help="Output markdown path.")
+    parser.add_argument(
+        "--rename-threshold",
+        type=float,
+        default=DEFAULT_RENAME_THRESHOLD,
+        help=f"Minimum similarity (0-1) for a removed/added pair to be listed as a likely rename or move (default: {DEFAULT_RENAME_THRESHOLD}).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    for index_path in (args.from_index, args.to_index):
+        if not index_path.is_file():
+            print(f"error: index file not found: {index_path}", file=sys.stderr)
+            return 2
+    if not 0 < args.rename_threshold <= 1:
+        print("error: --rename-threshold must be greater than 0 and at most 1", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    old = read_api_index(args.from_index.resolve())
+    new = read_api_index(args.to_index.resolve())
+    if not old.items or not new.items:
+        empty = old.path if not old.items else new.path
+        print(f"error: no public signatures found in {display_path(empty)}", file=sys.stderr)
+        return 3
+
+    added_items, removed_items, skipped_files = diff_api_indexes(old, new)
+    renames = detect_renames(removed_items, added_items, args.rename_threshold)
+    write_lines_atomic(
+        args.output,
+        iter_report_lines(old, new, added_items, removed_items, renames, skipped_files),
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"Index diff written to: {args.output}")
+    print(
+        f"Signatures: {len(old.items)} -> {len(new.items)}; added {len(added_items)}, removed {len(removed_items)}, "
+        f"likely renames/moves {len(renames)}, skipped truncated files {len(skipped_files)} ({elapsed:.2f}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,18 +4,47 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import astuple, dataclass
 import fnmatch
+import itertools
+import json
 import pathlib
 import re
 import sys
 
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.output_files import file_sha256, write_lines_atomic
+from scripts.parse_cache import ParseCache, add_cache_arguments, content_digest, open_cache
+from scripts.profiling import add_profile_arguments, phase, run_profiled
+
 INDEX_SOURCE_RE = re.compile(r"^### `([^`]+)`\s*$")
 INDEX_ENTRY_RE = re.compile(r"^- `([^`]+)`\s*$")
+INDEX_NAMESPACE_RE = re.compile(r"^- Namespace: `([^`]+)`\s*$")
+SIDECAR_FORMAT = "avalonia-api-index"
+SIDECAR_VERSION = 1
+SIDECAR_FIELDS = ("source_file", "signature", "kind", "symbol", "container", "namespace")
+ATTRIBUTION_FORMAT = "avalonia-api-attribution"
+ATTRIBUTION_VERSION = 2
 TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
-QUALIFIED_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*\.\s*([A-Za-z_][A-Za-z0-9_]*)")
-METHOD_CALL_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*(?:<[^>\n]+>)?\s*\(")
+CORPUS_SEPARATOR = "\n\n"
+JOIN_SENSITIVE_CHARS = frozenset(".(<")
+IDENTIFIER_START_RE = re.compile(r"[A-Za-z_]")
+DOCUMENT_INDEX_EXTRACTOR = "find_uncovered_apis.index_document"
+PHRASE_HITS_EXTRACTOR = "find_uncovered_apis.find_phrases"
+# Bump when index_document, find_phrases or the corpus regexes change.
+DOCUMENT_INDEX_VERSION = "1"
+WORD_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_")
+# Both patterns only try to match at the start of a word: a match starting inside a
+# word is only possible when the match from the word's first letter also succeeds,
+# so anchoring skips the quadratic retries without changing what is found.
+QUALIFIED_RE = re.compile(r"(?<![A-Za-z0-9_])[0-9]*([A-Za-z_][A-Za-z0-9_]*)\s*\.\s*([A-Za-z_][A-Za-z0-9_]*)")
+METHOD_CALL_RE = re.compile(r"(?<![A-Za-z0-9_])[0-9]*([A-Za-z_][A-Za-z0-9_]*)\s*(?:<[^>\n]+>)?\s*\(")
 TYPE_DECL_RE = re.compile(
     r"^public\s+(?:new\s+|unsafe\s+|abstract\s+|sealed\s+|static\s+|partial\s+|readonly\s+|ref\s+)*"
     r"(?:class|interface|struct|enum|record(?:\s+class|\s+struct)?)\s+([A-Za-z_][A-Za-z0-9_`.]*)"
@@ -35,6 +64,7 @@ class ApiEntry:
     kind: str
     symbol: str
     container: str | None = None
+    namespace: str | None = None
 
 
 @dataclass(frozen=True)
@@ -43,6 +73,48 @@ class CorpusIndex:
     tokens: frozenset[str]
     qualified: frozenset[tuple[str, str]]
     method_calls: frozenset[str]
+    # Every text found between two consecutive backticks, so "`x`" in corpus is a set lookup.
+    backtick_spans: frozenset[str] = frozenset()
+    # Non-identifier tokens (e.g. "operator +") searched up front, and the ones found.
+    phrases: frozenset[str] = frozenset()
+    phrase_hits: frozenset[str] = frozenset()
+    has_indexer: bool = False
+
+
+@dataclass(frozen=True)
+class DocumentIndex:
+    tokens: frozenset[str]
+    qualified: frozenset[tuple[str, str]]
+    method_calls: frozenset[str]
+    backtick_spans: frozenset[str]
+    has_indexer: bool
+    # First and last non-whitespace characters, used to detect matches across documents.
+    first_char: str
+    last_char: str
+
+    def to_payload(self) -> list[object]:
+        return [
+            sorted(self.tokens),
+            sorted(self.qualified),
+            sorted(self.method_calls),
+            sorted(self.backtick_spans),
+            self.has_indexer,
+            self.first_char,
+            self.last_char,
+        ]
+
+    @classmethod
+    def from_payload(cls, payload: list[object]) -> DocumentIndex:
+        tokens, qualified, method_calls, backtick_spans, has_indexer, first_char, last_char = payload
+        return cls(
+            tokens=frozenset(tokens),
+            qualified=frozenset((left, right) for left, right in qualified),
+            method_calls=frozenset(method_calls),
+            backtick_spans=frozenset(backtick_spans),
+            has_indexer=has_indexer,
+            first_char=first_char,
+            last_char=last_char,
+        )
 
 
 def normalize_ws(value: str) -> str:
@@ -144,18 +216,29 @@ def parse_signature(signature: str) -> tuple[str, str]:
 
 
 def parse_api_index(index_path: pathlib.Path) -> list[ApiEntry]:
+    return parse_api_index_lines(index_path.read_text(encoding="utf-8").splitlines())
+
+
+def parse_api_index_lines(lines: Iterable[str]) -> list[ApiEntry]:
     entries: list[ApiEntry] = []
     current_source = "<unknown>"
+    current_namespace: str | None = None
     current_type: str | None = None
 
-    for raw_line in index_path.read_text(encoding="utf-8").splitlines():
+    for raw_line in lines:
         line = raw_line.strip()
         source_match = INDEX_SOURCE_RE.match(line)
         if source_match:
             current_source = source_match.group(1)
+            current_namespace = None
             current_type = None
             continue
 
+        namespace_match = INDEX_NAMESPACE_RE.match(line)
+        if namespace_match:
+            current_namespace = namespace_match.group(1)
+            continue
+
         entry_match = INDEX_ENTRY_RE.match(line)
         if not entry_match:
             continue
@@ -181,6 +264,7 @@ def parse_api_index(index_path: pathlib.Path) -> list[ApiEntry]:
                 kind=kind,
                 symbol=symbol,
                 container=container,
+                namespace=current_namespace,
             )
         )
 
@@ -195,6 +279,52 @@ def parse_api_index(index_path: pathlib.Path) -> list[ApiEntry]:
     return deduped
 
 
+def sidecar_path_for(index_path: pathlib.Path) -> pathlib.Path:
+    return index_path.with_suffix(".jsonl")
+
+
+def write_api_index_sidecar(path: pathlib.Path, markdown_sha256: str, entries: Iterable[ApiEntry]) -> None:
+    """Write the pre-parsed entries of an index markdown document as JSONL.
+
+    The header records the SHA-256 of the markdown, so readers can tell when the
+    markdown was edited or regenerated without the sidecar.
+    """
+    header = {
+        "format": SIDECAR_FORMAT,
+        "version": SIDECAR_VERSION,
+        "markdown_sha256": markdown_sha256,
+        "fields": list(SIDECAR_FIELDS),
+    }
+    rows = (json.dumps(astuple(entry), ensure_ascii=False, separators=(",", ":")) for entry in entries)
+    write_lines_atomic(path, itertools.chain([json.dumps(header, separators=(",", ":"))], rows, [""]))
+
+
+def read_api_index_sidecar(path: pathlib.Path, markdown_sha256: str) -> list[ApiEntry] | None:
+    """Return the sidecar entries, or None when it is missing, unreadable or stale."""
+    try:
+        with path.open(encoding="utf-8") as handle:
+            header = json.loads(handle.readline())
+            if (
+                not isinstance(header, dict)
+                or header.get("format") != SIDECAR_FORMAT
+                or header.get("version") != SIDECAR_VERSION
+                or header.get("fields") != list(SIDECAR_FIELDS)
+                or header.get("markdown_sha256") != markdown_sha256
+            ):
+                return None
+            return [ApiEntry(*json.loads(line)) for line in handle if line.strip()]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def load_api_index(index_path: pathlib.Path) -> list[ApiEntry]:
+    """Load index entries from the JSONL sidecar when it matches, else parse the markdown."""
+    entries = read_api_index_sidecar(sidecar_path_for(index_path), file_sha256(index_path))
+    if entries is not None:
+        return entries
+    return parse_api_index(index_path)
+
+
 def is_excluded(path: pathlib.Path, root: pathlib.Path, patterns: list[str]) -> bool:
     rel = path.relative_to(root).as_posix()
     for pattern in patterns:
@@ -209,6 +339,16 @@ def load_reference_docs(
     output_path: pathlib.Path | None,
     exclude_patterns: list[str],
 ) -> tuple[list[pathlib.Path], str]:
+    docs, corpus_parts = read_reference_docs(references_dir, index_path, output_path, exclude_patterns)
+    return docs, CORPUS_SEPARATOR.join(corpus_parts)
+
+
+def read_reference_docs(
+    references_dir: pathlib.Path,
+    index_path: pathlib.Path,
+    output_path: pathlib.Path | None,
+    exclude_patterns: list[str],
+) -> tuple[list[pathlib.Path], list[str]]:
     docs: list[pathlib.Path] = []
     corpus_parts: list[str] = []
 
@@ -225,30 +365,187 @@ def load_reference_docs(
         docs.append(path)
         corpus_parts.append(path.read_text(encoding="utf-8"))
 
-    return docs, "\n\n".join(corpus_parts)
+    return docs, corpus_parts
+
+
+def coverage_phrases(entries: Iterable[ApiEntry]) -> set[str]:
+    """Tokens `is_covered` may look up that cannot be answered from the token set alone."""
+    phrases: set[str] = set()
+    for entry in entries:
+        if entry.kind == "type":
+            token = entry.symbol
+        elif entry.kind == "operator":
+            token = f"operator {entry.symbol}"
+        elif entry.kind not in {"indexer", "method", "delegate"} and len(entry.symbol) >= 8 and entry.symbol[:1].isupper():
+            token = entry.symbol
+        else:
+            continue
+        if token and not TOKEN_RE.fullmatch(token):
+            phrases.add(token)
+    return phrases
 
 
-def build_corpus_index(corpus: str) -> CorpusIndex:
+def find_phrases(corpus: str, phrases: Iterable[str]) -> set[str]:
+    """Return the phrases that occur in `corpus` delimited by non-identifier characters."""
+    return {phrase for _, phrase in iter_phrase_matches(corpus, phrases)}
+
+
+def iter_phrase_matches(corpus: str, phrases: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """Yield `(offset, phrase)` for every boundary-delimited occurrence of a phrase.
+
+    One zero-width scan visits every position where some phrase starts after a
+    boundary; all phrases sharing that first character are then checked in place,
+    so overlapping and prefix phrases are all found.
+    """
+    by_first_char: dict[str, list[str]] = defaultdict(list)
+    for phrase in sorted(set(phrases), key=len, reverse=True):
+        by_first_char[phrase[0]].append(phrase)
+    if not by_first_char:
+        return
+
+    alternatives = "|".join(re.escape(phrase) for phrases in by_first_char.values() for phrase in phrases)
+    starts = re.compile(rf"(?<![A-Za-z0-9_])(?={alternatives})")
+
+    for match in starts.finditer(corpus):
+        pos = match.start()
+        for phrase in by_first_char[corpus[pos]]:
+            if not corpus.startswith(phrase, pos):
+                continue
+            end = pos + len(phrase)
+            if end == len(corpus) or corpus[end] not in WORD_CHARS:
+                yield pos, phrase
+
+
+def build_corpus_index(corpus: str, phrases: Iterable[str] = ()) -> CorpusIndex:
     tokens = frozenset(TOKEN_RE.findall(corpus))
     qualified = frozenset((left, right) for left, right in QUALIFIED_RE.findall(corpus))
     method_calls = frozenset(METHOD_CALL_RE.findall(corpus))
+    searched = frozenset(phrase for phrase in phrases if phrase)
     return CorpusIndex(
         corpus=corpus,
         tokens=tokens,
         qualified=qualified,
         method_calls=method_calls,
+        backtick_spans=frozenset(corpus.split("`")[1:-1]),
+        phrases=searched,
+        phrase_hits=frozenset(find_phrases(corpus, searched)),
+        has_indexer="this[" in corpus,
+    )
+
+
+def index_document(text: str) -> DocumentIndex:
+    stripped = text.strip()
+    return DocumentIndex(
+        tokens=frozenset(TOKEN_RE.findall(text)),
+        qualified=frozenset((left, right) for left, right in QUALIFIED_RE.findall(text)),
+        method_calls=frozenset(METHOD_CALL_RE.findall(text)),
+        backtick_spans=frozenset(text.split("`")[1:-1]),
+        has_indexer="this[" in text,
+        first_char=stripped[:1],
+        last_char=stripped[-1:],
+    )
+
+
+def documents_join_cleanly(documents: list[DocumentIndex]) -> bool:
+    """True when no QUALIFIED_RE/METHOD_CALL_RE match can span the blank line between documents.
+
+    Only two shapes can continue across the separator: `Name.` followed by a document
+    opening with an identifier, or `Name`/`Name<T>` followed by a document opening with
+    `.`, `(` or `<`. Otherwise per-document matches equal matches over the joined corpus.
+    """
+    previous: DocumentIndex | None = None
+    for document in documents:
+        if not document.first_char:
+            continue
+        if previous is not None:
+            if previous.last_char == "." and IDENTIFIER_START_RE.match(document.first_char):
+                return False
+            if document.first_char in JOIN_SENSITIVE_CHARS and (
+                previous.last_char in WORD_CHARS or previous.last_char == ">"
+            ):
+                return False
+        previous = document
+    return True
+
+
+def cached_document_index(text: str, digest: str, cache: ParseCache) -> DocumentIndex:
+    cached = cache.get(DOCUMENT_INDEX_EXTRACTOR, DOCUMENT_INDEX_VERSION, digest)
+    if cached is not None:
+        return DocumentIndex.from_payload(cached)
+
+    document = index_document(text)
+    cache.put(DOCUMENT_INDEX_EXTRACTOR, DOCUMENT_INDEX_VERSION, digest, document.to_payload())
+    return document
+
+
+def cached_phrase_hits(text: str, digest: str, phrases: frozenset[str], phrases_digest: str, cache: ParseCache) -> set[str]:
+    key = content_digest(f"{digest}:{phrases_digest}".encode("ascii"))
+    cached = cache.get(PHRASE_HITS_EXTRACTOR, DOCUMENT_INDEX_VERSION, key)
+    if cached is not None:
+        return set(cached)
+
+    hits = find_phrases(text, phrases)
+    cache.put(PHRASE_HITS_EXTRACTOR, DOCUMENT_INDEX_VERSION, key, sorted(hits))
+    return hits
+
+
+def build_cached_corpus_index(texts: list[str], phrases: Iterable[str], cache: ParseCache) -> CorpusIndex:
+    """Build the same CorpusIndex as `build_corpus_index(CORPUS_SEPARATOR.join(texts), phrases)`.
+
+    Each document is indexed once per content hash and the per-document results are
+    merged; only edited documents are re-tokenized. Phrase hits are cached per
+    document and phrase set.
+    """
+    corpus = CORPUS_SEPARATOR.join(texts)
+    searched = frozenset(phrase for phrase in phrases if phrase)
+    digests = [content_digest(text.encode("utf-8")) for text in texts]
+    documents = [cached_document_index(text, digest, cache) for text, digest in zip(texts, digests)]
+
+    if not documents_join_cleanly(documents):
+        return build_corpus_index(corpus, searched)
+
+    # Phrases without newlines cannot span the separator, so they are found per document.
+    local_phrases = frozenset(phrase for phrase in searched if "\n" not in phrase)
+    phrase_hits = find_phrases(corpus, searched - local_phrases)
+    if local_phrases:
+        phrases_digest = content_digest("\n".join(sorted(local_phrases)).encode("utf-8"))
+        for text, digest in zip(texts, digests):
+            phrase_hits |= cached_phrase_hits(text, digest, local_phrases, phrases_digest, cache)
+
+    return CorpusIndex(
+        corpus=corpus,
+        tokens=frozenset().union(*(document.tokens for document in documents)),
+        qualified=frozenset().union(*(document.qualified for document in documents)),
+        method_calls=frozenset().union(*(document.method_calls for document in documents)),
+        # Spans crossing a document boundary contain the separator's newlines; has_backticked
+        # answers newline-containing lookups from the corpus text instead.
+        backtick_spans=frozenset().union(*(document.backtick_spans for document in documents)),
+        phrases=searched,
+        phrase_hits=frozenset(phrase_hits),
+        has_indexer=any(document.has_indexer for document in documents),
     )
 
 
 def has_token(index: CorpusIndex, token: str) -> bool:
     if " " not in token and token in index.tokens:
         return True
+    if TOKEN_RE.fullmatch(token):
+        # An identifier with identifier boundaries on both sides is always a whole token.
+        return False
+    if token in index.phrases:
+        return token in index.phrase_hits
     if token not in index.corpus:
         return False
     pattern = re.compile(rf"(?<![A-Za-z0-9_]){re.escape(token)}(?![A-Za-z0-9_])")
     return bool(pattern.search(index.corpus))
 
 
+def has_backticked(index: CorpusIndex, text: str) -> bool:
+    if "`" in text or "\n" in text or not index.backtick_spans:
+        return f"`{text}`" in index.corpus
+    return text in index.backtick_spans
+
+
 def has_qualified(index: CorpusIndex, container: str, symbol: str) -> bool:
     return (container, symbol) in index.qualified
 
@@ -259,16 +556,16 @@ def has_method_call(index: CorpusIndex, symbol: str) -> bool:
 
 def is_covered(entry: ApiEntry, index: CorpusIndex) -> bool:
     if entry.kind == "type":
-        if f"`{entry.symbol}`" in index.corpus:
+        if has_backticked(index, entry.symbol):
             return True
         return has_token(index, entry.symbol)
 
     if entry.kind == "indexer":
-        return "this[" in index.corpus
+        return index.has_indexer
 
     if entry.kind == "operator":
         text = f"operator {entry.symbol}"
-        if f"`{text}`" in index.corpus:
+        if has_backticked(index, text):
             return True
         return has_token(index, text)
 
@@ -277,12 +574,12 @@ def is_covered(entry: ApiEntry, index: CorpusIndex) -> bool:
             return True
         if has_method_call(index, entry.symbol):
             return True
-        return f"`{entry.symbol}`" in index.corpus
+        return has_backticked(index, entry.symbol)
 
     if entry.container and has_qualified(index, entry.container, entry.symbol):
         return True
 
-    if f"`{entry.symbol}`" in index.corpus:
+    if has_backticked(index, entry.symbol):
         return True
 
     # Fallback for longer member names where plain-token matching is less noisy.
@@ -292,6 +589,129 @@ def is_covered(entry: ApiEntry, index: CorpusIndex) -> bool:
     return False
 
 
+def coverage_keys(entry: ApiEntry) -> list[tuple[str, ...]]:
+    """The corpus lookups `is_covered` may satisfy `entry` with; any one of them covers it."""
+    if entry.kind == "type":
+        return [("backticked", entry.symbol), ("token", entry.symbol)]
+
+    if entry.kind == "indexer":
+        return [("indexer",)]
+
+    if entry.kind == "operator":
+        text = f"operator {entry.symbol}"
+        return [("backticked", text), ("token", text)]
+
+    keys: list[tuple[str, ...]] = []
+    if entry.container:
+        keys.append(("qualified", entry.container, entry.symbol))
+    if entry.kind in {"method", "delegate"}:
+        keys.append(("call", entry.symbol))
+    keys.append(("backticked", entry.symbol))
+    if entry.kind not in {"method", "delegate"} and len(entry.symbol) >= 8 and entry.symbol[:1].isupper():
+        keys.append(("token", entry.symbol))
+    return keys
+
+
+def find_key_lines(
+    text: str,
+    wanted: set[tuple[str, ...]],
+    phrases: set[str],
+) -> dict[tuple[str, ...], list[int]]:
+    """Map each of the `wanted` coverage keys found in one document to its 1-based line numbers."""
+    line_starts = [0]
+    line_starts.extend(match.end() for match in re.finditer("\n", text))
+    found: dict[tuple[str, ...], set[int]] = defaultdict(set)
+
+    def record(key: tuple[str, ...], offset: int) -> None:
+        if key in wanted:
+            found[key].add(bisect.bisect_right(line_starts, offset))
+
+    for match in TOKEN_RE.finditer(text):
+        record(("token", match.group()), match.start())
+    for match in QUALIFIED_RE.finditer(text):
+        record(("qualified", *match.groups()), match.start(1))
+    for match in METHOD_CALL_RE.finditer(text):
+        record(("call", match.group(1)), match.start(1))
+
+    for offset, phrase in iter_phrase_matches(text, phrases):
+        record(("token", phrase), offset)
+
+    # Same spans as CorpusIndex.backtick_spans, located at their opening backtick.
+    offset = -1
+    for span in text.split("`")[:-1]:
+        if offset >= 0:
+            record(("backticked", span), offset)
+        offset += len(span) + 1
+
+    offset = text.find("this[")
+    while offset != -1:
+        record(("indexer",), offset)
+        offset = text.find("this[", offset + 1)
+
+    return {key: sorted(lines) for key, lines in found.items()}
+
+
+def attribute_coverage(
+    entries: list[ApiEntry],
+    docs: list[str],
+    texts: list[str],
+) -> list[tuple[ApiEntry, dict[str, list[int]]]]:
+    """Attribute every entry to the docs and lines that cover it, in one pass over the docs.
+
+    All coverage keys of all entries are looked up per document once and inverted, so
+    the cost does not grow with the number of entries. Matches that only exist across
+    the boundary between two joined documents are not attributed.
+    """
+    entry_keys = [coverage_keys(entry) for entry in entries]
+    wanted = {key for keys in entry_keys for key in keys}
+    phrases = {key[1] for key in wanted if key[0] == "token" and not TOKEN_RE.fullmatch(key[1])}
+    key_locations: dict[tuple[str, ...], list[tuple[str, list[int]]]] = defaultdict(list)
+    for doc, text in zip(docs, texts):
+        for key, lines in find_key_lines(text, wanted, phrases).items():
+            key_locations[key].append((doc, lines))
+
+    attribution: list[tuple[ApiEntry, dict[str, list[int]]]] = []
+    for entry, keys in zip(entries, entry_keys):
+        by_doc: dict[str, set[int]] = defaultdict(set)
+        for key in keys:
+            for doc, lines in key_locations.get(key, ()):
+                by_doc[doc].update(lines)
+        if by_doc:
+            attribution.append((entry, {doc: sorted(by_doc[doc]) for doc in sorted(by_doc)}))
+    return attribution
+
+
+def write_attribution(
+    path: pathlib.Path,
+    index_path: pathlib.Path,
+    attribution: list[tuple[ApiEntry, dict[str, list[int]]]],
+) -> None:
+    """Write one JSON object per attributed entry, with a header line naming the index."""
+    header = {
+        "format": ATTRIBUTION_FORMAT,
+        "version": ATTRIBUTION_VERSION,
+        "index": display_path(index_path),
+        "index_sha256": file_sha256(index_path),
+    }
+    rows = (
+        json.dumps(
+            {
+                "source_file": entry.source_file,
+                "signature": entry.signature,
+                "kind": entry.kind,
+                "symbol": entry.symbol,
+                "container": entry.container,
+                "namespace": entry.namespace,
+                "docs": docs,
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        for entry, docs in attribution
+    )
+    write_lines_atomic(path, itertools.chain([json.dumps(header, separators=(",", ":"))], rows, [""]))
+
+
 def build_report(
     entries: list[ApiEntry],
     uncovered: list[ApiEntry],
@@ -370,12 +790,34 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Also print the full report to stdout.",
     )
+    parser.add_argument(
+        "--write-sidecar",
+        action="store_true",
+        help=(
+            "Write the pre-parsed JSONL sidecar next to --index when it is missing or stale, "
+            "so later runs skip parsing the markdown."
+        ),
+    )
+    parser.add_argument(
+        "--attribution",
+        type=pathlib.Path,
+        default=None,
+        help=(
+            "Also write a JSONL attribution index mapping every covered API signature "
+            "to the reference docs and line numbers that cover it."
+        ),
+    )
+    add_cache_arguments(parser)
+    add_profile_arguments(parser)
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
+    return run_profiled(args, "find_uncovered_apis", run)
+
 
+def run(args: argparse.Namespace) -> int:
     index_path = args.index.resolve()
     references_dir = args.references_dir.resolve()
     output_path = args.output.resolve() if args.output else None
@@ -394,21 +836,47 @@ def main() -> int:
         "*-breaking-changes-and-new-api-catalog.md",
         *args.exclude,
     ]
-    entries = parse_api_index(index_path)
-    docs, corpus = load_reference_docs(
-        references_dir=references_dir,
-        index_path=index_path,
-        output_path=output_path,
-        exclude_patterns=exclude_patterns,
-    )
-
-    corpus_index = build_corpus_index(corpus)
-    uncovered = [entry for entry in entries if not is_covered(entry, corpus_index)]
-    report = build_report(entries, uncovered, docs, index_path, references_dir)
+    with phase("load api index"):
+        entries = load_api_index(index_path)
+    if args.write_sidecar:
+        with phase("write sidecar"):
+            markdown_sha256 = file_sha256(index_path)
+            sidecar_path = sidecar_path_for(index_path)
+            if read_api_index_sidecar(sidecar_path, markdown_sha256) is None:
+                write_api_index_sidecar(sidecar_path, markdown_sha256, entries)
+                print(f"Sidecar written to: {display_path(sidecar_path)}")
+    with phase("read reference docs"):
+        docs, texts = read_reference_docs(
+            references_dir=references_dir,
+            index_path=index_path,
+            output_path=output_path,
+            exclude_patterns=exclude_patterns,
+        )
 
-    if output_path is not None:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(report, encoding="utf-8")
+    with phase("index reference corpus"):
+        phrases = coverage_phrases(entries)
+        cache = open_cache(args)
+        if cache is None:
+            corpus_index = build_corpus_index(CORPUS_SEPARATOR.join(texts), phrases)
+        else:
+            try:
+                corpus_index = build_cached_corpus_index(texts, phrases, cache)
+            finally:
+                cache.close()
+    with phase("check coverage"):
+        uncovered = [entry for entry in entries if not is_covered(entry, corpus_index)]
+    with phase("render and write report"):
+        report = build_report(entries, uncovered, docs, index_path, references_dir)
+
+        if output_path is not None:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(report, encoding="utf-8")
+
+    attribution_path = args.attribution.resolve() if args.attribution else None
+    if attribution_path is not None:
+        with phase("write attribution"):
+            doc_labels = [display_path(doc) for doc in docs]
+            write_attribution(attribution_path, index_path, attribute_coverage(entries, doc_labels, texts))
 
     print(
         f"Parsed {len(entries)} API signatures; "
@@ -417,6 +885,10 @@ def main() -> int:
     )
     if output_path is not None:
         print(f"Report written to: {display_path(output_path)}")
+    if attribution_path is not None:
+        print(f"Attribution written to: {display_path(attribution_path)}")
+    if cache is not None:
+        print(cache.summary())
     if args.stdout:
         print()
         print(report)
@@ -3,20 +3,35 @@
 
 The goal is broad public API coverage across the Avalonia product source tree, while
 still using a lightweight parser (not a full compiler-accurate symbol dump).
+
+Next to the markdown, a JSONL sidecar (`<output>.jsonl`) stores the same entries
+pre-parsed for `find_uncovered_apis.py`.
 """
 
 from __future__ import annotations
 
 import argparse
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 import datetime as dt
+import itertools
+import os
 import pathlib
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
-from dataclasses import dataclass
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.csharp_declarations import ParsedSource, decode_source, parse_source, scan_sources
+from scripts.find_uncovered_apis import parse_api_index_lines, sidecar_path_for, write_api_index_sidecar
+from scripts.output_files import file_sha256, write_lines_atomic
+from scripts.parse_cache import ParseCache, add_cache_arguments, open_cache
+from scripts.profiling import add_profile_arguments, phase, run_profiled
+from scripts.tree_readers import FilesystemTreeReader, GitTreeReader, TreeReader
 
 DEFAULT_PATTERNS = [
     # Public product source surface.
@@ -28,82 +43,7 @@ DEFAULT_PATTERNS = [
     "build/**/*.targets",
 ]
 DEFAULT_MAX_PER_FILE = 300
-
-TYPE_DECL_RE = re.compile(
-    r"^\s*(public|internal|private|protected)\s+"
-    r"(?:new\s+|unsafe\s+|abstract\s+|sealed\s+|static\s+|partial\s+|readonly\s+|ref\s+)*"
-    r"(class|interface|struct|enum|record)\s+([A-Za-z_][A-Za-z0-9_`]*)"
-)
-
-NAMESPACE_RE = re.compile(r"^\s*namespace\s+([A-Za-z_][A-Za-z0-9_.]*)\s*[;{]")
-PUBLIC_RE = re.compile(r"^\s*public\s+")
-ACCESS_MODIFIER_RE = re.compile(r"^\s*(public|internal|private|protected)\b")
-DECLARATION_START_RE = re.compile(
-    r"^\s*(?:"
-    r"event\b|"
-    r"static\b|"
-    r"abstract\b|"
-    r"sealed\b|"
-    r"partial\b|"
-    r"delegate\b|"
-    r"new\b|"
-    r"unsafe\b|"
-    r"readonly\b|"
-    r"ref\b|"
-    r"[A-Za-z_@]"
-    r")"
-)
-
-
-@dataclass
-class TypeScope:
-    name: str
-    is_public: bool
-    is_interface: bool
-    brace_depth: int
-
-
-def strip_comments(line: str, in_block: bool) -> tuple[str, bool]:
-    i = 0
-    out: list[str] = []
-
-    while i < len(line):
-        if in_block:
-            end = line.find("*/", i)
-            if end == -1:
-                return "", True
-            i = end + 2
-            in_block = False
-            continue
-
-        if line.startswith("/*", i):
-            in_block = True
-            i += 2
-            continue
-
-        if line.startswith("//", i):
-            break
-
-        out.append(line[i])
-        i += 1
-
-    return "".join(out), in_block
-
-
-def sanitize_for_braces(text: str) -> str:
-    # Remove string literals so brace counting is less noisy.
-    text = re.sub(r'"([^"\\]|\\.)*"', '""', text)
-    text = re.sub(r"'([^'\\]|\\.)*'", "''", text)
-    return text
-
-
-def normalize_signature(raw: str) -> str:
-    sig = " ".join(raw.replace("\t", " ").split())
-    return sig.strip()
-
-
-def declaration_terminated(sig: str) -> bool:
-    return ";" in sig or "=>" in sig or "{" in sig
+SCAN_BACKENDS = ("git", "worktree")
 
 
 def area_for(rel: str) -> str:
@@ -134,129 +74,46 @@ def area_for(rel: str) -> str:
     return "Other"
 
 
-def is_implicit_interface_member_start(line: str, scope: TypeScope | None) -> bool:
-    if scope is None or not (scope.is_public and scope.is_interface):
-        return False
-    stripped = line.lstrip()
-    if stripped.startswith(("[", "}", "#")) or stripped.startswith("public:"):
-        return False
-    return ACCESS_MODIFIER_RE.match(line) is None and DECLARATION_START_RE.match(line) is not None
+def extract_signatures(path: pathlib.Path) -> tuple[str | None, list[str]]:
+    return parse_signatures(decode_source(path.read_bytes()))
 
 
-def extract_signatures(path: pathlib.Path) -> tuple[str | None, list[str]]:
-    namespace: str | None = None
-    in_block = False
-    depth = 0
-    type_stack: list[TypeScope] = []
-    pending_type: tuple[str, bool] | None = None
-    pending_sig: str | None = None
-    signatures: list[str] = []
+def parse_signatures(text: str | None) -> tuple[str | None, list[str]]:
+    return render_signatures(parse_source(text))
 
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except UnicodeDecodeError:
-        return None, []
 
-    for raw in lines:
-        line, in_block = strip_comments(raw, in_block)
-        if not line.strip():
-            continue
+def render_signatures(parsed: ParsedSource) -> tuple[str | None, list[str]]:
+    """Index view of a parsed file: type declaration heads and full member signatures."""
+    signatures = [item.head if item.kind == "type" else item.signature for item in parsed.declarations]
+    return parsed.namespace, signatures
 
-        ns_match = NAMESPACE_RE.match(line)
-        if ns_match:
-            namespace = ns_match.group(1)
-
-        clean = sanitize_for_braces(line)
-
-        if pending_type is not None and "{" in clean:
-            t_name, t_public = pending_type
-            t_kind = t_name.split(" ", 1)[0]
-            type_stack.append(
-                TypeScope(
-                    name=t_name,
-                    is_public=t_public,
-                    is_interface=t_kind == "interface",
-                    brace_depth=depth + 1,
-                )
-            )
-            pending_type = None
-
-        type_match = TYPE_DECL_RE.match(line)
-        is_type_decl = type_match is not None
-        if type_match:
-            access = type_match.group(1)
-            kind = type_match.group(2)
-            name = type_match.group(3)
-            parent_public = type_stack[-1].is_public if type_stack else True
-            is_public = access == "public" and parent_public
-
-            if is_public:
-                signatures.append(normalize_signature(line))
-
-            if "{" in clean:
-                type_stack.append(
-                    TypeScope(
-                        name=f"{kind} {name}",
-                        is_public=is_public,
-                        is_interface=kind == "interface",
-                        brace_depth=depth + 1,
-                    )
-                )
-            else:
-                pending_type = (f"{kind} {name}", is_public)
-
-        current_scope = type_stack[-1] if type_stack else None
-        innermost_public = current_scope.is_public if current_scope else False
-        member_depth = current_scope.brace_depth if current_scope else -1
-
-        if pending_sig is None:
-            if (
-                innermost_public
-                and depth == member_depth
-                and (PUBLIC_RE.match(line) or is_implicit_interface_member_start(line, current_scope))
-                and not is_type_decl
-                and not line.lstrip().startswith("public:")
-            ):
-                pending_sig = normalize_signature(line)
-                if declaration_terminated(pending_sig):
-                    signatures.append(pending_sig)
-                    pending_sig = None
-        else:
-            pending_sig = normalize_signature(pending_sig + " " + line)
-            if declaration_terminated(pending_sig):
-                signatures.append(pending_sig)
-                pending_sig = None
-
-        depth += clean.count("{")
-        depth -= clean.count("}")
-
-        while type_stack and depth < type_stack[-1].brace_depth:
-            type_stack.pop()
-
-    if pending_sig:
-        signatures.append(normalize_signature(pending_sig))
-
-    return namespace, signatures
-
-
-def resolve_files(repo: pathlib.Path, patterns: list[str]) -> list[pathlib.Path]:
-    files: set[pathlib.Path] = set()
-    for pattern in patterns:
-        for match in repo.glob(pattern):
-            if match.is_file():
-                files.add(match)
-    return sorted(files)
+
+def resolve_jobs(jobs: int) -> int:
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def scan_signatures(
+    tree: TreeReader,
+    files: list[str],
+    jobs: int = 1,
+    cache: ParseCache | None = None,
+) -> list[tuple[str | None, list[str]]]:
+    """Parse `files` from `tree` in order, reusing cached results for byte-identical content."""
+    return [render_signatures(parsed) for parsed in scan_sources(tree, files, jobs, cache)]
 
 
 def write_markdown(
     output: pathlib.Path,
-    repo: pathlib.Path,
+    tree: TreeReader,
     repo_label: str,
-    files: list[pathlib.Path],
+    files: list[str],
     max_per_file: int,
     git_ref: str | None = None,
+    jobs: int = 1,
+    cache: ParseCache | None = None,
 ) -> tuple[int, int]:
-    now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
     try:
         output_label = output.relative_to(pathlib.Path.cwd()).as_posix()
     except ValueError:
@@ -265,9 +122,10 @@ def write_markdown(
     by_area: dict[str, list[tuple[str, str | None, list[str]]]] = {}
     total_sigs = 0
 
-    for path in files:
-        rel = path.relative_to(repo).as_posix()
-        namespace, signatures = extract_signatures(path)
+    with phase("parse sources"):
+        scanned = scan_signatures(tree, files, jobs, cache)
+
+    for rel, (namespace, signatures) in zip(files, scanned):
         if not signatures:
             continue
 
@@ -275,60 +133,72 @@ def write_markdown(
         area = area_for(rel)
         by_area.setdefault(area, []).append((rel, namespace, signatures))
 
-    lines: list[str] = []
-    lines.append("# Avalonia Public API Index (Generated)")
-    lines.append("")
-    lines.append(f"- Generated at (UTC): `{now}`")
-    lines.append(f"- Repository: `{repo_label}`")
+    with phase("render and write index"):
+        write_lines_atomic(
+            output,
+            iter_markdown_lines(by_area, repo_label, output_label, len(files), total_sigs, max_per_file, git_ref),
+        )
+    with phase("write sidecar"):
+        with output.open(encoding="utf-8") as handle:
+            entries = parse_api_index_lines(handle)
+        write_api_index_sidecar(sidecar_path_for(output), file_sha256(output), entries)
+
+    return len(files), total_sigs
+
+
+def iter_markdown_lines(
+    by_area: dict[str, list[tuple[str, str | None, list[str]]]],
+    repo_label: str,
+    output_label: str,
+    file_count: int,
+    total_sigs: int,
+    max_per_file: int,
+    git_ref: str | None = None,
+) -> Iterator[str]:
+    now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
+
+    yield "# Avalonia Public API Index (Generated)"
+    yield ""
+    yield f"- Generated at (UTC): `{now}`"
+    yield f"- Repository: `{repo_label}`"
     if git_ref:
-        lines.append(f"- Git ref: `{git_ref}`")
-    lines.append(f"- Files scanned: `{len(files)}`")
-    lines.append(f"- Captured public signatures: `{total_sigs}`")
-    lines.append("")
-    lines.append("## Scope")
-    lines.append("")
-    lines.append("This index targets public APIs across Avalonia product source files and build configuration surfaces.")
-    lines.append("")
-    lines.append("## Regenerate")
-    lines.append("")
+        yield f"- Git ref: `{git_ref}`"
+    yield f"- Files scanned: `{file_count}`"
+    yield f"- Captured public signatures: `{total_sigs}`"
+    yield ""
+    yield "## Scope"
+    yield ""
+    yield "This index targets public APIs across Avalonia product source files and build configuration surfaces."
+    yield ""
+    yield "## Regenerate"
+    yield ""
     regen_cmd = "python3 scripts/generate_api_index.py --repo <path-to-avalonia-repo>"
     if git_ref:
         regen_cmd += f" --git-ref {git_ref}"
     regen_cmd += f" --output {output_label}"
     if max_per_file != DEFAULT_MAX_PER_FILE:
         regen_cmd += f" --max-per-file {max_per_file}"
-    lines.append("```bash")
-    lines.append(regen_cmd)
-    lines.append("```")
-    lines.append("")
+    yield "```bash"
+    yield regen_cmd
+    yield "```"
+    yield ""
 
     for area in sorted(by_area.keys()):
-        lines.append(f"## {area}")
-        lines.append("")
+        yield f"## {area}"
+        yield ""
         for rel, namespace, signatures in sorted(by_area[area], key=lambda x: x[0]):
-            lines.append(f"### `{rel}`")
+            yield f"### `{rel}`"
             if namespace:
-                lines.append(f"- Namespace: `{namespace}`")
-
-            if len(signatures) > max_per_file:
-                shown = signatures[:max_per_file]
-                hidden = len(signatures) - max_per_file
-            else:
-                shown = signatures
-                hidden = 0
+                yield f"- Namespace: `{namespace}`"
 
-            for sig in shown:
-                lines.append(f"- `{sig}`")
+            for sig in itertools.islice(signatures, max_per_file):
+                yield f"- `{sig}`"
 
-            if hidden:
-                lines.append(f"- `... {hidden} more signatures omitted (increase --max-per-file to include them).`")
+            hidden = len(signatures) - max_per_file
+            if hidden > 0:
+                yield f"- `... {hidden} more signatures omitted (increase --max-per-file to include them).`"
 
-            lines.append("")
-
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text("\n".join(lines), encoding="utf-8")
-
-    return len(files), total_sigs
+            yield ""
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -348,7 +218,16 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--git-ref",
         default=None,
-        help="Optional git ref (tag/branch/commit) to scan via a detached worktree.",
+        help="Optional git ref (tag/branch/commit) to scan.",
+    )
+    parser.add_argument(
+        "--scan-backend",
+        choices=SCAN_BACKENDS,
+        default="git",
+        help=(
+            "How --git-ref content is read: 'git' streams blobs from the object database, "
+            "'worktree' checks the ref out into a temporary detached worktree."
+        ),
     )
     parser.add_argument(
         "--pattern",
@@ -362,16 +241,32 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_MAX_PER_FILE,
         help="Maximum signatures to print per file before truncation note.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used to parse files (0 = one per CPU).",
+    )
+    add_cache_arguments(parser)
+    add_profile_arguments(parser)
     return parser
 
 
-def prepare_scan_repo(repo: pathlib.Path, git_ref: str | None) -> tuple[pathlib.Path, str, Callable[[], None]]:
+def prepare_scan_repo(
+    repo: pathlib.Path,
+    git_ref: str | None,
+    backend: str = "git",
+) -> tuple[TreeReader, str, Callable[[], None]]:
     if not git_ref:
-        return repo, repo.name, lambda: None
+        return FilesystemTreeReader(repo), repo.name, lambda: None
 
     if not (repo / ".git").exists():
         raise RuntimeError(f"--git-ref requires a git repository path: {repo}")
 
+    if backend == "git":
+        tree = GitTreeReader(repo, git_ref)
+        return tree, f"{repo.name}@{git_ref}", tree.close
+
     safe_ref = re.sub(r"[^A-Za-z0-9._-]+", "-", git_ref)
     temp_repo = pathlib.Path(tempfile.mkdtemp(prefix=f"{repo.name}-{safe_ref}-"))
 
@@ -396,13 +291,15 @@ def prepare_scan_repo(repo: pathlib.Path, git_ref: str | None) -> tuple[pathlib.
         )
         shutil.rmtree(temp_repo, ignore_errors=True)
 
-    return temp_repo, f"{repo.name}@{git_ref}", cleanup
+    return FilesystemTreeReader(temp_repo), f"{repo.name}@{git_ref}", cleanup
 
 
 def main() -> int:
-    parser = build_parser()
-    args = parser.parse_args()
+    args = build_parser().parse_args()
+    return run_profiled(args, "generate_api_index", run)
 
+
+def run(args: argparse.Namespace) -> int:
     repo = pathlib.Path(args.repo).expanduser().resolve()
     output = pathlib.Path(args.output).expanduser().resolve()
 
@@ -410,33 +307,48 @@ def main() -> int:
         print(f"error: invalid repo path: {repo}", file=sys.stderr)
         return 2
 
+    if args.jobs < 0:
+        print("error: --jobs must be zero or a positive integer", file=sys.stderr)
+        return 2
+
     try:
-        scan_repo, repo_label, cleanup = prepare_scan_repo(repo, args.git_ref)
+        with phase("prepare ref"):
+            tree, repo_label, cleanup = prepare_scan_repo(repo, args.git_ref, args.scan_backend)
     except RuntimeError as ex:
         print(f"error: {ex}", file=sys.stderr)
         return 4
 
     patterns = list(DEFAULT_PATTERNS)
     patterns.extend(args.pattern)
+    cache = open_cache(args)
 
     try:
-        files = resolve_files(scan_repo, patterns)
+        with phase("list files"):
+            files = tree.list_files(patterns)
         if not files:
             print("error: no files matched configured patterns", file=sys.stderr)
             return 3
 
         file_count, sig_count = write_markdown(
             output,
-            scan_repo,
+            tree,
             repo_label,
             files,
             max_per_file=args.max_per_file,
             git_ref=args.git_ref,
+            jobs=resolve_jobs(args.jobs),
+            cache=cache,
         )
         print(f"Wrote {output} ({file_count} files, {sig_count} signatures)")
+        print(f"Wrote {sidecar_path_for(output)}")
+        if cache is not None:
+            print(cache.summary())
         return 0
     finally:
-        cleanup()
+        with phase("cleanup"):
+            if cache is not None:
+                cache.close()
+            cleanup()
 
 
 if __name__ == "__main__":
@@ -12,10 +12,15 @@ from __future__ import annotations
 
 import argparse
 from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import datetime as dt
 from dataclasses import dataclass
+import io
+import os
 import pathlib
 import re
+import subprocess
 import sys
 import xml.etree.ElementTree as ET
 
@@ -23,45 +28,15 @@ ROOT = pathlib.Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from scripts.find_uncovered_apis import parse_signature
-from scripts.generate_api_index import (
-    NAMESPACE_RE,
-    PUBLIC_RE,
-    area_for,
-    declaration_terminated,
-    normalize_signature,
-    prepare_scan_repo,
-    resolve_files,
-    sanitize_for_braces,
-    strip_comments,
-)
+from scripts.csharp_declarations import ParsedSource, decode_source, parse_source, scan_trees
+from scripts.generate_api_index import SCAN_BACKENDS, area_for, prepare_scan_repo, resolve_jobs
+from scripts.output_files import write_lines_atomic
+from scripts.parse_cache import ParseCache, add_cache_arguments, open_cache
+from scripts.profiling import add_profile_arguments, phase, run_profiled
+from scripts.tree_readers import FilesystemTreeReader, TreeReader
 
 DEFAULT_PATTERNS = ["src/**/*.cs"]
-TYPE_START_RE = re.compile(
-    r"^\s*(public|internal|private|protected)\s+"
-    r"(?:new\s+|unsafe\s+|abstract\s+|sealed\s+|static\s+|partial\s+|readonly\s+|ref\s+)*"
-    r"(class|interface|struct|enum|record(?:\s+class|\s+struct)?)\b"
-)
-DELEGATE_START_RE = re.compile(
-    r"^\s*(public|internal|private|protected)\s+"
-    r"(?:new\s+|unsafe\s+|static\s+|partial\s+|readonly\s+|ref\s+)*delegate\b"
-)
-ACCESS_MODIFIER_RE = re.compile(r"^\s*(public|internal|private|protected)\b")
-DECLARATION_START_RE = re.compile(
-    r"^\s*(?:"
-    r"event\b|"
-    r"static\b|"
-    r"abstract\b|"
-    r"sealed\b|"
-    r"partial\b|"
-    r"delegate\b|"
-    r"new\b|"
-    r"unsafe\b|"
-    r"readonly\b|"
-    r"ref\b|"
-    r"[A-Za-z_@]"
-    r")"
-)
+SUPPRESSION_PATTERNS = ["api/*.xml"]
 TARGET_KIND_LABELS = {
     "T": "type",
     "M": "method/member",
@@ -69,6 +44,40 @@ TARGET_KIND_LABELS = {
     "F": "field",
     "E": "event",
 }
+# Metadata names of user-defined operators, mapped to the symbol the parser records.
+OPERATOR_METADATA_NAMES = {
+    "op_Addition": "+",
+    "op_Subtraction": "-",
+    "op_Multiply": "*",
+    "op_Division": "/",
+    "op_Modulus": "%",
+    "op_Equality": "==",
+    "op_Inequality": "!=",
+    "op_LessThan": "<",
+    "op_GreaterThan": ">",
+    "op_LessThanOrEqual": "<=",
+    "op_GreaterThanOrEqual": ">=",
+    "op_UnaryNegation": "-",
+    "op_UnaryPlus": "+",
+    "op_LogicalNot": "!",
+    "op_OnesComplement": "~",
+    "op_Increment": "++",
+    "op_Decrement": "--",
+    "op_True": "true",
+    "op_False": "false",
+    "op_BitwiseAnd": "&",
+    "op_BitwiseOr": "|",
+    "op_ExclusiveOr": "^",
+    "op_LeftShift": "<<",
+    "op_RightShift": ">>",
+}
+GENERIC_ARITY_RE = re.compile(r"`+\d+")
+SIGNATURE_TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|[^\sA-Za-z0-9_]")
+DEFAULT_RENAME_THRESHOLD = 0.6
+# Blocks with more candidates than this on either side are too ambiguous to pair.
+MAX_RENAME_BLOCK = 64
+# Modifiers that change when a member moves along an inheritance chain.
+RENAME_IGNORED_MODIFIERS = frozenset({"abstract", "new", "override", "partial", "sealed", "virtual"})
 DIAGNOSTIC_LABELS = {
     "CP0001": "missing public type",
     "CP0002": "missing public member",
@@ -80,14 +89,6 @@ DIAGNOSTIC_LABELS = {
 }
 
 
-@dataclass(frozen=True)
-class TypeScope:
-    name: str
-    is_public: bool
-    is_interface: bool
-    brace_depth: int
-
-
 @dataclass(frozen=True)
 class ApiItem:
     area: str
@@ -106,6 +107,19 @@ class ApiItem:
     def unique_key(self) -> tuple[str | None, str | None, str]:
         return (self.namespace, self.container, self.signature)
 
+    @property
+    def doc_id_key(self) -> str:
+        """`Namespace.Container.Symbol`, comparable with `doc_id_key_for_target`."""
+        return ".".join(part for part in (self.namespace, self.container, self.symbol) if part)
+
+
+@dataclass(frozen=True)
+class RenameCandidate:
+    removed: ApiItem
+    added: ApiItem
+    relation: str
+    score: float
+
 
 @dataclass(frozen=True)
 class SuppressionEntry:
@@ -121,10 +135,46 @@ class SuppressionEntry:
         return TARGET_KIND_LABELS.get(prefix, "symbol")
 
 
-def normalize_package_name(path: pathlib.Path) -> str:
+def normalize_package_name(path: pathlib.PurePath) -> str:
     return path.name.replace(".nupkg.xml", "")
 
 
+def doc_id_key_for_target(target: str) -> str | None:
+    """Reduce a doc-comment ID (`M:Avalonia.Controls.Window.Show(System.Boolean)`) to an `ApiItem.doc_id_key`.
+
+    Parameters and generic arity are dropped, so all overloads of a member share a
+    key; constructors, indexers and operators map to the symbols the parser records.
+    """
+    prefix, separator, name = target.partition(":")
+    if not separator or prefix not in TARGET_KIND_LABELS:
+        return None
+
+    name, _, return_type = name.partition("~")
+    name, paren, _ = name.partition("(")
+    owner, _, member = GENERIC_ARITY_RE.sub("", name).rpartition(".")
+    if prefix == "T":
+        return f"{owner}.{member}" if owner else member
+    if not owner:
+        return None
+
+    if member == "#ctor":
+        member = owner.rsplit(".", 1)[-1]
+    elif prefix == "P" and member == "Item" and paren:
+        member = "this[]"
+    elif member in ("op_Implicit", "op_Explicit") and return_type:
+        member = GENERIC_ARITY_RE.sub("", return_type).split("{", 1)[0].rsplit(".", 1)[-1]
+    else:
+        member = OPERATOR_METADATA_NAMES.get(member, member)
+    return f"{owner}.{member}"
+
+
+def index_by_doc_id(items: Iterable[ApiItem]) -> dict[str, list[ApiItem]]:
+    index: dict[str, list[ApiItem]] = defaultdict(list)
+    for item in items:
+        index[item.doc_id_key].append(item)
+    return index
+
+
 def normalize_target_name(target: str) -> str:
     if ":" not in target:
         return target
@@ -133,251 +183,142 @@ def normalize_target_name(target: str) -> str:
 
 
 def parse_suppressions(api_dir: pathlib.Path) -> list[SuppressionEntry]:
-    entries: list[SuppressionEntry] = []
-
-    for path in sorted(api_dir.glob("*.xml")):
-        package = normalize_package_name(path)
-        root = ET.fromstring(path.read_text(encoding="utf-8"))
-
-        for node in root.findall("Suppression"):
-            diagnostic_id = (node.findtext("DiagnosticId") or "").strip()
-            target = (node.findtext("Target") or "").strip()
-            left = (node.findtext("Left") or "").strip()
-            right = (node.findtext("Right") or "").strip()
-
-            if not diagnostic_id or not target:
-                continue
-
-            entries.append(
-                SuppressionEntry(
-                    package=package,
-                    diagnostic_id=diagnostic_id,
-                    target=target,
-                    left=left,
-                    right=right,
-                )
-            )
-
-    deduped: list[SuppressionEntry] = []
-    seen: set[tuple[str, str, str]] = set()
+    paths = FilesystemTreeReader(api_dir).list_files(["*.xml"])
+    return merge_suppressions(iter_suppressions(api_dir / rel) for rel in paths)
+
+
+def parse_suppression_documents(
+    documents: Iterable[tuple[str, bytes]],
+    jobs: int = 1,
+) -> list[SuppressionEntry]:
+    """Parse `(relative path, content)` suppression files, in `jobs` worker processes if > 1."""
+    if jobs <= 1:
+        return merge_suppressions(parse_suppression_document(rel, data) for rel, data in documents)
+
+    documents = list(documents)
+    if len(documents) < 2:
+        return merge_suppressions(parse_suppression_document(rel, data) for rel, data in documents)
+    rels = [rel for rel, _ in documents]
+    datas = [data for _, data in documents]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(documents))) as executor:
+        return merge_suppressions(executor.map(parse_suppression_document, rels, datas))
+
+
+def parse_suppression_document(rel: str, data: bytes) -> list[SuppressionEntry]:
+    return list(iter_suppressions(pathlib.PurePosixPath(rel), io.BytesIO(data)))
+
+
+def iter_suppressions(
+    path: pathlib.PurePath,
+    source: io.BufferedIOBase | None = None,
+) -> Iterator[SuppressionEntry]:
+    """Stream the top-level `<Suppression>` entries of one file, skipping duplicates.
+
+    Reads `source` (or `path` itself) with `iterparse` and clears every entry once it
+    has been read, so memory does not grow with the file. The package name comes
+    from the file name.
+    """
+    package = normalize_package_name(path)
+    seen: set[tuple[str, str]] = set()
+    depth = 0
+    root: ET.Element | None = None
 
-    for entry in entries:
-        key = (entry.package, entry.diagnostic_id, entry.target)
-        if key in seen:
+    for event, node in ET.iterparse(source if source is not None else os.fspath(path), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = node
+            depth += 1
             continue
-        seen.add(key)
-        deduped.append(entry)
 
-    return deduped
+        depth -= 1
+        if depth != 1 or node.tag != "Suppression":
+            continue
 
+        diagnostic_id = (node.findtext("DiagnosticId") or "").strip()
+        target = (node.findtext("Target") or "").strip()
+        if diagnostic_id and target and (diagnostic_id, target) not in seen:
+            seen.add((diagnostic_id, target))
+            yield SuppressionEntry(
+                package=package,
+                diagnostic_id=diagnostic_id,
+                target=target,
+                left=(node.findtext("Left") or "").strip(),
+                right=(node.findtext("Right") or "").strip(),
+            )
+        root.clear()
 
-def append_api_item(
-    items: list[ApiItem],
-    repo: pathlib.Path,
-    path: pathlib.Path,
-    namespace: str | None,
-    container: str | None,
-    signature: str,
-) -> None:
-    kind, symbol = parse_signature(signature)
-    if not symbol:
-        return
 
-    rel = path.relative_to(repo).as_posix()
-    items.append(
-        ApiItem(
-            area=area_for(rel),
-            source_file=rel,
-            namespace=namespace,
-            container=container,
-            kind=kind,
-            symbol=symbol,
-            signature=signature,
-        )
-    )
+def merge_suppressions(documents: Iterable[Iterable[SuppressionEntry]]) -> list[SuppressionEntry]:
+    """Concatenate per-file entries in order, keeping the first entry per package/diagnostic/target."""
+    entries: list[SuppressionEntry] = []
+    seen: set[tuple[str, str, str]] = set()
 
+    for document in documents:
+        for entry in document:
+            key = (entry.package, entry.diagnostic_id, entry.target)
+            if key in seen:
+                continue
+            seen.add(key)
+            entries.append(entry)
 
-def is_implicit_interface_member_start(line: str, stripped: str, scope: TypeScope | None) -> bool:
-    if scope is None or not (scope.is_public and scope.is_interface):
-        return False
-    if stripped.startswith(("[", "}", "#")) or stripped.startswith("public:"):
-        return False
-    return ACCESS_MODIFIER_RE.match(line) is None and DECLARATION_START_RE.match(line) is not None
+    return entries
 
 
 def extract_api_items(repo: pathlib.Path, path: pathlib.Path) -> list[ApiItem]:
-    items: list[ApiItem] = []
-    namespace: str | None = None
-    in_block = False
-    depth = 0
-    type_stack: list[TypeScope] = []
-    pending_type: dict[str, object] | None = None
-    pending_sig: dict[str, object] | None = None
+    return parse_api_items(path.relative_to(repo).as_posix(), decode_source(path.read_bytes()))
 
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except UnicodeDecodeError:
-        return items
 
-    for raw in lines:
-        line, in_block = strip_comments(raw, in_block)
-        if not line.strip():
-            continue
+def parse_api_items(rel: str, text: str | None) -> list[ApiItem]:
+    return render_api_items(rel, parse_source(text))
 
-        ns_match = NAMESPACE_RE.match(line)
-        if ns_match:
-            namespace = ns_match.group(1)
-
-        clean = sanitize_for_braces(line)
-        stripped = line.lstrip()
-
-        if pending_type is not None:
-            pending_type["parts"].append(line)
-            pending_type["clean_parts"].append(clean)
-
-            if "{" in clean or ";" in clean:
-                combined = normalize_signature(" ".join(pending_type["parts"]))
-                access = str(pending_type["access"])
-                parent_public = type_stack[-1].is_public if type_stack else True
-                is_public = access == "public" and parent_public
-                namespace_at_start = pending_type["namespace"]
-                container_names = pending_type["container"]
-                container = ".".join(container_names) if container_names else None
-
-                if is_public:
-                    append_api_item(
-                        items,
-                        repo,
-                        path,
-                        namespace_at_start,
-                        container,
-                        combined,
-                    )
 
-                kind, symbol = parse_signature(combined)
-                if kind == "type" and "{" in clean:
-                    type_stack.append(
-                        TypeScope(
-                            name=symbol,
-                            is_public=is_public,
-                            is_interface=bool(type_start and type_start.group(2) == "interface"),
-                            brace_depth=depth + 1,
-                        )
-                    )
-                pending_type = None
-        else:
-            type_start = TYPE_START_RE.match(line)
-            delegate_start = DELEGATE_START_RE.match(line)
-
-            if type_start or delegate_start:
-                access = (type_start or delegate_start).group(1)
-                is_interface = bool(type_start and type_start.group(2) == "interface")
-                pending_type = {
-                    "access": access,
-                    "is_interface": is_interface,
-                    "parts": [line],
-                    "clean_parts": [clean],
-                    "namespace": namespace,
-                    "container": tuple(scope.name for scope in type_stack if scope.is_public),
-                }
-
-                if "{" in clean or ";" in clean:
-                    combined = normalize_signature(" ".join(pending_type["parts"]))
-                    access = str(pending_type["access"])
-                    parent_public = type_stack[-1].is_public if type_stack else True
-                    is_public = access == "public" and parent_public
-                    namespace_at_start = pending_type["namespace"]
-                    container_names = pending_type["container"]
-                    container = ".".join(container_names) if container_names else None
-
-                    if is_public:
-                        append_api_item(
-                            items,
-                            repo,
-                            path,
-                            namespace_at_start,
-                            container,
-                            combined,
-                        )
-
-                    kind, symbol = parse_signature(combined)
-                    if kind == "type" and "{" in clean:
-                        type_stack.append(
-                            TypeScope(
-                                name=symbol,
-                                is_public=is_public,
-                                is_interface=bool(pending_type["is_interface"]),
-                                brace_depth=depth + 1,
-                            )
-                        )
-                    pending_type = None
-            else:
-                current_scope = type_stack[-1] if type_stack else None
-                innermost_public = current_scope.is_public if current_scope else False
-                member_depth = current_scope.brace_depth if current_scope else -1
-
-                if pending_sig is None:
-                    if (
-                        innermost_public
-                        and depth == member_depth
-                        and (PUBLIC_RE.match(line) or is_implicit_interface_member_start(line, stripped, current_scope))
-                        and not stripped.startswith("public:")
-                    ):
-                        container_names = tuple(scope.name for scope in type_stack if scope.is_public)
-                        pending_sig = {
-                            "parts": [line],
-                            "namespace": namespace,
-                            "container": container_names,
-                        }
-                        combined = normalize_signature(line)
-                        if declaration_terminated(combined):
-                            append_api_item(
-                                items,
-                                repo,
-                                path,
-                                pending_sig["namespace"],
-                                ".".join(pending_sig["container"]) if pending_sig["container"] else None,
-                                combined,
-                            )
-                            pending_sig = None
-                else:
-                    pending_sig["parts"].append(line)
-                    combined = normalize_signature(" ".join(pending_sig["parts"]))
-                    if declaration_terminated(combined):
-                        append_api_item(
-                            items,
-                            repo,
-                            path,
-                            pending_sig["namespace"],
-                            ".".join(pending_sig["container"]) if pending_sig["container"] else None,
-                            combined,
-                        )
-                        pending_sig = None
-
-        depth += clean.count("{")
-        depth -= clean.count("}")
-
-        while type_stack and depth < type_stack[-1].brace_depth:
-            type_stack.pop()
-
-    if pending_sig is not None:
-        append_api_item(
-            items,
-            repo,
-            path,
-            pending_sig["namespace"],
-            ".".join(pending_sig["container"]) if pending_sig["container"] else None,
-            normalize_signature(" ".join(pending_sig["parts"])),
+def render_api_items(rel: str, parsed: ParsedSource) -> list[ApiItem]:
+    """Migration view of a parsed file: one item per public declaration with a symbol."""
+    area = area_for(rel)
+    return [
+        ApiItem(
+            area=area,
+            source_file=rel,
+            namespace=item.namespace,
+            container=item.container,
+            kind=item.kind,
+            symbol=item.symbol,
+            signature=item.signature,
         )
-
-    return items
-
-
-def scan_api_items(repo: pathlib.Path) -> list[ApiItem]:
-    items: list[ApiItem] = []
-    for path in resolve_files(repo, DEFAULT_PATTERNS):
-        items.extend(extract_api_items(repo, path))
-
+        for item in parsed.declarations
+        if item.symbol
+    ]
+
+
+def scan_api_items(
+    tree: TreeReader,
+    cache: ParseCache | None = None,
+    files: list[str] | None = None,
+    jobs: int = 1,
+) -> list[ApiItem]:
+    return scan_api_item_sets([(tree, files)], cache, jobs)[0]
+
+
+def scan_api_item_sets(
+    sides: list[tuple[TreeReader, list[str] | None]],
+    cache: ParseCache | None = None,
+    jobs: int = 1,
+) -> list[list[ApiItem]]:
+    """Scan several trees in one pass (see `scan_trees`); `None` scans all of `DEFAULT_PATTERNS`."""
+    with phase("list files"):
+        requests = [(tree, tree.list_files(DEFAULT_PATTERNS) if files is None else files) for tree, files in sides]
+    with phase("parse sources"):
+        parsed_sets = scan_trees(requests, jobs, cache)
+    item_sets: list[list[ApiItem]] = []
+    for (_, files), parsed_files in zip(requests, parsed_sets):
+        items: list[ApiItem] = []
+        for rel, parsed in zip(files, parsed_files):
+            items.extend(render_api_items(rel, parsed))
+        item_sets.append(dedupe_items(items))
+    return item_sets
+
+
+def dedupe_items(items: list[ApiItem]) -> list[ApiItem]:
     deduped: list[ApiItem] = []
     seen: set[tuple[str | None, str | None, str]] = set()
     for item in items:
@@ -399,52 +340,378 @@ def diff_removed_items(old_items: list[ApiItem], new_items: list[ApiItem]) -> li
     return [item for item in old_items if item.unique_key not in new_keys]
 
 
-def build_breaking_summary(entries: list[SuppressionEntry]) -> list[str]:
-    lines: list[str] = []
+def declaration_head(signature: str) -> str:
+    """The signature up to its body, initializer or expression body."""
+    depth = 0
+    for index, ch in enumerate(signature):
+        if ch in "([<":
+            depth += 1
+        elif ch in ")]>" and depth > 0 and not signature.startswith("=>", index - 1):
+            depth -= 1
+        elif depth == 0 and (ch in "{;" or ch == "="):
+            return signature[:index].rstrip()
+    return signature
+
+
+def signature_shape(item: ApiItem) -> str:
+    """The declaration head with the declared name masked and inheritance modifiers dropped.
+
+    Initializers are cut off because they often name the declaring type
+    (`AvaloniaProperty.Register<Owner, T>`), which changes when a member moves.
+    """
+    pattern = rf"(?<![A-Za-z0-9_]){re.escape(item.symbol)}(?![A-Za-z0-9_])"
+    head = re.sub(pattern, "\N{SECTION SIGN}", declaration_head(item.signature), count=1)
+    return " ".join(word for word in head.split() if word not in RENAME_IGNORED_MODIFIERS)
+
+
+def rename_features(item: ApiItem, shape: str) -> frozenset[str]:
+    """Shingles compared by `detect_renames`: place segments, name trigrams and shape tokens."""
+    features = {f"p:{part}" for part in f"{item.namespace or ''}.{item.container or ''}".split(".") if part}
+    name = f"^{item.symbol.lower()}$"
+    features.update(f"n:{name[i : i + 3]}" for i in range(len(name) - 2))
+    features.update(f"s:{token}" for token in SIGNATURE_TOKEN_RE.findall(shape))
+    return frozenset(features)
+
+
+def jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left and not right:
+        return 1.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def is_rename_or_move(removed: ApiItem, added: ApiItem) -> bool:
+    # Same name in the same place is a changed signature, which the diff already shows.
+    return removed.symbol != added.symbol or (removed.namespace, removed.container) != (added.namespace, added.container)
+
+
+def member_place(item: ApiItem) -> tuple[str | None, str | None, str]:
+    return (item.namespace, item.container, item.symbol)
+
+
+def declared_places(items: Iterable[ApiItem]) -> set[tuple[str | None, str]]:
+    """`(namespace, container)` of every type that declares or is one of `items`."""
+    places: set[tuple[str | None, str]] = set()
+    for item in items:
+        if item.container is not None:
+            places.add((item.namespace, item.container))
+        if item.kind == "type":
+            places.add((item.namespace, f"{item.container}.{item.symbol}" if item.container else item.symbol))
+    return places
+
+
+def detect_renames(
+    removed_items: list[ApiItem],
+    added_items: list[ApiItem],
+    threshold: float = DEFAULT_RENAME_THRESHOLD,
+) -> list[RenameCandidate]:
+    """Pair removed with added items that look like renames or moves.
+
+    Items whose name stays in the same place on both sides only changed their
+    signature and are left out. The rest are only compared within two blocking
+    keys: same kind, place and `signature_shape` under another name (a rename), or
+    same kind and name in another container or namespace (a move). A member only
+    counts as moved when its old container declares nothing on the added side.
+    Each candidate pair is scored by the Jaccard similarity of `rename_features`,
+    and pairs are accepted greedily by score, so every item appears in at most one
+    pair.
+    """
+    removed_shapes = [signature_shape(item) for item in removed_items]
+    added_shapes = [signature_shape(item) for item in added_items]
+    in_place = {member_place(item) for item in removed_items} & {member_place(item) for item in added_items}
+    added_places = declared_places(added_items)
+    blocks: dict[tuple[object, ...], tuple[list[int], list[int]]] = defaultdict(lambda: ([], []))
+
+    for side, items, shapes in ((0, removed_items, removed_shapes), (1, added_items, added_shapes)):
+        for index, (item, shape) in enumerate(zip(items, shapes)):
+            if member_place(item) in in_place:
+                continue
+            blocks[("rename", item.kind, item.namespace, item.container, shape)][side].append(index)
+            if side == 1 or item.container is None or (item.namespace, item.container) not in added_places:
+                blocks[("move", item.kind, item.symbol)][side].append(index)
+
+    removed_features: dict[int, frozenset[str]] = {}
+    added_features: dict[int, frozenset[str]] = {}
+    scored: list[tuple[float, str, int, int]] = []
+    for key, (removed_indexes, added_indexes) in blocks.items():
+        if not removed_indexes or not added_indexes:
+            continue
+        if len(removed_indexes) > MAX_RENAME_BLOCK or len(added_indexes) > MAX_RENAME_BLOCK:
+            continue
+        for removed_index in removed_indexes:
+            left = removed_features.get(removed_index)
+            if left is None:
+                left = removed_features[removed_index] = rename_features(
+                    removed_items[removed_index], removed_shapes[removed_index]
+                )
+            for added_index in added_indexes:
+                if not is_rename_or_move(removed_items[removed_index], added_items[added_index]):
+                    continue
+                right = added_features.get(added_index)
+                if right is None:
+                    right = added_features[added_index] = rename_features(
+                        added_items[added_index], added_shapes[added_index]
+                    )
+                score = jaccard(left, right)
+                if score >= threshold:
+                    scored.append((score, str(key[0]), removed_index, added_index))
+
+    candidates: list[RenameCandidate] = []
+    paired_removed: set[int] = set()
+    paired_added: set[int] = set()
+    for score, relation, removed_index, added_index in sorted(scored, key=lambda entry: (-entry[0], entry[2], entry[3])):
+        if removed_index in paired_removed or added_index in paired_added:
+            continue
+        paired_removed.add(removed_index)
+        paired_added.add(added_index)
+        candidates.append(
+            RenameCandidate(
+                removed=removed_items[removed_index],
+                added=added_items[added_index],
+                relation=relation,
+                score=score,
+            )
+        )
+    return candidates
+
+
+def changed_paths(repo: pathlib.Path, from_ref: str, to_ref: str) -> set[str]:
+    """Repo-relative paths whose content or mode differs between the two refs."""
+    result = subprocess.run(
+        ["git", "-C", str(repo), "diff", "--name-only", "--no-renames", "-z", from_ref, to_ref, "--"],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"failed to list changes between '{from_ref}' and '{to_ref}': {message}")
+    return {name.decode("utf-8", errors="surrogateescape") for name in result.stdout.split(b"\0") if name}
+
+
+def paths_mentioning(repo: pathlib.Path, git_ref: str, needles: Iterable[str], patterns: list[str]) -> set[str]:
+    """Paths under `patterns` at `git_ref` whose content contains any of the fixed strings."""
+    fixed_strings = sorted(set(needles))
+    if not fixed_strings:
+        return set()
+
+    result = subprocess.run(
+        [
+            "git", "-C", str(repo), "grep", "-l", "-z", "-F", "-f", "-", git_ref, "--",
+            *(f":(glob){pattern}" for pattern in patterns),
+        ],
+        input="\n".join(fixed_strings).encode("utf-8"),
+        capture_output=True,
+    )
+    # git grep exits with 1 when nothing matched.
+    if result.returncode not in (0, 1):
+        message = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"failed to search '{git_ref}': {message}")
+
+    prefix = f"{git_ref}:".encode("utf-8")
+    return {
+        name.removeprefix(prefix).decode("utf-8", errors="surrogateescape")
+        for name in result.stdout.split(b"\0")
+        if name
+    }
+
+
+def literal_parts(item: ApiItem) -> tuple[str, ...]:
+    """Strings that occur verbatim in any source file declaring `item`.
+
+    Symbols, container names and namespaces are copied from identifiers in the
+    source; only the indexer symbol is a placeholder.
+    """
+    parts = ["this" if item.symbol == "this[]" else item.symbol]
+    if item.container:
+        parts.extend(item.container.split("."))
+    if item.namespace:
+        parts.append(item.namespace)
+    return tuple(parts)
+
+
+def diff_changed_api_items(
+    repo: pathlib.Path,
+    from_ref: str,
+    to_ref: str,
+    from_tree: TreeReader,
+    to_tree: TreeReader,
+    cache: ParseCache | None = None,
+    jobs: int = 1,
+) -> tuple[list[ApiItem], list[ApiItem]]:
+    """Return (added, removed) like a full diff, parsing only files that changed between the refs.
+
+    Unchanged files hold the same items on both sides, so they only matter for a
+    changed-file item whose signature also appears in one of them (e.g. in another
+    part of a partial class). Such files are found with `git grep` on the symbols of
+    the candidate items, narrowed to files containing every literal part of some
+    candidate, and parsed to drop those items.
+    """
+    with phase("git diff"):
+        changed = changed_paths(repo, from_ref, to_ref)
+    new_files = to_tree.list_files(DEFAULT_PATTERNS)
+    old_items, new_items = scan_api_item_sets(
+        [
+            (from_tree, [rel for rel in from_tree.list_files(DEFAULT_PATTERNS) if rel in changed]),
+            (to_tree, [rel for rel in new_files if rel in changed]),
+        ],
+        cache,
+        jobs,
+    )
+    added_items = diff_added_items(old_items, new_items)
+    removed_items = diff_removed_items(old_items, new_items)
+
+    with phase("find shared files"):
+        candidates = {literal_parts(item) for item in [*added_items, *removed_items]}
+        mentioning = paths_mentioning(repo, to_ref, (parts[0] for parts in candidates), DEFAULT_PATTERNS)
+        encoded = [tuple(part.encode("utf-8") for part in parts) for parts in candidates]
+        unchanged: list[str] = []
+        for rel in new_files:
+            if rel not in mentioning or rel in changed:
+                continue
+            data = to_tree.read_bytes(rel)
+            if any(all(part in data for part in parts) for parts in encoded):
+                unchanged.append(rel)
+    shared_keys = {item.unique_key for item in scan_api_items(to_tree, cache, unchanged, jobs)}
+
+    return (
+        [item for item in added_items if item.unique_key not in shared_keys],
+        [item for item in removed_items if item.unique_key not in shared_keys],
+    )
+
+
+def diff_api_items(
+    repo: pathlib.Path,
+    from_ref: str,
+    to_ref: str,
+    from_tree: TreeReader,
+    to_tree: TreeReader,
+    cache: ParseCache | None,
+    jobs: int,
+    changed_only: bool,
+    concurrent: bool,
+) -> tuple[list[ApiItem], list[ApiItem]]:
+    """Return (added, removed) public API items between the two trees."""
+    if changed_only:
+        return diff_changed_api_items(repo, from_ref, to_ref, from_tree, to_tree, cache, jobs)
+
+    if concurrent:
+        old_items, new_items = scan_api_item_sets([(from_tree, None), (to_tree, None)], cache, jobs)
+    else:
+        old_items = scan_api_items(from_tree, cache, jobs=jobs)
+        new_items = scan_api_items(to_tree, cache, jobs=jobs)
+    return diff_added_items(old_items, new_items), diff_removed_items(old_items, new_items)
+
+
+def prepare_refs_concurrently(
+    repo: pathlib.Path,
+    git_refs: list[str],
+    backend: str,
+) -> list[tuple[TreeReader, str, Callable[[], None]]]:
+    """Run `prepare_scan_repo` for every ref in parallel threads.
+
+    If any ref fails, the refs that were prepared are cleaned up before the first
+    failure (in `git_refs` order) is re-raised.
+    """
+    with ThreadPoolExecutor(max_workers=len(git_refs)) as executor:
+        futures = [executor.submit(prepare_scan_repo, repo, git_ref, backend) for git_ref in git_refs]
+
+    prepared = [future.result() for future in futures if future.exception() is None]
+    if len(prepared) < len(futures):
+        for _, _, cleanup in prepared:
+            cleanup()
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+    return prepared
+
+
+def build_breaking_summary(
+    entries: list[SuppressionEntry],
+    removed_items: Iterable[ApiItem] = (),
+    added_items: Iterable[ApiItem] = (),
+) -> Iterator[str]:
+    """Render the suppression-backed breaking changes.
+
+    Each suppression is joined on its doc-comment ID key to the parser-view removed
+    (`before`) and added (`after`) signatures of the same member, via one hash index
+    per side.
+    """
+    before_index = index_by_doc_id(removed_items)
+    after_index = index_by_doc_id(added_items)
+    links: dict[str, tuple[list[ApiItem], list[ApiItem]]] = {}
+    for entry in entries:
+        key = doc_id_key_for_target(entry.target)
+        if key is not None and (key in before_index or key in after_index):
+            links[entry.target] = (before_index.get(key, []), after_index.get(key, []))
+
     package_counts = Counter(entry.package for entry in entries)
     diagnostic_counts = Counter(entry.diagnostic_id for entry in entries)
 
-    lines.append("## Breaking Change Summary")
-    lines.append("")
-    lines.append("Official breaking-change source: Avalonia `api/*.xml` package-validation suppressions.")
-    lines.append("")
-    lines.append(f"- Unique approved compatibility suppressions: `{len(entries)}`")
-    lines.append("")
-    lines.append("### By Package")
-    lines.append("")
+    yield "## Breaking Change Summary"
+    yield ""
+    yield "Official breaking-change source: Avalonia `api/*.xml` package-validation suppressions."
+    yield ""
+    yield f"- Unique approved compatibility suppressions: `{len(entries)}`"
+    yield f"- Suppressions linked to changed source signatures: `{sum(entry.target in links for entry in entries)}`"
+    yield ""
+    yield "### By Package"
+    yield ""
     for package, count in sorted(package_counts.items()):
-        lines.append(f"- `{package}`: `{count}`")
-    lines.append("")
-    lines.append("### By Diagnostic")
-    lines.append("")
+        yield f"- `{package}`: `{count}`"
+    yield ""
+    yield "### By Diagnostic"
+    yield ""
     for diagnostic_id, count in sorted(diagnostic_counts.items()):
         label = DIAGNOSTIC_LABELS.get(diagnostic_id, "other compatibility change")
-        lines.append(f"- `{diagnostic_id}` ({label}): `{count}`")
-    lines.append("")
+        yield f"- `{diagnostic_id}` ({label}): `{count}`"
+    yield ""
 
     grouped: dict[str, dict[str, list[SuppressionEntry]]] = defaultdict(lambda: defaultdict(list))
     for entry in entries:
         grouped[entry.package][entry.diagnostic_id].append(entry)
 
     for package in sorted(grouped.keys()):
-        lines.append(f"## Breaking Changes: `{package}`")
-        lines.append("")
+        yield f"## Breaking Changes: `{package}`"
+        yield ""
         for diagnostic_id in sorted(grouped[package].keys()):
             label = DIAGNOSTIC_LABELS.get(diagnostic_id, "other compatibility change")
-            lines.append(f"### `{diagnostic_id}`: {label}")
-            lines.append("")
+            yield f"### `{diagnostic_id}`: {label}"
+            yield ""
             for entry in sorted(grouped[package][diagnostic_id], key=lambda item: item.target):
-                lines.append(
+                yield (
                     f"- `{normalize_target_name(entry.target)}` "
                     f"({entry.target_kind}; baseline `{entry.left}` -> current `{entry.right}`)"
                 )
-            lines.append("")
-
-    return lines
+                before, after = links.get(entry.target, ((), ()))
+                for label, items in (("before", before), ("after", after)):
+                    for signature in sorted({item.signature for item in items}):
+                        yield f"  - {label}: `{signature}`"
+            yield ""
+
+
+def build_rename_section(candidates: list[RenameCandidate]) -> Iterator[str]:
+    relation_counts = Counter(candidate.relation for candidate in candidates)
+
+    yield "## Likely Renames and Moves (Parser View)"
+    yield ""
+    yield "Removed signatures paired with a similar added signature; review before treating them as replacements."
+    yield ""
+    yield f"- Candidate pairs: `{len(candidates)}`"
+    for relation, count in sorted(relation_counts.items()):
+        yield f"- `{relation}`: `{count}`"
+    yield ""
+    for candidate in sorted(candidates, key=lambda current: (current.removed.doc_id_key, current.added.doc_id_key)):
+        yield (
+            f"- `{candidate.removed.doc_id_key}` -> `{candidate.added.doc_id_key}` "
+            f"({candidate.relation}, score {candidate.score:.2f})"
+        )
+        yield f"  - before: `{candidate.removed.signature}`"
+        yield f"  - after: `{candidate.added.signature}`"
+    if candidates:
+        yield ""
 
 
-def build_added_api_section(title: str, items: list[ApiItem]) -> list[str]:
-    lines: list[str] = []
+def build_added_api_section(title: str, items: list[ApiItem]) -> Iterator[str]:
     area_counts = Counter(item.area for item in items)
     kind_counts = Counter(item.kind for item in items)
     items_by_area: dict[str, dict[str, list[ApiItem]]] = defaultdict(lambda: defaultdict(list))
@@ -452,38 +719,36 @@ def build_added_api_section(title: str, items: list[ApiItem]) -> list[str]:
     for item in items:
         items_by_area[item.area][item.source_file].append(item)
 
-    lines.append(f"## {title}")
-    lines.append("")
-    lines.append(f"- Public signatures: `{len(items)}`")
-    lines.append("")
-    lines.append("### By Area")
-    lines.append("")
+    yield f"## {title}"
+    yield ""
+    yield f"- Public signatures: `{len(items)}`"
+    yield ""
+    yield "### By Area"
+    yield ""
     for area, count in sorted(area_counts.items()):
-        lines.append(f"- `{area}`: `{count}`")
-    lines.append("")
-    lines.append("### By Kind")
-    lines.append("")
+        yield f"- `{area}`: `{count}`"
+    yield ""
+    yield "### By Kind"
+    yield ""
     for kind, count in sorted(kind_counts.items()):
-        lines.append(f"- `{kind}`: `{count}`")
-    lines.append("")
+        yield f"- `{kind}`: `{count}`"
+    yield ""
 
     for area in sorted(items_by_area.keys()):
-        lines.append(f"### {area}")
-        lines.append("")
+        yield f"### {area}"
+        yield ""
         for source_file in sorted(items_by_area[area].keys()):
-            lines.append(f"#### `{source_file}`")
-            lines.append("")
+            yield f"#### `{source_file}`"
+            yield ""
             namespaces = sorted({item.namespace for item in items_by_area[area][source_file] if item.namespace})
             if namespaces:
-                lines.append(f"- Namespace(s): `{', '.join(namespaces)}`")
+                yield f"- Namespace(s): `{', '.join(namespaces)}`"
             for item in sorted(items_by_area[area][source_file], key=lambda current: current.signature):
                 if item.container:
-                    lines.append(f"- `{item.container}` -> `{item.signature}`")
+                    yield f"- `{item.container}` -> `{item.signature}`"
                 else:
-                    lines.append(f"- `{item.signature}`")
-            lines.append("")
-
-    return lines
+                    yield f"- `{item.signature}`"
+            yield ""
 
 
 def write_report(
@@ -494,29 +759,45 @@ def write_report(
     suppressions: list[SuppressionEntry],
     added_items: list[ApiItem],
     removed_items: list[ApiItem],
+    renames: list[RenameCandidate] | None = None,
 ) -> None:
+    write_lines_atomic(
+        output,
+        iter_report_lines(repo, from_ref, to_ref, suppressions, added_items, removed_items, renames),
+    )
+
+
+def iter_report_lines(
+    repo: pathlib.Path,
+    from_ref: str,
+    to_ref: str,
+    suppressions: list[SuppressionEntry],
+    added_items: list[ApiItem],
+    removed_items: list[ApiItem],
+    renames: list[RenameCandidate] | None = None,
+) -> Iterator[str]:
     now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
-    lines: list[str] = []
-    lines.append("# Avalonia Migration Report (Generated)")
-    lines.append("")
-    lines.append(f"- Generated at (UTC): `{now}`")
-    lines.append(f"- Repository: `{repo}`")
-    lines.append(f"- From ref: `{from_ref}`")
-    lines.append(f"- To ref: `{to_ref}`")
-    lines.append("")
-    lines.append("## Coverage Contract")
-    lines.append("")
-    lines.append("- Breaking changes come from Avalonia's checked-in package-validation suppression files under `api/*.xml`.")
-    lines.append("- Added public APIs come from a source-level scan of public signatures under `src/**/*.cs`.")
-    lines.append("- Removed public signatures are included as an auxiliary parser-based view; treat the suppression-backed section as the official breaking-change list for shipped packages.")
-    lines.append("")
-
-    lines.extend(build_breaking_summary(suppressions))
-    lines.extend(build_added_api_section("Added Public APIs", added_items))
-    lines.extend(build_added_api_section("Removed Public Signatures (Parser View)", removed_items))
-
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text("\n".join(lines), encoding="utf-8")
+    yield "# Avalonia Migration Report (Generated)"
+    yield ""
+    yield f"- Generated at (UTC): `{now}`"
+    yield f"- Repository: `{repo}`"
+    yield f"- From ref: `{from_ref}`"
+    yield f"- To ref: `{to_ref}`"
+    yield ""
+    yield "## Coverage Contract"
+    yield ""
+    yield "- Breaking changes come from Avalonia's checked-in package-validation suppression files under `api/*.xml`."
+    yield "- Added public APIs come from a source-level scan of public signatures under `src/**/*.cs`."
+    yield "- Removed public signatures are included as an auxiliary parser-based view; treat the suppression-backed section as the official breaking-change list for shipped packages."
+    yield "- Likely renames and moves pair removed with added signatures by name and signature similarity; they are hints, not part of either list."
+    yield ""
+
+    yield from build_breaking_summary(suppressions, removed_items, added_items)
+    if renames is None:
+        renames = detect_renames(removed_items, added_items)
+    yield from build_rename_section(renames)
+    yield from build_added_api_section("Added Public APIs", added_items)
+    yield from build_added_api_section("Removed Public Signatures (Parser View)", removed_items)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -525,13 +806,51 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--from-ref", required=True, help="Baseline ref, tag, or commit.")
     parser.add_argument("--to-ref", required=True, help="Target ref, tag, or commit.")
     parser.add_argument("--output", required=True, help="Output markdown path.")
+    parser.add_argument(
+        "--scan-backend",
+        choices=SCAN_BACKENDS,
+        default="git",
+        help="Read refs from the git object database ('git') or from temporary detached worktrees ('worktree').",
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help=(
+            "Parse only the source files that differ between the refs (per git diff) "
+            "instead of both full trees; the added/removed lists are the same."
+        ),
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help=(
+            "Prepare both refs in parallel, read both trees in parallel, parse them in one pool "
+            "of worker processes and parse the api/*.xml suppressions in a thread meanwhile."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes used to parse files (0 = one per CPU; default 1, or 0 with --concurrent).",
+    )
+    parser.add_argument(
+        "--rename-threshold",
+        type=float,
+        default=DEFAULT_RENAME_THRESHOLD,
+        help=f"Minimum similarity (0-1) for a removed/added pair to be listed as a likely rename or move (default: {DEFAULT_RENAME_THRESHOLD}).",
+    )
+    add_cache_arguments(parser)
+    add_profile_arguments(parser)
     return parser
 
 
 def main() -> int:
-    parser = build_parser()
-    args = parser.parse_args()
+    args = build_parser().parse_args()
+    return run_profiled(args, "generate_api_migration_report", run)
 
+
+def run(args: argparse.Namespace) -> int:
     repo = pathlib.Path(args.repo).expanduser().resolve()
     output = pathlib.Path(args.output).expanduser().resolve()
 
@@ -539,46 +858,90 @@ def main() -> int:
         print(f"error: invalid repo path: {repo}", file=sys.stderr)
         return 2
 
+    if args.jobs is not None and args.jobs < 0:
+        print("error: --jobs must be zero or a positive integer", file=sys.stderr)
+        return 2
+    jobs = resolve_jobs(args.jobs if args.jobs is not None else (0 if args.concurrent else 1))
+
+    if not 0 < args.rename_threshold <= 1:
+        print("error: --rename-threshold must be greater than 0 and at most 1", file=sys.stderr)
+        return 2
+
     from_cleanup = lambda: None
     to_cleanup = lambda: None
 
     try:
-        from_repo, _, from_cleanup = prepare_scan_repo(repo, args.from_ref)
-        to_repo, _, to_cleanup = prepare_scan_repo(repo, args.to_ref)
+        with phase("prepare refs"):
+            if args.concurrent:
+                (from_tree, _, from_cleanup), (to_tree, to_label, to_cleanup) = prepare_refs_concurrently(
+                    repo, [args.from_ref, args.to_ref], args.scan_backend
+                )
+            else:
+                from_tree, _, from_cleanup = prepare_scan_repo(repo, args.from_ref, args.scan_backend)
+                to_tree, to_label, to_cleanup = prepare_scan_repo(repo, args.to_ref, args.scan_backend)
     except RuntimeError as ex:
         from_cleanup()
         to_cleanup()
         print(f"error: {ex}", file=sys.stderr)
         return 4
 
+    cache = open_cache(args)
+
     try:
-        api_dir = to_repo / "api"
-        if not api_dir.is_dir():
-            print(f"error: expected suppression directory at {api_dir}", file=sys.stderr)
+        suppression_files = to_tree.list_files(SUPPRESSION_PATTERNS)
+        if not suppression_files:
+            print(f"error: expected suppression files at {to_label}:api/*.xml", file=sys.stderr)
             return 3
 
-        suppressions = parse_suppressions(api_dir)
-        old_items = scan_api_items(from_repo)
-        new_items = scan_api_items(to_repo)
-        added_items = diff_added_items(old_items, new_items)
-        removed_items = diff_removed_items(old_items, new_items)
-        write_report(
-            output,
-            repo,
-            args.from_ref,
-            args.to_ref,
-            suppressions,
-            added_items,
-            removed_items,
-        )
+        with phase("read suppression files"):
+            suppression_documents = [(rel, to_tree.read_bytes(rel)) for rel in suppression_files]
+        scan_args = (repo, args.from_ref, args.to_ref, from_tree, to_tree, cache, jobs, args.changed_only, args.concurrent)
+        try:
+            if args.concurrent:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    # Parsed in this thread without a process pool: forking workers while the scan's
+                    # pools run would fork a multithreaded parent and exceed --jobs processes.
+                    suppressions_future = executor.submit(parse_suppression_documents, suppression_documents)
+                    with phase("diff api items"):
+                        added_items, removed_items = diff_api_items(*scan_args)
+                    with phase("wait for suppressions"):
+                        suppressions = suppressions_future.result()
+            else:
+                with phase("parse suppressions"):
+                    suppressions = parse_suppression_documents(suppression_documents, jobs)
+                with phase("diff api items"):
+                    added_items, removed_items = diff_api_items(*scan_args)
+        except RuntimeError as ex:
+            print(f"error: {ex}", file=sys.stderr)
+            return 4
+
+        with phase("detect renames"):
+            renames = detect_renames(removed_items, added_items, args.rename_threshold)
+        with phase("render and write report"):
+            write_report(
+                output,
+                repo,
+                args.from_ref,
+                args.to_ref,
+                suppressions,
+                added_items,
+                removed_items,
+                renames,
+            )
         print(
             f"Wrote {output} "
-            f"({len(suppressions)} suppressions, {len(added_items)} added signatures, {len(removed_items)} removed signatures)"
+            f"({len(suppressions)} suppressions, {len(added_items)} added signatures, {len(removed_items)} removed signatures, "
+            f"{len(renames)} likely renames/moves)"
         )
+        if cache is not None:
+            print(cache.summary())
         return 0
     finally:
-        from_cleanup()
-        to_cleanup()
+        with phase("cleanup"):
+            if cache is not None:
+                cache.close()
+            from_cleanup()
+            to_cleanup()
 
 
 if __name__ == "__main__":
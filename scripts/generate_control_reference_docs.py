@@ -1,31 +1,56 @@
 #!/usr/bin/env python3
 """Generate one reference markdown doc per Avalonia control type.
 
-The generator scans Avalonia source at a given git ref and emits docs with:
+The generator reads Avalonia source at a given git ref straight from the object
+database (one `git cat-file --batch` session, see `scripts/tree_readers.py`) and
+emits docs with:
 - basic metadata (namespace/assembly/base/source),
 - basic API list (public members declared on the type),
 - minimal XAML usage,
 - minimal C# usage.
+
+A manifest next to the docs (`.manifest.json`, ignored by git since it is local
+build state) records, per doc, a fingerprint of the source files the type was read
+from and the hash of the rendered output. With `--incremental` only docs whose
+sources changed are re-rendered, files whose content is unchanged are never
+rewritten, and docs of types that no longer exist are removed.
 """
 
 from __future__ import annotations
 
 import argparse
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import datetime as dt
+import hashlib
+import json
+import os
 import pathlib
 import re
-import subprocess
-
-TYPE_DECL_RE = re.compile(
-    r"^\s*(public|internal|private|protected)\s+"
-    r"(?P<mods>(?:new\s+|unsafe\s+|abstract\s+|sealed\s+|static\s+|partial\s+|readonly\s+|ref\s+)*)"
-    r"(?P<kind>class|interface|struct|enum|record(?:\s+class|\s+struct)?)\s+"
-    r"(?P<name>[A-Za-z_][A-Za-z0-9_`]*)"
-)
-NAMESPACE_RE = re.compile(r"^\s*namespace\s+([A-Za-z_][A-Za-z0-9_.]*)\s*(?:[;{])?\s*$")
-PUBLIC_RE = re.compile(r"^\s*public\s+")
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.csharp_declarations import ParsedSource, normalize_signature, parse_cached
+from scripts.output_files import file_sha256, write_text_if_changed
+from scripts.parse_cache import ParseCache, add_cache_arguments, content_digest, open_cache
+from scripts.profiling import add_profile_arguments, phase, record_file, run_profiled
+from scripts.tree_readers import GitTreeReader, TreeReader
+
+CONTROL_SOURCE_PATTERNS = ["src/Avalonia.Controls*/**/*.cs"]
+SOURCE_SCOPES = {
+    "controls": CONTROL_SOURCE_PATTERNS,
+    "all": ["src/**/*.cs"],
+}
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_FORMAT = "avalonia-control-docs-manifest"
+MANIFEST_VERSION = 1
+# Bump when the rendered doc layout changes, so incremental runs re-render every doc.
+DOC_RENDER_VERSION = 1
+CONTROL_ROOT_TYPES = ("Avalonia.Controls.Control", "Avalonia.Controls.TopLevel", "Avalonia.Controls.WindowBase")
 
 
 @dataclass
@@ -37,7 +62,9 @@ class TypeInfo:
     declaration: str
     is_abstract: bool
     base_names: set[str] = field(default_factory=set)
+    base_refs: set[str] = field(default_factory=set)
     members: list[str] = field(default_factory=list)
+    source_digests: dict[str, str] = field(default_factory=dict)
 
     @property
     def full_name(self) -> str:
@@ -69,164 +96,45 @@ def parse_args() -> argparse.Namespace:
         default=16,
         help="Maximum basic API members to show per control.",
     )
+    parser.add_argument(
+        "--scope",
+        choices=sorted(SOURCE_SCOPES),
+        default="controls",
+        help="Scan only the src/Avalonia.Controls* assemblies ('controls') or every assembly under src/ ('all').",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            f"Re-render only docs whose source files changed since the last run and keep the index timestamp "
+            f"when the index is otherwise unchanged. Every run records its state in {MANIFEST_NAME} in the "
+            "output directory; that file is machine-local and ignored by git, so do not commit it."
+        ),
+    )
+    parser.add_argument(
+        "--timestamp",
+        help="Index generation time as ISO 8601 (default: $SOURCE_DATE_EPOCH if set, else now).",
+    )
+    add_cache_arguments(parser)
+    add_profile_arguments(parser)
     return parser.parse_args()
 
 
-def run_git(repo: pathlib.Path, args: list[str]) -> str:
-    return subprocess.check_output(["git", "-C", str(repo), *args], text=True)
-
-
-def git_list_control_files(repo: pathlib.Path, git_ref: str) -> list[str]:
-    files = run_git(repo, ["ls-tree", "-r", "--name-only", git_ref, "src"]).splitlines()
-    out: list[str] = []
-    for rel in files:
-        if not rel.endswith(".cs"):
-            continue
-        parts = rel.split("/")
-        if len(parts) < 2:
-            continue
-        if parts[0] == "src" and parts[1].startswith("Avalonia.Controls"):
-            out.append(rel)
-    return sorted(out)
-
-
-def strip_comments(line: str, in_block: bool) -> tuple[str, bool]:
-    i = 0
-    out: list[str] = []
-
-    while i < len(line):
-        if in_block:
-            end = line.find("*/", i)
-            if end == -1:
-                return "", True
-            i = end + 2
-            in_block = False
-            continue
-
-        if line.startswith("/*", i):
-            in_block = True
-            i += 2
-            continue
-
-        if line.startswith("//", i):
-            break
-
-        out.append(line[i])
-        i += 1
-
-    return "".join(out), in_block
-
-
-def sanitize_for_braces(text: str) -> str:
-    text = re.sub(r'"([^"\\]|\\.)*"', '""', text)
-    text = re.sub(r"'([^'\\]|\\.)*'", "''", text)
-    return text
-
-
-def normalize_signature(raw: str) -> str:
-    return " ".join(raw.replace("\t", " ").split()).strip()
-
-
-def declaration_terminated(sig: str) -> bool:
-    return ";" in sig or "=>" in sig or "{" in sig
-
-
-def extract_signatures(content: str) -> tuple[str | None, list[str]]:
-    namespace: str | None = None
-    in_block = False
-    depth = 0
-    type_stack: list[tuple[str, bool, int]] = []
-    pending_type: tuple[str, bool] | None = None
-    pending_sig: str | None = None
-    signatures: list[str] = []
-
-    for raw in content.splitlines():
-        line, in_block = strip_comments(raw, in_block)
-        line = line.lstrip("\ufeff")
-        if not line.strip():
-            continue
-
-        ns_match = NAMESPACE_RE.match(line)
-        if ns_match:
-            namespace = ns_match.group(1)
-
-        clean = sanitize_for_braces(line)
-
-        if pending_type is not None and "{" in clean:
-            t_name, t_public = pending_type
-            type_stack.append((t_name, t_public, depth + 1))
-            pending_type = None
-
-        type_match = TYPE_DECL_RE.match(line)
-        is_type_decl = type_match is not None
-        if type_match:
-            access = type_match.group(1)
-            name = type_match.group("name")
-            parent_public = type_stack[-1][1] if type_stack else True
-            is_public = access == "public" and parent_public
-
-            if is_public:
-                signatures.append(normalize_signature(line))
-
-            if "{" in clean:
-                type_stack.append((name, is_public, depth + 1))
-            else:
-                pending_type = (name, is_public)
-
-        innermost_public = type_stack[-1][1] if type_stack else False
-        member_depth = type_stack[-1][2] if type_stack else -1
-
-        if pending_sig is None:
-            if (
-                innermost_public
-                and depth == member_depth
-                and PUBLIC_RE.match(line)
-                and not is_type_decl
-                and not line.lstrip().startswith("public:")
-            ):
-                pending_sig = normalize_signature(line)
-                if declaration_terminated(pending_sig):
-                    signatures.append(pending_sig)
-                    pending_sig = None
-        else:
-            pending_sig = normalize_signature(pending_sig + " " + line)
-            if declaration_terminated(pending_sig):
-                signatures.append(pending_sig)
-                pending_sig = None
-
-        depth += clean.count("{")
-        depth -= clean.count("}")
+def list_control_files(tree: TreeReader, patterns: list[str] = CONTROL_SOURCE_PATTERNS) -> list[str]:
+    return sorted(tree.list_files(patterns))
 
-        while type_stack and depth < type_stack[-1][2]:
-            type_stack.pop()
 
-    if pending_sig:
-        signatures.append(pending_sig)
+def base_reference(base: str) -> str:
+    """The base type name as written, without nullability, type arguments or `global::`."""
+    token = base.replace("?", "").strip()
+    if "<" in token:
+        token = token.split("<", 1)[0]
+    token = token.split("::")[-1]
+    return ".".join(part.strip() for part in token.split("."))
 
-    return namespace, signatures
 
-
-def base_names_from_declaration(signature: str) -> list[str]:
-    decl = signature.split("{", 1)[0].strip()
-    if ":" not in decl:
-        return []
-
-    base_part = decl.split(":", 1)[1]
-    base_part = base_part.split(" where ", 1)[0]
-
-    result: list[str] = []
-    for part in base_part.split(","):
-        token = part.strip()
-        if not token:
-            continue
-        token = token.replace("?", "")
-        token = token.split(".")[-1]
-        if "<" in token:
-            token = token.split("<", 1)[0]
-        token = token.strip()
-        if token:
-            result.append(token)
-    return result
+def short_base_name(base: str) -> str:
+    return base_reference(base).split(".")[-1]
 
 
 def assembly_from_source(source: str) -> str:
@@ -255,79 +163,127 @@ def is_class_type(kind: str) -> bool:
     return kind == "class" or kind.startswith("record")
 
 
-def collect_types(repo: pathlib.Path, git_ref: str, files: list[str]) -> dict[str, TypeInfo]:
+def add_declared_types(
+    type_infos: dict[str, TypeInfo],
+    source: str,
+    parsed: ParsedSource,
+    source_digest: str = "",
+) -> None:
+    # Members are attributed through their enclosing type chain, so members that follow
+    # a nested type still belong to the outer type.
+    full_names: dict[tuple[str | None, tuple[str, ...]], str] = {}
+
+    for item in parsed.declarations:
+        if item.kind != "type":
+            full_name = full_names.get((item.namespace, item.containers))
+            if full_name is not None:
+                type_infos[full_name].members.append(item.signature)
+                type_infos[full_name].source_digests[source] = source_digest
+            continue
+
+        if item.type_kind is None or not is_class_type(item.type_kind):
+            continue
+
+        namespace = item.namespace or ""
+        full_name = f"{namespace}.{item.symbol}" if namespace else item.symbol
+        full_names[(item.namespace, (*item.containers, item.symbol))] = full_name
+        is_abstract = "abstract" in item.modifiers
+        refs = [ref for ref in (base_reference(base) for base in item.bases) if ref]
+        bases = [ref.split(".")[-1] for ref in refs]
+
+        info = type_infos.get(full_name)
+        if info is None:
+            info = type_infos[full_name] = TypeInfo(
+                name=item.symbol,
+                namespace=namespace,
+                source_file=source,
+                assembly=assembly_from_source(source),
+                declaration=item.head,
+                is_abstract=is_abstract,
+                base_names=set(bases),
+                base_refs=set(refs),
+                members=[],
+            )
+        else:
+            info.base_names.update(bases)
+            info.base_refs.update(refs)
+            info.is_abstract = info.is_abstract or is_abstract
+        info.source_digests[source] = source_digest
+
+
+def collect_types(
+    tree: TreeReader,
+    files: list[str],
+    cache: ParseCache | None = None,
+) -> dict[str, TypeInfo]:
     type_infos: dict[str, TypeInfo] = {}
 
     for source in files:
-        content = run_git(repo, ["show", f"{git_ref}:{source}"])
-        namespace, signatures = extract_signatures(content)
-        namespace = namespace or ""
-
-        current_full_name: str | None = None
-
-        for sig in signatures:
-            tmatch = TYPE_DECL_RE.match(sig)
-            if tmatch:
-                kind = tmatch.group("kind")
-                if not is_class_type(kind):
-                    current_full_name = None
-                    continue
-
-                short_name = tmatch.group("name").split("`", 1)[0]
-                full_name = f"{namespace}.{short_name}" if namespace else short_name
-                is_abstract = " abstract " in f" {sig} "
-                bases = base_names_from_declaration(sig)
-
-                info = type_infos.get(full_name)
-                if info is None:
-                    type_infos[full_name] = TypeInfo(
-                        name=short_name,
-                        namespace=namespace,
-                        source_file=source,
-                        assembly=assembly_from_source(source),
-                        declaration=sig,
-                        is_abstract=is_abstract,
-                        base_names=set(bases),
-                        members=[],
-                    )
-                else:
-                    if not info.base_names and bases:
-                        info.base_names = set(bases)
-                    else:
-                        info.base_names.update(bases)
-                    info.is_abstract = info.is_abstract or is_abstract
-
-                current_full_name = full_name
-                continue
-
-            if current_full_name is not None:
-                type_infos[current_full_name].members.append(sig)
+        data = tree.read_bytes(source)
+        start = time.perf_counter()
+        parsed = parse_cached(data, cache)
+        record_file(source, time.perf_counter() - start)
+        add_declared_types(type_infos, source, parsed, content_digest(data))
 
     return type_infos
 
 
-def determine_control_types(type_infos: dict[str, TypeInfo]) -> set[str]:
-    by_short_name: dict[str, set[str]] = defaultdict(set)
-    for full_name, info in type_infos.items():
-        by_short_name[info.name].add(full_name)
+def resolve_base(
+    info: TypeInfo,
+    ref: str,
+    type_infos: dict[str, TypeInfo],
+    by_short_name: dict[str, list[str]],
+) -> list[str]:
+    """Resolve a base type reference to the full names of scanned types.
+
+    Mirrors C# lookup from the declaring namespace outwards. Using directives are
+    not tracked, so a name found in no enclosing namespace falls back to every
+    scanned type with a matching name.
+    """
+    namespace = info.namespace
+    while True:
+        candidate = f"{namespace}.{ref}" if namespace else ref
+        if candidate in type_infos:
+            return [candidate]
+        if not namespace:
+            break
+        namespace = namespace.rpartition(".")[0]
+
+    suffix = "." + ref
+    return [
+        full_name
+        for full_name in by_short_name.get(ref.rpartition(".")[2], ())
+        if "." not in ref or full_name.endswith(suffix)
+    ]
 
-    control_short_names: set[str] = {"Control", "TopLevel", "WindowBase"}
 
-    changed = True
-    while changed:
-        changed = False
-        for info in type_infos.values():
-            if info.name in control_short_names:
-                continue
-            if any(base in control_short_names for base in info.base_names):
-                control_short_names.add(info.name)
-                changed = True
+def determine_control_types(type_infos: dict[str, TypeInfo]) -> dict[str, int]:
+    """Map every control type to its inheritance depth below the nearest root control type.
 
-    controls: set[str] = set()
+    Builds a reverse inheritance graph (base -> derived) over the full type names and
+    walks it breadth-first from `CONTROL_ROOT_TYPES`, so each type and base reference
+    is visited once.
+    """
+    by_short_name: dict[str, list[str]] = defaultdict(list)
     for full_name, info in type_infos.items():
-        if info.name in control_short_names:
-            controls.add(full_name)
-    return controls
+        by_short_name[info.name].append(full_name)
+
+    derived: dict[str, list[str]] = defaultdict(list)
+    for full_name, info in type_infos.items():
+        for ref in info.base_refs:
+            for base in resolve_base(info, ref, type_infos, by_short_name):
+                if base != full_name:
+                    derived[base].append(full_name)
+
+    depths = {root: 0 for root in CONTROL_ROOT_TYPES if root in type_infos}
+    queue = deque(depths)
+    while queue:
+        base = queue.popleft()
+        for full_name in derived.get(base, ()):
+            if full_name not in depths:
+                depths[full_name] = depths[base] + 1
+                queue.append(full_name)
+    return depths
 
 
 def unique_member_signatures(signatures: list[str], max_members: int) -> list[str]:
@@ -381,7 +337,7 @@ def render_csharp_example(info: TypeInfo) -> str:
     )
 
 
-def write_control_doc(output_path: pathlib.Path, info: TypeInfo, max_members: int) -> None:
+def render_control_doc(info: TypeInfo, max_members: int) -> str:
     bases = ", ".join(sorted(info.base_names)) if info.base_names else "None"
     members = unique_member_signatures(info.members, max_members=max_members)
 
@@ -418,11 +374,21 @@ def write_control_doc(output_path: pathlib.Path, info: TypeInfo, max_members: in
     lines.append(render_csharp_example(info))
     lines.append("")
 
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    return "\n".join(lines)
+
+
+def doc_fingerprint(info: TypeInfo, max_members: int) -> str:
+    """Hash everything a rendered control doc depends on: its source files and render settings."""
+    payload = {
+        "render_version": DOC_RENDER_VERSION,
+        "max_members": max_members,
+        "type": info.full_name,
+        "sources": sorted(info.source_digests.items()),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
 
 
-def write_index(output_dir: pathlib.Path, controls: list[TypeInfo], git_ref: str) -> None:
-    now = dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
+def render_index(controls: list[TypeInfo], git_ref: str, generated_at: str) -> str:
     grouped: dict[str, list[tuple[str, str, str]]] = defaultdict(list)
 
     for info in controls:
@@ -432,7 +398,7 @@ def write_index(output_dir: pathlib.Path, controls: list[TypeInfo], git_ref: str
     lines: list[str] = []
     lines.append("# Avalonia Controls Reference Index")
     lines.append("")
-    lines.append(f"- Generated at (UTC): `{now}`")
+    lines.append(f"- Generated at (UTC): `{generated_at}`")
     lines.append(f"- Avalonia git ref: `{git_ref}`")
     lines.append(f"- Controls documented: `{len(controls)}`")
     lines.append("")
@@ -446,39 +412,187 @@ def write_index(output_dir: pathlib.Path, controls: list[TypeInfo], git_ref: str
             lines.append(f"- [{name}]({slug}) (`{full_name}`)")
         lines.append("")
 
-    (output_dir / "README.md").write_text("\n".join(lines), encoding="utf-8")
+    return "\n".join(lines)
+
+
+def resolve_generated_at(timestamp: str | None) -> str:
+    """Format `--timestamp`, else `SOURCE_DATE_EPOCH`, else the current time, as UTC."""
+    if timestamp is not None:
+        moment = dt.datetime.fromisoformat(timestamp)
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=dt.timezone.utc)
+    elif os.environ.get("SOURCE_DATE_EPOCH"):
+        moment = dt.datetime.fromtimestamp(int(os.environ["SOURCE_DATE_EPOCH"]), dt.timezone.utc)
+    else:
+        moment = dt.datetime.now(dt.timezone.utc)
+    return moment.astimezone(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
+
+
+def read_manifest(output_dir: pathlib.Path) -> dict[str, object]:
+    try:
+        manifest = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("format") != MANIFEST_FORMAT or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+@dataclass
+class WriteStats:
+    written: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    removed: int = 0
+
+
+def write_control_docs(
+    output_dir: pathlib.Path,
+    docs: list[tuple[str, TypeInfo]],
+    max_members: int,
+    previous: dict[str, dict[str, str]],
+    incremental: bool,
+) -> tuple[dict[str, dict[str, str]], WriteStats]:
+    """Write `(file name, type)` docs and return their manifest entries.
+
+    In incremental mode a doc whose fingerprint matches its previous manifest entry,
+    and whose file still has the recorded hash, is not rendered at all. Files whose
+    content would not change are never rewritten, and files recorded in the previous
+    manifest that are no longer produced are deleted.
+    """
+    entries: dict[str, dict[str, str]] = {}
+    stats = WriteStats()
+
+    for name, info in docs:
+        path = output_dir / name
+        fingerprint = doc_fingerprint(info, max_members)
+        entry = previous.get(name)
+        if (
+            incremental
+            and entry is not None
+            and entry.get("input") == fingerprint
+            and path.is_file()
+            and file_sha256(path) == entry.get("output")
+        ):
+            entries[name] = entry
+            stats.skipped += 1
+            continue
+
+        text = render_control_doc(info, max_members)
+        if write_text_if_changed(path, text):
+            stats.written += 1
+        else:
+            stats.unchanged += 1
+        entries[name] = {
+            "type": info.full_name,
+            "input": fingerprint,
+            "output": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        }
+
+    for name in sorted(set(previous) - set(entries)):
+        path = output_dir / name
+        if path.is_file():
+            path.unlink()
+            stats.removed += 1
+
+    return entries, stats
 
 
 def main() -> int:
     args = parse_args()
+    return run_profiled(args, "generate_control_reference_docs", run)
+
 
+def run(args: argparse.Namespace) -> int:
     repo = args.repo.resolve()
     output_dir = args.output_dir.resolve()
 
-    files = git_list_control_files(repo, args.git_ref)
-    type_infos = collect_types(repo, args.git_ref, files)
-    control_full_names = determine_control_types(type_infos)
+    try:
+        generated_at = resolve_generated_at(args.timestamp)
+    except ValueError as ex:
+        print(f"error: invalid --timestamp or SOURCE_DATE_EPOCH: {ex}", file=sys.stderr)
+        return 2
+
+    try:
+        with phase("open ref"):
+            tree = GitTreeReader(repo, args.git_ref)
+    except RuntimeError as ex:
+        print(f"error: {ex}", file=sys.stderr)
+        return 4
+
+    cache = open_cache(args)
+    try:
+        with phase("list files"):
+            files = list_control_files(tree, SOURCE_SCOPES[args.scope])
+        with phase("parse sources"):
+            type_infos = collect_types(tree, files, cache)
+    finally:
+        tree.close()
+        if cache is not None:
+            cache.close()
+    with phase("resolve control hierarchy"):
+        control_depths = determine_control_types(type_infos)
 
     controls = sorted(
-        (type_infos[full_name] for full_name in control_full_names),
+        (type_infos[full_name] for full_name in control_depths),
         key=lambda x: x.full_name,
     )
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    docs: list[tuple[str, TypeInfo]] = []
     slugs_seen: set[str] = set()
     for info in controls:
         slug = slug_for(info.full_name)
         if slug in slugs_seen:
             slug = f"{slug}-{kebab_case(info.assembly)}"
         slugs_seen.add(slug)
-        write_control_doc(output_dir / f"{slug}.md", info, max_members=args.max_members)
-
-    write_index(output_dir, controls, args.git_ref)
+        docs.append((f"{slug}.md", info))
+
+    manifest = read_manifest(output_dir)
+    previous_docs = manifest.get("docs", {}) if isinstance(manifest.get("docs"), dict) else {}
+    with phase("write control docs"):
+        doc_entries, stats = write_control_docs(output_dir, docs, args.max_members, previous_docs, args.incremental)
+
+    with phase("write index and manifest"):
+        previous_generated_at = manifest.get("generated_at")
+        index_path = output_dir / "README.md"
+        if (
+            args.incremental
+            and isinstance(previous_generated_at, str)
+            and index_path.is_file()
+            and index_path.read_text(encoding="utf-8") == render_index(controls, args.git_ref, previous_generated_at)
+        ):
+            generated_at = previous_generated_at
+        else:
+            write_text_if_changed(index_path, render_index(controls, args.git_ref, generated_at))
+
+        write_text_if_changed(
+            output_dir / MANIFEST_NAME,
+            json.dumps(
+                {
+                    "format": MANIFEST_FORMAT,
+                    "version": MANIFEST_VERSION,
+                    "git_ref": args.git_ref,
+                    "generated_at": generated_at,
+                    "docs": doc_entries,
+                },
+                indent=1,
+                sort_keys=True,
+            )
+            + "\n",
+        )
 
     print(f"Scanned files: {len(files)}")
     print(f"Control types documented: {len(controls)}")
+    print(f"Deepest control hierarchy: {max(control_depths.values(), default=0)}")
+    print(
+        f"Docs written: {stats.written}; unchanged: {stats.unchanged}; "
+        f"skipped by manifest: {stats.skipped}; removed: {stats.removed}"
+    )
     print(f"Output directory: {output_dir}")
+    if cache is not None:
+        print(cache.summary())
     return 0
 
 
@@ -0,0 +1,85 @@
+"""Streaming, atomic writes for generated files.
+
+Generated reports are rendered as line iterators and streamed through a buffered
+handle into a temporary file next to the target, which is then renamed over it.
+Readers never observe a half-written report, and a failed run leaves the previous
+output in place.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import hashlib
+import os
+import pathlib
+import tempfile
+
+WRITE_BUFFER_BYTES = 1 << 20
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def default_file_mode() -> int:
+    # mkstemp creates 0600 files; match what a plain open() would have produced.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_lines_atomic(path: pathlib.Path, lines: Iterable[str]) -> None:
+    """Write `lines` separated by newlines, like `path.write_text("\\n".join(lines))`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    temp_path = pathlib.Path(temp_name)
+
+    try:
+        with open(fd, "w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as handle:
+            first = True
+            for line in lines:
+                if not first:
+                    handle.write("\n")
+                handle.write(line)
+                first = False
+        os.chmod(temp_path, default_file_mode())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_bytes_atomic(path: pathlib.Path, data: bytes) -> None:
+    """Write binary `data` through a temporary file that is renamed over `path`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    temp_path = pathlib.Path(temp_name)
+
+    try:
+        with open(fd, "wb") as handle:
+            handle.write(data)
+        os.chmod(temp_path, default_file_mode())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_text_if_changed(path: pathlib.Path, text: str) -> bool:
+    """Atomically write `text` unless `path` already holds exactly that content.
+
+    Returns whether the file was written, so unchanged outputs keep their mtime.
+    """
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    write_lines_atomic(path, [text])
+    return True
+
+
+def file_sha256(path: pathlib.Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""Pack the most relevant reference sections for a task into a token budget.
+
+Instead of following every "Read references/..." line of a `SKILL.md` workflow
+step, the packer scores reference sections against the task description and
+greedily fills the budget:
+
+- Sections are scored with the BM25 search index of `search_references.py`, which
+  also stores each section's byte range and approximate token count, so nothing is
+  tokenized at pack time.
+- Docs listed by the `SKILL.md` workflow steps that best match the task get up to
+  `WORKFLOW_BOOST` extra score.
+- Heading-only sections and tables of contents are never packed: they spend
+  budget on headings without adding content.
+- Sections are taken in order of score per token (small sections count as
+  `MIN_SECTION_TOKENS`), each further section of an already-packed doc is worth
+  `SAME_DOC_DECAY` times less, and sections that no longer fit are skipped.
+
+The bundle is written to stdout (or `--output`) ordered by doc and by position in
+the doc, with a provenance comment before every section; progress goes to stderr.
+
+    python3 scripts/pack_context.py "virtualized list with recycling templates" --budget 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from dataclasses import dataclass, field
+import heapq
+import pathlib
+import re
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.output_files import write_lines_atomic
+from scripts.parse_cache import DEFAULT_CACHE_DIR
+from scripts.reference_sections import read_spans
+from scripts.search_references import (
+    DEFAULT_EXCLUDE_PATTERNS,
+    INDEX_FILE_NAME,
+    SearchIndex,
+    SectionHit,
+    iter_tokens,
+    query_terms,
+)
+
+DEFAULT_BUDGET = 8000
+# Only the best sections are considered; the rest would never fit a useful budget.
+MAX_CANDIDATES = 400
+MIN_RELATIVE_SCORE = 0.15
+MIN_SECTION_TOKENS = 64
+SAME_DOC_DECAY = 0.85
+WORKFLOW_BOOST = 0.5
+# Workflow steps within this fraction of the best-matching step also boost their docs.
+WORKFLOW_STEP_CUTOFF = 0.5
+
+STEP_RE = re.compile(r"^(\d+)\.\s+(.+)$")
+REFERENCE_RE = re.compile(r"`references/([^`]+)`")
+
+
+@dataclass
+class WorkflowStep:
+    number: int
+    text: str
+    references: list[str] = field(default_factory=list)
+
+
+@dataclass
+class PackedSection:
+    hit: SectionHit
+    value: float
+
+
+@dataclass
+class Bundle:
+    task: str
+    budget: int
+    sections: list[PackedSection]
+    candidates: int
+
+    @property
+    def tokens(self) -> int:
+        return sum(packed.hit.tokens for packed in self.sections)
+
+    @property
+    def docs(self) -> int:
+        return len({packed.hit.path for packed in self.sections})
+
+
+def parse_workflow(text: str) -> list[WorkflowStep]:
+    """Return the numbered steps of the `## Workflow` section with the reference paths each one lists.
+
+    Paths are relative to the references dir; directory references keep their trailing slash.
+    """
+    steps: list[WorkflowStep] = []
+    in_workflow = False
+    for line in text.splitlines():
+        if line.startswith("## "):
+            in_workflow = line.strip() == "## Workflow"
+            continue
+        if not in_workflow:
+            continue
+        match = STEP_RE.match(line)
+        if match is not None:
+            steps.append(WorkflowStep(number=int(match.group(1)), text=match.group(2)))
+        elif steps:
+            steps[-1].text += "\n" + line
+        if steps:
+            steps[-1].references.extend(
+                reference for reference in REFERENCE_RE.findall(line) if reference not in steps[-1].references
+            )
+    return steps
+
+
+def workflow_boosts(steps: list[WorkflowStep], task: str) -> dict[str, float]:
+    """Weight in (0, 1] of each reference listed by the workflow steps that best match the task."""
+    words = {term for term in query_terms(task) if not term.startswith("`")}
+    if not words:
+        return {}
+    overlaps = [(len(words & set(iter_tokens(step.text, code_spans=False))) / len(words), step) for step in steps]
+    best = max((overlap for overlap, _ in overlaps), default=0.0)
+    if best == 0:
+        return {}
+
+    boosts: dict[str, float] = {}
+    for overlap, step in overlaps:
+        if overlap < best * WORKFLOW_STEP_CUTOFF:
+            continue
+        for reference in step.references:
+            boosts[reference] = max(boosts.get(reference, 0.0), overlap / best)
+    return boosts
+
+
+def boost_for(path: str, boosts: dict[str, float]) -> float:
+    weight = boosts.get(path, 0.0)
+    for reference, reference_weight in boosts.items():
+        if reference.endswith("/") and path.startswith(reference):
+            weight = max(weight, reference_weight)
+    return weight
+
+
+def pack_sections(hits: list[SectionHit], budget: int, boosts: dict[str, float]) -> list[PackedSection]:
+    """Greedily choose the sections with the most (boosted, decayed) score per token that fit `budget`."""
+    hits = [hit for hit in hits if hit.has_body and not hit.navigation]
+    if not hits:
+        return []
+    floor = hits[0].score * MIN_RELATIVE_SCORE
+    values = [
+        (hit, hit.score * (1 + WORKFLOW_BOOST * boost_for(hit.path, boosts)))
+        for hit in hits
+        if hit.score >= floor and 0 < hit.tokens <= budget
+    ]
+
+    def priority(value: float, hit: SectionHit, packed_from_doc: int) -> float:
+        return value * SAME_DOC_DECAY**packed_from_doc / max(hit.tokens, MIN_SECTION_TOKENS)
+
+    heap = [(-priority(value, hit, 0), order, 0) for order, (hit, value) in enumerate(values)]
+    heapq.heapify(heap)
+    packed_per_doc: dict[str, int] = defaultdict(int)
+    selected: list[PackedSection] = []
+    remaining = budget
+    while heap and remaining > 0:
+        _, order, packed_from_doc = heapq.heappop(heap)
+        hit, value = values[order]
+        if hit.tokens > remaining:
+            continue
+        current = packed_per_doc[hit.path]
+        if current != packed_from_doc:
+            # Stale priority: the doc gained sections since this entry was pushed.
+            heapq.heappush(heap, (-priority(value, hit, current), order, current))
+            continue
+        selected.append(PackedSection(hit=hit, value=value * SAME_DOC_DECAY**current))
+        packed_per_doc[hit.path] += 1
+        remaining -= hit.tokens
+    return selected
+
+
+def bundle_order(sections: list[PackedSection]) -> list[PackedSection]:
+    """Order packed sections by doc (best-packed doc first) and by position inside each doc."""
+    doc_rank: dict[str, int] = {}
+    for packed in sections:
+        doc_rank.setdefault(packed.hit.path, len(doc_rank))
+    return sorted(sections, key=lambda packed: (doc_rank[packed.hit.path], packed.hit.offset))
+
+
+def build_bundle(
+    index: SearchIndex,
+    task: str,
+    budget: int,
+    steps: list[WorkflowStep],
+) -> Bundle:
+    hits = index.ranked_hits(index.score_sections(task), MAX_CANDIDATES)
+    packed = pack_sections(hits, budget, workflow_boosts(steps, task))
+    return Bundle(task=task, budget=budget, sections=bundle_order(packed), candidates=len(hits))
+
+
+def read_bundle_texts(references_dir: pathlib.Path, bundle: Bundle) -> list[str]:
+    spans_by_path: dict[str, list[int]] = defaultdict(list)
+    for position, packed in enumerate(bundle.sections):
+        spans_by_path[packed.hit.path].append(position)
+
+    texts = [""] * len(bundle.sections)
+    for path, positions in spans_by_path.items():
+        spans = [(bundle.sections[position].hit.offset, bundle.sections[position].hit.size) for position in positions]
+        for position, text in zip(positions, read_spans(references_dir / path, spans)):
+            texts[position] = text
+    return texts
+
+
+def provenance(references_label: str, packed: PackedSection) -> str:
+    hit = packed.hit
+    return (
+        f"<!-- source: {references_label}/{hit.path}:{hit.start_line}-{hit.end_line} | "
+        f"{hit.heading_path or '(preamble)'} | score {packed.value:.2f} | ~{hit.tokens} tokens -->"
+    )
+
+
+def render_bundle(references_label: str, bundle: Bundle, texts: list[str] | None) -> list[str]:
+    lines = [
+        f"<!-- context bundle: {bundle.task!r} | ~{bundle.tokens} of {bundle.budget} tokens | "
+        f"{len(bundle.sections)} sections from {bundle.docs} docs -->",
+        "",
+    ]
+    for position, packed in enumerate(bundle.sections):
+        lines.append(provenance(references_label, packed))
+        if texts is not None:
+            lines.append(texts[position].rstrip("\n"))
+            lines.append("")
+    lines.append("")
+    return lines
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Pack the reference sections most relevant to a task into a token budget."
+    )
+    parser.add_argument("task", nargs="+", help="Task description.")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET, help=f"Token budget (default: {DEFAULT_BUDGET}).")
+    parser.add_argument(
+        "--references-dir",
+        type=pathlib.Path,
+        default=pathlib.Path("references"),
+        help="Directory containing reference markdown docs.",
+    )
+    parser.add_argument(
+        "--skill",
+        type=pathlib.Path,
+        default=pathlib.Path("SKILL.md"),
+        help="Skill definition whose workflow steps boost their referenced docs (skipped when missing).",
+    )
+    parser.add_argument(
+        "--index",
+        type=pathlib.Path,
+        default=DEFAULT_CACHE_DIR / INDEX_FILE_NAME,
+        help=f"Path of the search index (default: {DEFAULT_CACHE_DIR / INDEX_FILE_NAME}).",
+    )
+    parser.add_argument("--output", type=pathlib.Path, default=None, help="Write the bundle here instead of stdout.")
+    parser.add_argument("--list", action="store_true", help="Only list the packed sections and their provenance.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    references_dir = args.references_dir.resolve()
+    if not references_dir.is_dir():
+        print(f"error: references directory not found: {references_dir}", file=sys.stderr)
+        return 2
+    if args.budget < 1:
+        print("error: --budget must be a positive integer", file=sys.stderr)
+        return 2
+
+    task = " ".join(args.task)
+    steps = parse_workflow(args.skill.read_text(encoding="utf-8")) if args.skill.is_file() else []
+    with SearchIndex(args.index) as index:
+        stats = index.update(references_dir, DEFAULT_EXCLUDE_PATTERNS)
+        if stats.docs == 0:
+            print(f"error: no markdown docs found under {references_dir}", file=sys.stderr)
+            return 3
+
+        start = time.perf_counter()
+        bundle = build_bundle(index, task, args.budget, steps)
+        texts = None if args.list else read_bundle_texts(references_dir, bundle)
+        elapsed = time.perf_counter() - start
+
+    print(stats.summary(), file=sys.stderr)
+    print(
+        f"Packed {len(bundle.sections)} of {bundle.candidates} candidate sections from {bundle.docs} docs "
+        f"(~{bundle.tokens} of {args.budget} tokens) in {elapsed * 1000:.1f} ms",
+        file=sys.stderr,
+    )
+
+    lines = render_bundle(args.references_dir.as_posix(), bundle, texts)
+    if args.output is not None:
+        write_lines_atomic(args.output, lines)
+        print(f"Bundle written to: {args.output}", file=sys.stderr)
+    else:
+        print("\n".join(lines), end="")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,153 @@
+"""Persistent, content-addressed cache for parsed Avalonia source files.
+
+Generators store the output of their per-file extractors in a SQLite file keyed by
+extractor name, parser version and the SHA-256 of the file content. Byte-identical
+files (unchanged between runs or between release tags) are then parsed only once.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import hashlib
+import json
+import pathlib
+import sqlite3
+import time
+from typing import Any
+
+DEFAULT_CACHE_DIR = pathlib.Path(".cache")
+CACHE_FILE_NAME = "parsed-sources.sqlite"
+DEFAULT_MAX_MB = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL
+)
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def entry_key(extractor: str, version: str, digest: str) -> str:
+    return f"{extractor}:{version}:{digest}"
+
+
+class ParseCache:
+    """SQLite-backed key/value store for JSON-serializable extractor results.
+
+    Entries are evicted least-recently-used first when the stored payloads exceed
+    `max_bytes`; eviction runs once, when the cache is closed.
+    """
+
+    def __init__(self, path: pathlib.Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._touched: dict[str, int] = {}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(SCHEMA)
+
+    def get(self, extractor: str, version: str, digest: str) -> Any | None:
+        key = entry_key(extractor, version, digest)
+        row = self._conn.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self._touched[key] = time.time_ns()
+        return json.loads(row[0])
+
+    def put(self, extractor: str, version: str, digest: str, payload: Any) -> None:
+        key = entry_key(extractor, version, digest)
+        text = json.dumps(payload, separators=(",", ":"))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (key, payload, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, text, len(text), time.time_ns()),
+        )
+        self._touched.pop(key, None)
+        self.stats.writes += 1
+
+    def evict(self) -> int:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        doomed: list[tuple[str]] = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_used ASC"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self.stats.evictions += len(doomed)
+        return len(doomed)
+
+    def close(self) -> None:
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE entries SET last_used = ? WHERE key = ?",
+                [(stamp, key) for key, stamp in self._touched.items()],
+            )
+            self._touched.clear()
+        self.evict()
+        self._conn.commit()
+        self._conn.close()
+
+    def summary(self) -> str:
+        return (
+            f"Parse cache: {self.stats.hits} hits, {self.stats.misses} misses, "
+            f"{self.stats.evictions} evicted ({self.path})"
+        )
+
+    def __enter__(self) -> ParseCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--cache-dir",
+        type=pathlib.Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Directory holding the persistent parse cache.",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_MB,
+        help="Maximum size of cached parse results before least-recently-used entries are evicted.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every file from scratch without reading or writing the parse cache.",
+    )
+
+
+def open_cache(args: argparse.Namespace) -> ParseCache | None:
+    if args.no_cache:
+        return None
+    cache_dir = pathlib.Path(args.cache_dir).expanduser().resolve()
+    return ParseCache(cache_dir / CACHE_FILE_NAME, max_bytes=args.cache_max_mb * 1024 * 1024)
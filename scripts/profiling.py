@@ -0,0 +1,217 @@
+"""Opt-in per-phase timing and slowest-file tracking for the generator scripts.
+
+Each script's `main` wraps its phases (preparing refs, listing files, parsing,
+rendering, writing) in `phase(name)`, and the parsers report per-file parse times
+through `record_file`. Both are no-ops until profiling is enabled with `--profile
+PATH` or the `AVALONIA_SCRIPTS_PROFILE` environment variable; the run then writes a
+Chrome trace (load it in `chrome://tracing` or https://ui.perfetto.dev) with one
+complete event per phase and the slowest files under `otherData`.
+
+Phase CPU time includes reaped child processes, so it covers `--jobs` workers once
+their pool has shut down.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+import heapq
+import json
+import os
+import pathlib
+import sys
+import time
+
+PROFILE_ENV = "AVALONIA_SCRIPTS_PROFILE"
+DEFAULT_TOP_FILES = 20
+
+
+def cpu_seconds() -> float:
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+@dataclass
+class PhaseTiming:
+    name: str
+    start: float
+    wall: float
+    cpu: float
+    depth: int
+
+
+@dataclass
+class Profiler:
+    """Collects phase timings and the `top_files` slowest parsed files of one run."""
+
+    enabled: bool = False
+    top_files: int = DEFAULT_TOP_FILES
+    phases: list[PhaseTiming] = field(default_factory=list)
+    _origin: float = field(default_factory=time.perf_counter)
+    _depth: int = 0
+    _slowest: list[tuple[float, str]] = field(default_factory=list)
+    _files: int = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        depth = self._depth
+        self._depth += 1
+        wall_start = time.perf_counter()
+        cpu_start = cpu_seconds()
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.phases.append(
+                PhaseTiming(
+                    name=name,
+                    start=wall_start - self._origin,
+                    wall=time.perf_counter() - wall_start,
+                    cpu=cpu_seconds() - cpu_start,
+                    depth=depth,
+                )
+            )
+
+    def record_file(self, rel: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        self._files += 1
+        if self.top_files <= 0:
+            return
+        if len(self._slowest) < self.top_files:
+            heapq.heappush(self._slowest, (seconds, rel))
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (seconds, rel))
+
+    def slowest_files(self) -> list[tuple[str, float]]:
+        return [(rel, seconds) for seconds, rel in sorted(self._slowest, reverse=True)]
+
+    def to_trace(self, script: str) -> dict[str, object]:
+        """Render the run in Chrome trace event format (times in microseconds)."""
+        pid = os.getpid()
+        events: list[dict[str, object]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": script}},
+        ]
+        for timing in sorted(self.phases, key=lambda current: (current.start, current.depth)):
+            events.append(
+                {
+                    "name": timing.name,
+                    "cat": "phase",
+                    "ph": "X",
+                    "pid": pid,
+                    "tid": 0,
+                    "ts": round(timing.start * 1_000_000),
+                    "dur": round(timing.wall * 1_000_000),
+                    "args": {"cpu_ms": round(timing.cpu * 1000, 3)},
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "script": script,
+                "files_timed": self._files,
+                "slowest_files": [
+                    {"file": rel, "ms": round(seconds * 1000, 3)} for rel, seconds in self.slowest_files()
+                ],
+            },
+        }
+
+    def summary(self) -> str:
+        lines = ["Profile:"]
+        for timing in sorted(self.phases, key=lambda current: (current.start, current.depth)):
+            label = "  " * timing.depth + timing.name
+            lines.append(f"  {label:<32} wall {timing.wall:8.3f}s  cpu {timing.cpu:8.3f}s")
+        for rel, seconds in self.slowest_files()[:5]:
+            lines.append(f"  slow file: {rel} ({seconds * 1000:.1f} ms)")
+        return "\n".join(lines)
+
+
+_active = Profiler()
+
+
+def current_profiler() -> Profiler:
+    return _active
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Time a phase of the current run; a no-op unless profiling is enabled."""
+    return _active.phase(name)
+
+
+def record_file(rel: str, seconds: float) -> None:
+    _active.record_file(rel, seconds)
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be zero or a positive integer: {value}")
+    return number
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        type=pathlib.Path,
+        default=None,
+        help=f"Write a Chrome trace of per-phase timings and the slowest files to this path (or set ${PROFILE_ENV}).",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=non_negative_int,
+        default=DEFAULT_TOP_FILES,
+        help=f"Number of slowest files to keep in the profile (default: {DEFAULT_TOP_FILES}).",
+    )
+
+
+def profile_path(args: argparse.Namespace) -> pathlib.Path | None:
+    if args.profile is not None:
+        return pathlib.Path(args.profile).expanduser().resolve()
+    value = os.environ.get(PROFILE_ENV)
+    return pathlib.Path(value).expanduser().resolve() if value else None
+
+
+def start_profiling(args: argparse.Namespace) -> pathlib.Path | None:
+    """Enable the process-wide profiler when requested; return the trace path, if any."""
+    global _active
+    path = profile_path(args)
+    _active = Profiler(enabled=path is not None, top_files=max(args.profile_top, 0))
+    return path
+
+
+def finish_profiling(path: pathlib.Path | None, script: str) -> None:
+    """Write the trace started by `start_profiling` and print a short summary.
+
+    A trace that cannot be written is reported on stderr rather than raised, so it
+    never replaces the outcome of the run it describes.
+    """
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(_active.to_trace(script), indent=1) + "\n", encoding="utf-8")
+    except OSError as ex:
+        print(f"error: could not write profile {path}: {ex}", file=sys.stderr)
+        return
+    print(_active.summary())
+    print(f"Profile written to: {path}")
+
+
+def run_profiled(args: argparse.Namespace, script: str, run: Callable[[argparse.Namespace], int]) -> int:
+    """Run a script's `run(args)` under the profiler requested by `args`.
+
+    The trace is written however `run` ends, including early error returns and
+    exceptions: failed runs are the ones whose traces are worth archiving.
+    """
+    trace_path = start_profiling(args)
+    try:
+        return run(args)
+    finally:
+        finish_profiling(trace_path, script)
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""Heading-level section manifest and random-access reader for the reference docs.
+
+The manifest (`references/sections-manifest.jsonl`, ignored by git) lists every
+heading section of every reference doc with its heading path, level, line, byte
+offset, byte length and an approximate token count. A section spans from its heading
+to the next heading of any level; reading a section also returns its subsections
+unless `--no-subsections` is given.
+
+Reading a section stats the doc, looks up its manifest line without parsing the
+others, and then reads only the requested byte ranges: with `seek` for ordinary
+docs and through `mmap` for the large generated index files. A doc that changed
+since the manifest was written is rescanned on its own.
+
+    python3 scripts/reference_sections.py                      # refresh the manifest
+    python3 scripts/reference_sections.py references/20-itemscontrol-virtualization-and-recycling.md
+    python3 scripts/reference_sections.py references/20-itemscontrol-virtualization-and-recycling.md \\
+        --section "Authoring Patterns" --line 96
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable, Iterator
+from dataclasses import astuple, dataclass, field
+import itertools
+import json
+import mmap
+import os
+import pathlib
+import re
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.output_files import write_lines_atomic
+from scripts.parse_cache import content_digest
+
+MANIFEST_FORMAT = "avalonia-reference-sections"
+MANIFEST_VERSION = 1
+MANIFEST_NAME = "sections-manifest.jsonl"
+SECTION_FIELDS = ("heading_path", "level", "line", "offset", "length", "tokens")
+# Docs at least this large (the generated API indexes and the migration catalog) are mapped, not read.
+MMAP_MIN_BYTES = 256 * 1024
+# Rough size of one model token in UTF-8 bytes of English markdown.
+BYTES_PER_TOKEN = 4
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#+)?\s*$")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+HEADING_PATH_SEPARATOR = " > "
+
+
+@dataclass
+class SectionEntry:
+    """One heading section; `level` is 0 for text before the first heading."""
+
+    heading_path: str
+    level: int
+    line: int
+    offset: int
+    length: int
+    tokens: int
+
+    @property
+    def heading(self) -> str:
+        return self.heading_path.rsplit(HEADING_PATH_SEPARATOR, 1)[-1]
+
+
+@dataclass
+class DocSections:
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+    sections: list[SectionEntry] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        payload = {
+            "path": self.path,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "digest": self.digest,
+            "sections": [astuple(section) for section in self.sections],
+        }
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, line: str) -> DocSections:
+        payload = json.loads(line)
+        return cls(
+            path=payload["path"],
+            size=payload["size"],
+            mtime_ns=payload["mtime_ns"],
+            digest=payload["digest"],
+            sections=[SectionEntry(*section) for section in payload["sections"]],
+        )
+
+
+@dataclass
+class ManifestStats:
+    docs: int = 0
+    sections: int = 0
+    scanned: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Section manifest: {self.docs} docs, {self.sections} sections "
+            f"({self.scanned} scanned, {self.removed} removed) in {self.seconds * 1000:.1f} ms"
+        )
+
+
+def estimate_tokens(length: int) -> int:
+    return (length + BYTES_PER_TOKEN - 1) // BYTES_PER_TOKEN
+
+
+def manifest_path_for(references_dir: pathlib.Path) -> pathlib.Path:
+    return references_dir / MANIFEST_NAME
+
+
+def iter_lines(buffer: bytes | mmap.mmap) -> Iterator[tuple[int, bytes]]:
+    """Yield `(offset, line)` for every line of `buffer`, without line terminators."""
+    offset = 0
+    size = len(buffer)
+    while offset < size:
+        end = buffer.find(b"\n", offset)
+        if end < 0:
+            end = size
+        yield offset, buffer[offset:end].rstrip(b"\r")
+        offset = end + 1
+
+
+def scan_sections(buffer: bytes | mmap.mmap) -> list[SectionEntry]:
+    """Return the heading sections of a markdown document; headings in fenced code are ignored."""
+    starts: list[tuple[str, int, int, int]] = []
+    stack: list[tuple[int, str]] = []
+    in_fence = False
+    saw_text = False
+
+    for number, (offset, line) in enumerate(iter_lines(buffer), start=1):
+        if line.startswith(b"#") and not in_fence:
+            match = HEADING_RE.match(line.decode("utf-8", errors="replace"))
+            if match is not None:
+                if not starts and saw_text:
+                    starts.append(("", 0, 1, 0))
+                level = len(match.group(1))
+                while stack and stack[-1][0] >= level:
+                    stack.pop()
+                stack.append((level, match.group(2)))
+                heading_path = HEADING_PATH_SEPARATOR.join(heading for _, heading in stack)
+                starts.append((heading_path, level, number, offset))
+                continue
+        if FENCE_RE.match(line.decode("utf-8", errors="replace")):
+            in_fence = not in_fence
+        saw_text = saw_text or bool(line.strip())
+
+    if not starts and saw_text:
+        starts.append(("", 0, 1, 0))
+
+    sections: list[SectionEntry] = []
+    ends = [offset for _, _, _, offset in starts[1:]] + [len(buffer)]
+    for (heading_path, level, line, offset), end in zip(starts, ends):
+        sections.append(SectionEntry(heading_path, level, line, offset, end - offset, estimate_tokens(end - offset)))
+    return sections
+
+
+def scan_doc(references_dir: pathlib.Path, rel: str) -> DocSections:
+    path = references_dir / rel
+    stat = path.stat()
+    data = path.read_bytes()
+    return DocSections(
+        path=rel,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        digest=content_digest(data),
+        sections=scan_sections(data),
+    )
+
+
+def list_docs(references_dir: pathlib.Path) -> list[str]:
+    return sorted(path.relative_to(references_dir).as_posix() for path in references_dir.rglob("*.md") if path.is_file())
+
+
+def read_manifest(path: pathlib.Path) -> dict[str, DocSections]:
+    """Return every doc of the manifest, or an empty dict when it is missing, unreadable or outdated."""
+    try:
+        with path.open(encoding="utf-8") as handle:
+            if not manifest_header_matches(handle.readline()):
+                return {}
+            docs = (DocSections.from_json(line) for line in handle if line.strip())
+            return {doc.path: doc for doc in docs}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def manifest_header_matches(line: str) -> bool:
+    try:
+        header = json.loads(line)
+    except ValueError:
+        return False
+    return (
+        isinstance(header, dict)
+        and header.get("format") == MANIFEST_FORMAT
+        and header.get("version") == MANIFEST_VERSION
+        and header.get("fields") == list(SECTION_FIELDS)
+    )
+
+
+def find_manifest_doc(path: pathlib.Path, rel: str) -> DocSections | None:
+    """Return the manifest entry of one doc, decoding only that line."""
+    prefix = '{"path":' + json.dumps(rel, ensure_ascii=False) + ","
+    try:
+        with path.open(encoding="utf-8") as handle:
+            if not manifest_header_matches(handle.readline()):
+                return None
+            for line in handle:
+                if line.startswith(prefix):
+                    return DocSections.from_json(line)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return None
+
+
+def write_manifest(path: pathlib.Path, docs: Iterable[DocSections]) -> None:
+    header = {"format": MANIFEST_FORMAT, "version": MANIFEST_VERSION, "fields": list(SECTION_FIELDS)}
+    rows = (doc.to_json() for doc in sorted(docs, key=lambda current: current.path))
+    write_lines_atomic(path, itertools.chain([json.dumps(header, separators=(",", ":"))], rows, [""]))
+
+
+def is_current(doc: DocSections, stat: os.stat_result) -> bool:
+    return doc.size == stat.st_size and doc.mtime_ns == stat.st_mtime_ns
+
+
+def refresh_doc(references_dir: pathlib.Path, previous: DocSections | None, rel: str) -> tuple[DocSections, bool]:
+    """Return the doc's sections and whether they had to be rescanned."""
+    stat = (references_dir / rel).stat()
+    if previous is not None and is_current(previous, stat):
+        return previous, False
+    doc = scan_doc(references_dir, rel)
+    if previous is not None and previous.digest == doc.digest:
+        # Touched but unchanged; keep the entry and record the new mtime.
+        return doc, False
+    return doc, True
+
+
+def update_manifest(references_dir: pathlib.Path, manifest_path: pathlib.Path) -> tuple[dict[str, DocSections], ManifestStats]:
+    """Rescan the docs that changed since the manifest was written and rewrite it if anything changed."""
+    start = time.perf_counter()
+    stats = ManifestStats()
+    previous = read_manifest(manifest_path)
+    docs: dict[str, DocSections] = {}
+    changed = False
+    for rel in list_docs(references_dir):
+        doc, scanned = refresh_doc(references_dir, previous.get(rel), rel)
+        docs[rel] = doc
+        stats.scanned += scanned
+        changed = changed or doc is not previous.get(rel)
+
+    stats.removed = len(previous.keys() - docs.keys())
+    if changed or stats.removed or not manifest_path.exists():
+        write_manifest(manifest_path, docs.values())
+
+    stats.docs = len(docs)
+    stats.sections = sum(len(doc.sections) for doc in docs.values())
+    stats.seconds = time.perf_counter() - start
+    return docs, stats
+
+
+def load_doc_sections(references_dir: pathlib.Path, manifest_path: pathlib.Path, rel: str) -> DocSections:
+    """Return the current sections of one doc, rescanning it (and updating the manifest) only if it changed."""
+    previous = find_manifest_doc(manifest_path, rel)
+    doc, _ = refresh_doc(references_dir, previous, rel)
+    if doc is not previous:
+        docs = read_manifest(manifest_path)
+        docs[rel] = doc
+        write_manifest(manifest_path, docs.values())
+    return doc
+
+
+def section_span(sections: list[SectionEntry], index: int, include_subsections: bool = True) -> tuple[int, int]:
+    """Byte range `(offset, length)` of a section, optionally extended over its subsections."""
+    section = sections[index]
+    end = section.offset + section.length
+    if include_subsections and section.level > 0:
+        for following in sections[index + 1 :]:
+            if following.level <= section.level:
+                break
+            end = following.offset + following.length
+    return section.offset, end - section.offset
+
+
+def select_sections(
+    sections: list[SectionEntry],
+    headings: Iterable[str] = (),
+    lines: Iterable[int] = (),
+    include_subsections: bool = True,
+) -> list[int]:
+    """Indexes of the sections named by heading (title, full path, or path substring) or containing a line.
+
+    With `include_subsections`, sections nested inside another selected section are
+    dropped, since reading the outer one already returns them.
+    """
+    selected: set[int] = set()
+    for wanted in headings:
+        needle = wanted.strip().lower()
+        exact = [
+            index
+            for index, section in enumerate(sections)
+            if needle in (section.heading.lower(), section.heading_path.lower())
+        ]
+        selected.update(exact or (index for index, section in enumerate(sections) if needle in section.heading_path.lower()))
+    for line in lines:
+        containing = [index for index, section in enumerate(sections) if section.line <= line]
+        if containing:
+            selected.add(containing[-1])
+
+    result: list[int] = []
+    covered_until = -1
+    for index in sorted(selected):
+        if sections[index].offset < covered_until:
+            continue
+        result.append(index)
+        offset, length = section_span(sections, index, include_subsections)
+        covered_until = offset + length
+    return result
+
+
+def read_spans(path: pathlib.Path, spans: list[tuple[int, int]]) -> list[str]:
+    """Read byte ranges of a file, through mmap for large files and seek/read otherwise."""
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size >= MMAP_MIN_BYTES:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return [mapped[offset : offset + length].decode("utf-8", errors="replace") for offset, length in spans]
+        texts: list[str] = []
+        for offset, length in spans:
+            handle.seek(offset)
+            texts.append(handle.read(length).decode("utf-8", errors="replace"))
+        return texts
+
+
+def read_sections(
+    references_dir: pathlib.Path,
+    doc: DocSections,
+    indexes: list[int],
+    include_subsections: bool = True,
+) -> list[tuple[SectionEntry, str]]:
+    spans = [section_span(doc.sections, index, include_subsections) for index in indexes]
+    texts = read_spans(references_dir / doc.path, spans)
+    return [(doc.sections[index], text) for index, text in zip(indexes, texts)]
+
+
+def format_outline(doc: DocSections) -> list[str]:
+    lines = [f"{doc.path}: {len(doc.sections)} sections, {doc.size} bytes"]
+    for section in doc.sections:
+        indent = "  " * max(section.level - 1, 0)
+        title = section.heading if section.level else "(preamble)"
+        lines.append(
+            f"  {section.line:>6}  {section.offset:>9}+{section.length:<8} ~{section.tokens:>6} tokens  {indent}{title}"
+        )
+    return lines
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Refresh the heading-level section manifest of the reference docs, "
+            "or list or read the sections of one doc."
+        )
+    )
+    parser.add_argument("doc", nargs="?", type=pathlib.Path, help="Doc to list or read (path or path relative to --references-dir).")
+    parser.add_argument(
+        "--references-dir",
+        type=pathlib.Path,
+        default=pathlib.Path("references"),
+        help="Directory containing reference markdown docs.",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=pathlib.Path,
+        default=None,
+        help=f"Section manifest path (default: <references-dir>/{MANIFEST_NAME}).",
+    )
+    parser.add_argument(
+        "--section",
+        action="append",
+        default=[],
+        help="Heading title, heading path, or heading path substring to read. Can be used multiple times.",
+    )
+    parser.add_argument(
+        "--line",
+        type=int,
+        action="append",
+        default=[],
+        help="Read the section containing this 1-based line (for example from a search hit). Can be used multiple times.",
+    )
+    parser.add_argument("--no-subsections", action="store_true", help="Read only each section's own text, not its subsections.")
+    return parser.parse_args()
+
+
+def resolve_doc(references_dir: pathlib.Path, doc: pathlib.Path) -> str | None:
+    for candidate in (doc, references_dir / doc):
+        try:
+            resolved = candidate.resolve()
+            if resolved.is_file():
+                return resolved.relative_to(references_dir).as_posix()
+        except ValueError:
+            continue
+    return None
+
+
+def main() -> int:
+    args = parse_args()
+    references_dir = args.references_dir.resolve()
+    if not references_dir.is_dir():
+        print(f"error: references directory not found: {references_dir}", file=sys.stderr)
+        return 2
+    manifest_path = args.manifest or manifest_path_for(references_dir)
+
+    if args.doc is None:
+        if args.section or args.line:
+            print("error: --section and --line need a doc", file=sys.stderr)
+            return 2
+        _, stats = update_manifest(references_dir, manifest_path)
+        if stats.docs == 0:
+            print(f"error: no markdown docs found under {references_dir}", file=sys.stderr)
+            return 3
+        print(stats.summary())
+        print(f"Manifest written to: {manifest_path}")
+        return 0
+
+    rel = resolve_doc(references_dir, args.doc)
+    if rel is None:
+        print(f"error: {args.doc} is not a doc under {references_dir}", file=sys.stderr)
+        return 2
+    doc = load_doc_sections(references_dir, manifest_path, rel)
+
+    if not args.section and not args.line:
+        print("\n".join(format_outline(doc)))
+        return 0
+
+    include_subsections = not args.no_subsections
+    indexes = select_sections(doc.sections, args.section, args.line, include_subsections)
+    if not indexes:
+        print(f"error: no section of {rel} matches the requested headings or lines", file=sys.stderr)
+        return 3
+    for section, text in read_sections(references_dir, doc, indexes, include_subsections):
+        print(f"<!-- {args.references_dir.as_posix()}/{rel}:{section.line} {section.heading_path or '(preamble)'} -->")
+        print(text.rstrip("\n"))
+        print("")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""Ranked full-text search over the reference docs.
+
+Docs are split into sections at their markdown headings (headings inside fenced
+code blocks are ignored), and every section is scored with BM25 against a
+persisted inverted index. Two refinements make the ranking fit the corpus:
+
+- Heading-aware term frequencies: terms of a section's own heading count
+  `HEADING_WEIGHT` times, terms of its parent headings (including the doc title)
+  `PARENT_HEADING_WEIGHT` times, in addition to the body text.
+- Code spans are first-class tokens: `` `ItemsRepeater.ItemTemplate` `` is indexed
+  as one code token as well as its words, and a query word also matches code spans
+  that consist of exactly that identifier.
+
+The index lives in a SQLite file (`.cache/references-search.sqlite` by default) and
+is refreshed before every query: docs whose size and mtime are unchanged are not
+read, docs whose content digest is unchanged are not re-tokenized, and only changed
+or new docs are re-indexed. A query only loads the postings of its own terms.
+
+    python3 scripts/search_references.py virtualization recycling ItemsRepeater
+    python3 scripts/search_references.py '`x:DataType`' compiled bindings --limit 5
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+import math
+import os
+import pathlib
+import re
+import sqlite3
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.find_uncovered_apis import is_excluded
+from scripts.parse_cache import DEFAULT_CACHE_DIR, content_digest
+from scripts.reference_sections import FENCE_RE, HEADING_PATH_SEPARATOR, HEADING_RE, estimate_tokens, iter_lines
+
+INDEX_FILE_NAME = "references-search.sqlite"
+# Bump when tokenization or weighting changes; older indexes are then rebuilt from scratch.
+ANALYZER_VERSION = "3"
+DEFAULT_LIMIT = 10
+DEFAULT_EXCLUDE_PATTERNS = ["api-index*-generated.md"]
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+HEADING_WEIGHT = 3.0
+PARENT_HEADING_WEIGHT = 1.0
+# Weight of the code-span variant of a plain query word (`itemsrepeater` for ItemsRepeater).
+IMPLIED_CODE_WEIGHT = 0.5
+MAX_CODE_TOKEN_CHARS = 80
+
+CODE_SPAN_RE = re.compile(r"`([^`\n]+)`")
+WORD_RE = re.compile(r"[a-z0-9_]+")
+# Headings of navigation-only sections, compared case-insensitively.
+TOC_HEADINGS = frozenset({"contents", "table of contents", "toc"})
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from if in into is it of on or that the this to use with".split()
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    doc_id INTEGER NOT NULL,
+    heading_path TEXT NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    tokens INTEGER NOT NULL,
+    length REAL NOT NULL,
+    has_body INTEGER NOT NULL,
+    navigation INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sections_doc ON sections (doc_id);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    section_id INTEGER NOT NULL,
+    tf REAL NOT NULL,
+    PRIMARY KEY (term, section_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_section ON postings (section_id);
+"""
+
+
+@dataclass
+class Section:
+    """One heading-delimited part of a doc; lines are 1-based and inclusive, `offset` and `size` are in bytes."""
+
+    headings: list[str]
+    start_line: int
+    end_line: int
+    offset: int = 0
+    size: int = 0
+    terms: Counter[str] = field(default_factory=Counter)
+    body_terms: int = 0
+
+    @property
+    def heading_path(self) -> str:
+        return HEADING_PATH_SEPARATOR.join(self.headings)
+
+    @property
+    def has_body(self) -> bool:
+        """Whether any text besides the heading itself was indexed."""
+        return self.body_terms > 0
+
+    @property
+    def navigation(self) -> bool:
+        """Whether this is a table of contents, which only repeats the doc's headings."""
+        return bool(self.headings) and self.headings[-1].strip().lower() in TOC_HEADINGS
+
+    @property
+    def length(self) -> float:
+        return float(sum(self.terms.values()))
+
+
+@dataclass
+class SectionHit:
+    path: str
+    heading_path: str
+    start_line: int
+    end_line: int
+    score: float
+    offset: int = 0
+    size: int = 0
+    tokens: int = 0
+    has_body: bool = True
+    navigation: bool = False
+    match_line: int = 0
+    snippet: str = ""
+
+
+@dataclass
+class DocHit:
+    path: str
+    score: float
+    sections: int
+    best: SectionHit
+
+
+@dataclass
+class UpdateStats:
+    docs: int = 0
+    sections: int = 0
+    indexed: int = 0
+    touched: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Index: {self.docs} docs, {self.sections} sections "
+            f"({self.indexed} indexed, {self.touched} touched, {self.removed} removed) "
+            f"in {self.seconds * 1000:.1f} ms"
+        )
+
+
+def code_token(span: str) -> str | None:
+    text = " ".join(span.lower().split())
+    if not text or len(text) > MAX_CODE_TOKEN_CHARS:
+        return None
+    return f"`{text}`"
+
+
+def iter_tokens(text: str, code_spans: bool = True) -> Iterator[str]:
+    """Yield the words of `text` and, unless disabled, one code token per code span."""
+    for word in WORD_RE.findall(text.lower()):
+        if word not in STOP_WORDS:
+            yield word
+    if code_spans and "`" in text:
+        for span in CODE_SPAN_RE.findall(text):
+            token = code_token(span)
+            if token is not None:
+                yield token
+
+
+def split_sections(data: bytes) -> list[Section]:
+    """Split markdown into heading sections and count their heading-weighted terms.
+
+    Lines and byte ranges match the sections of `reference_sections.scan_sections`.
+    """
+    sections: list[Section] = []
+    stack: list[tuple[int, str]] = []
+    current = Section(headings=[], start_line=1, end_line=0)
+    in_fence = False
+    line_count = 0
+
+    def add_body(tokens: Iterable[str]) -> None:
+        counted = Counter(tokens)
+        current.terms.update(counted)
+        current.body_terms += sum(counted.values())
+
+    def close(end_line: int, end_offset: int) -> None:
+        current.end_line = end_line
+        current.size = end_offset - current.offset
+        if current.headings or current.terms:
+            sections.append(current)
+
+    for number, (offset, raw) in enumerate(iter_lines(data), start=1):
+        line_count = number
+        line = raw.decode("utf-8", errors="replace")
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            add_body(iter_tokens(line, code_spans=False))
+            continue
+
+        match = HEADING_RE.match(line)
+        if match is None:
+            add_body(iter_tokens(line))
+            continue
+
+        close(number - 1, offset)
+        level = len(match.group(1))
+        title = match.group(2)
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        parents = [heading for _, heading in stack]
+        stack.append((level, title))
+
+        current = Section(headings=[*parents, title], start_line=number, end_line=number, offset=offset)
+        for token in iter_tokens(title):
+            current.terms[token] += HEADING_WEIGHT
+        for parent in parents:
+            for token in iter_tokens(parent):
+                current.terms[token] += PARENT_HEADING_WEIGHT
+
+    close(max(line_count, current.start_line), len(data))
+    return sections
+
+
+def query_terms(query: str) -> dict[str, float]:
+    """Map each query term to its weight; plain words also match identical code spans."""
+    weights: dict[str, float] = {}
+    for token in iter_tokens(query):
+        weights[token] = max(weights.get(token, 0.0), 1.0)
+        if not token.startswith("`"):
+            implied = f"`{token}`"
+            weights[implied] = max(weights.get(implied, 0.0), IMPLIED_CODE_WEIGHT)
+    return weights
+
+
+def bm25(tf: float, df: int, total: int, length: float, average_length: float) -> float:
+    idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+    return idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+
+def list_reference_docs(references_dir: pathlib.Path, exclude_patterns: list[str]) -> list[pathlib.Path]:
+    return sorted(
+        path
+        for path in references_dir.rglob("*.md")
+        if path.is_file() and not is_excluded(path, references_dir, exclude_patterns)
+    )
+
+
+class SearchIndex:
+    """Persisted BM25 index of reference doc sections, keyed by doc path relative to the references dir."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'analyzer'").fetchone()
+        if row is None or row[0] != ANALYZER_VERSION:
+            self.clear()
+
+    def clear(self) -> None:
+        # Drop rather than empty the tables, so an index written by an older analyzer gets the current schema.
+        self._conn.executescript(
+            "DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS sections; "
+            "DROP TABLE IF EXISTS docs; DROP TABLE IF EXISTS meta;" + SCHEMA
+        )
+        with self._conn:
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('analyzer', ?)", (ANALYZER_VERSION,))
+
+    def update(self, references_dir: pathlib.Path, exclude_patterns: list[str]) -> UpdateStats:
+        """Bring the index in line with the docs under `references_dir`."""
+        start = time.perf_counter()
+        stats = UpdateStats()
+        stored = {
+            path: (doc_id, digest, size, mtime_ns)
+            for doc_id, path, digest, size, mtime_ns in self._conn.execute(
+                "SELECT id, path, digest, size, mtime_ns FROM docs"
+            )
+        }
+
+        with self._conn:
+            seen: set[str] = set()
+            for doc in list_reference_docs(references_dir, exclude_patterns):
+                rel = doc.relative_to(references_dir).as_posix()
+                seen.add(rel)
+                stat = doc.stat()
+                previous = stored.get(rel)
+                if previous is not None and previous[2:] == (stat.st_size, stat.st_mtime_ns):
+                    continue
+
+                data = doc.read_bytes()
+                digest = content_digest(data)
+                if previous is not None and previous[1] == digest:
+                    self._conn.execute(
+                        "UPDATE docs SET size = ?, mtime_ns = ? WHERE id = ?",
+                        (stat.st_size, stat.st_mtime_ns, previous[0]),
+                    )
+                    stats.touched += 1
+                    continue
+
+                if previous is not None:
+                    self._remove_doc(previous[0])
+                self._add_doc(rel, digest, stat, data)
+                stats.indexed += 1
+
+            for rel in stored.keys() - seen:
+                self._remove_doc(stored[rel][0])
+                stats.removed += 1
+
+            if stats.indexed or stats.removed:
+                total, average = self._conn.execute("SELECT COUNT(*), AVG(length) FROM sections").fetchone()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [("sections", str(total)), ("average_length", str(average or 0.0))],
+                )
+
+        stats.docs = len(seen)
+        stats.sections = self.section_count()
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def _add_doc(self, rel: str, digest: str, stat: os.stat_result, data: bytes) -> None:
+        cursor = self._conn.execute(
+            "INSERT INTO docs (path, digest, size, mtime_ns) VALUES (?, ?, ?, ?)",
+            (rel, digest, stat.st_size, stat.st_mtime_ns),
+        )
+        doc_id = cursor.lastrowid
+        for section in split_sections(data):
+            cursor = self._conn.execute(
+                "INSERT INTO sections "
+                "(doc_id, heading_path, start_line, end_line, offset, size, tokens, length, has_body, navigation) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    doc_id,
+                    section.heading_path,
+                    section.start_line,
+                    section.end_line,
+                    section.offset,
+                    section.size,
+                    estimate_tokens(section.size),
+                    section.length,
+                    section.has_body,
+                    section.navigation,
+                ),
+            )
+            section_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO postings (term, section_id, tf) VALUES (?, ?, ?)",
+                [(term, section_id, tf) for term, tf in section.terms.items()],
+            )
+
+    def _remove_doc(self, doc_id: int) -> None:
+        self._conn.execute(
+            "DELETE FROM postings WHERE section_id IN (SELECT id FROM sections WHERE doc_id = ?)",
+            (doc_id,),
+        )
+        self._conn.execute("DELETE FROM sections WHERE doc_id = ?", (doc_id,))
+        self._conn.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def _meta(self, key: str, default: str) -> str:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else default
+
+    def section_count(self) -> int:
+        return int(self._meta("sections", "0"))
+
+    def score_sections(self, query: str) -> dict[int, float]:
+        """BM25 score of every section that matches at least one query term."""
+        total = self.section_count()
+        average_length = float(self._meta("average_length", "0")) or 1.0
+        scores: dict[int, float] = defaultdict(float)
+        for term, weight in query_terms(query).items():
+            rows = self._conn.execute(
+                "SELECT p.section_id, p.tf, s.length FROM postings p JOIN sections s ON s.id = p.section_id "
+                "WHERE p.term = ?",
+                (term,),
+            ).fetchall()
+            for section_id, tf, length in rows:
+                scores[section_id] += weight * bm25(tf, len(rows), total, length, average_length)
+        return scores
+
+    def ranked_hits(self, scores: dict[int, float], limit: int | None = None) -> list[SectionHit]:
+        """Describe the `limit` best-scoring sections (all of them by default), best first."""
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        if not ranked:
+            return []
+        placeholders = ",".join("?" * len(ranked))
+        rows = {
+            row[0]: row[1:]
+            for row in self._conn.execute(
+                "SELECT s.id, d.path, s.heading_path, s.start_line, s.end_line, s.offset, s.size, s.tokens, "
+                "s.has_body, s.navigation "
+                f"FROM sections s JOIN docs d ON d.id = s.doc_id WHERE s.id IN ({placeholders})",
+                [section_id for section_id, _ in ranked],
+            )
+        }
+        hits: list[SectionHit] = []
+        for section_id, score in ranked:
+            path, heading_path, start_line, end_line, offset, size, tokens, has_body, navigation = rows[section_id]
+            hits.append(
+                SectionHit(
+                    path=path,
+                    heading_path=heading_path,
+                    start_line=start_line,
+                    end_line=end_line,
+                    score=score,
+                    offset=offset,
+                    size=size,
+                    tokens=tokens,
+                    has_body=bool(has_body),
+                    navigation=bool(navigation),
+                )
+            )
+        return hits
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> tuple[list[SectionHit], list[DocHit]]:
+        """Return the top `limit` sections and the top `limit` docs (ranked by their best section)."""
+        hits = self.ranked_hits(self.score_sections(query))
+        docs: dict[str, DocHit] = {}
+        for hit in hits:
+            doc = docs.get(hit.path)
+            if doc is None:
+                docs[hit.path] = DocHit(path=hit.path, score=hit.score, sections=1, best=hit)
+            else:
+                doc.sections += 1
+        return hits[:limit], list(docs.values())[:limit]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> SearchIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def locate_matches(references_dir: pathlib.Path, hits: Iterable[SectionHit], query: str) -> None:
+    """Point each hit at the first line of its section that contains a query word."""
+    words = [term for term in query_terms(query) if not term.startswith("`")]
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE) if words else None
+    lines_by_path: dict[str, list[str]] = {}
+    for hit in hits:
+        lines = lines_by_path.get(hit.path)
+        if lines is None:
+            text = (references_dir / hit.path).read_text(encoding="utf-8", errors="replace")
+            lines = lines_by_path[hit.path] = text.splitlines()
+        hit.match_line = hit.start_line
+        for number in range(hit.start_line, min(hit.end_line, len(lines)) + 1):
+            if pattern is not None and pattern.search(lines[number - 1]):
+                hit.match_line = number
+                break
+        if hit.match_line <= len(lines):
+            hit.snippet = lines[hit.match_line - 1].strip()
+
+
+def format_hit(references_dir: pathlib.Path, hit: SectionHit, score: float) -> list[str]:
+    lines = [f"{score:8.2f}  {(references_dir / hit.path).as_posix()}:{hit.match_line}  {hit.heading_path or '(preamble)'}"]
+    if hit.snippet:
+        snippet = hit.snippet if len(hit.snippet) <= 120 else hit.snippet[:117] + "..."
+        lines.append(f"          {snippet}")
+    return lines
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Search the reference docs with a persisted, heading-aware BM25 index.")
+    parser.add_argument("query", nargs="+", help="Query words; wrap identifiers in backticks to match code spans exactly.")
+    parser.add_argument(
+        "--references-dir",
+        type=pathlib.Path,
+        default=pathlib.Path("references"),
+        help="Directory containing reference markdown docs to index.",
+    )
+    parser.add_argument(
+        "--index",
+        type=pathlib.Path,
+        default=DEFAULT_CACHE_DIR / INDEX_FILE_NAME,
+        help=f"Path of the search index (default: {DEFAULT_CACHE_DIR / INDEX_FILE_NAME}).",
+    )
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help=f"Hits to show per list (default: {DEFAULT_LIMIT}).")
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        help="Exclude pattern (file name or relative path glob). Can be used multiple times.",
+    )
+    parser.add_argument(
+        "--include-generated",
+        action="store_true",
+        help="Also index the generated API index files, which are excluded by default.",
+    )
+    parser.add_argument("--rebuild", action="store_true", help="Discard the index and rebuild it from scratch.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    references_dir = args.references_dir.resolve()
+    if not references_dir.is_dir():
+        print(f"error: references directory not found: {references_dir}", file=sys.stderr)
+        return 2
+    if args.limit < 1:
+        print("error: --limit must be a positive integer", file=sys.stderr)
+        return 2
+
+    query = " ".join(args.query)
+    exclude_patterns = args.exclude + ([] if args.include_generated else DEFAULT_EXCLUDE_PATTERNS)
+    with SearchIndex(args.index) as index:
+        if args.rebuild:
+            index.clear()
+        stats = index.update(references_dir, exclude_patterns)
+        if stats.docs == 0:
+            print(f"error: no markdown docs found under {references_dir}", file=sys.stderr)
+            return 3
+
+        start = time.perf_counter()
+        sections, docs = index.search(query, args.limit)
+        locate_matches(references_dir, [*sections, *(doc.best for doc in docs)], query)
+        elapsed = time.perf_counter() - start
+
+    print(stats.summary())
+    print(f"Query: {query!r} ({elapsed * 1000:.1f} ms)")
+    if not sections:
+        print("No matches.")
+        return 0
+
+    print("")
+    print("Documents:")
+    for doc in docs:
+        lines = format_hit(args.references_dir, doc.best, doc.score)
+        lines[0] += f"  [{doc.sections} matching section{'s' if doc.sections != 1 else ''}]"
+        print("\n".join(lines))
+    print("")
+    print("Sections:")
+    for hit in sections:
+        print("\n".join(format_hit(args.references_dir, hit, hit.score)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.api_lookup import ApiLookup, lookup_path_for, open_lookup
+
+INDEX = """# Avalonia Public API Index (Generated)
+
+## Controls
+
+### `src/Avalonia.Controls/TopLevel.cs`
+- Namespace: `Avalonia.Controls`
+- `public class TopLevel : ContentControl`
+- `public static readonly DirectProperty<TopLevel, Size> ClientSizeProperty = AvaloniaProperty.RegisterDirect<TopLevel, Size>(nameof(ClientSize), o => o.ClientSize);`
+- `public Size ClientSize {`
+- `public double RenderScaling {`
+
+### `src/Avalonia.Base/Threading/DispatcherPriority.cs`
+- `public readonly struct DispatcherPriority : IEquatable<DispatcherPriority>`
+- `public static implicit operator DispatcherPriority(int value) => FromValue(value);`
+- `public static readonly DispatcherPriority Render = new(5);`
+"""
+
+
+class ApiLookupTests(unittest.TestCase):
+    def test_exact_member_qualified_and_prefix_queries(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_path = Path(temp_dir) / "api-index-generated.md"
+            index_path.write_text(INDEX, encoding="utf-8")
+
+            lookup, built = open_lookup(index_path)
+            with lookup:
+                client_size = lookup.exact("clientsizeproperty")
+                member = lookup.exact("TopLevel.ClientSize")
+                qualified = lookup.exact("Avalonia.Controls.TopLevel")
+                priority = lookup.exact("DispatcherPriority")
+                prefix = lookup.prefix("TopLevel.Client")
+                fallback = lookup.find("Dispatcher", limit=2)
+                missing = lookup.find("NoSuchSymbol")
+
+        self.assertTrue(built)
+        self.assertEqual(
+            [(entry.symbol, entry.container, entry.namespace, entry.source_file) for entry in client_size],
+            [("ClientSizeProperty", "TopLevel", "Avalonia.Controls", "src/Avalonia.Controls/TopLevel.cs")],
+        )
+        self.assertEqual([entry.signature for entry in member], ["public Size ClientSize {"])
+        self.assertEqual([entry.kind for entry in qualified], ["type"])
+        self.assertEqual([entry.kind for entry in priority], ["type", "operator"])
+        self.assertEqual([entry.symbol for entry in prefix], ["ClientSize", "ClientSizeProperty"])
+        self.assertEqual(fallback[0], "prefix")
+        self.assertEqual([entry.kind for entry in fallback[1]], ["type", "operator"])
+        self.assertEqual(missing, ("prefix", []))
+
+    def test_lookup_file_is_rebuilt_only_when_content_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_path = Path(temp_dir) / "api-index-generated.md"
+            index_path.write_text(INDEX, encoding="utf-8")
+
+            lookup, _ = open_lookup(index_path)
+            lookup.close()
+            os.utime(index_path, ns=(0, 0))
+            touched, touched_built = open_lookup(index_path)
+            touched.close()
+
+            index_path.write_text(INDEX + "- `public void Activate() {`\n", encoding="utf-8")
+            changed, changed_built = open_lookup(index_path)
+            with changed:
+                activate = changed.exact("DispatcherPriority.Activate")
+
+            lookup_path_for(index_path).write_bytes(b"not a lookup file\n")
+            with self.assertRaises(ValueError):
+                ApiLookup(lookup_path_for(index_path))
+            recovered, recovered_built = open_lookup(index_path)
+            recovered.close()
+
+        self.assertFalse(touched_built)
+        self.assertTrue(changed_built)
+        self.assertEqual([entry.symbol for entry in activate], ["Activate"])
+        self.assertTrue(recovered_built)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import textwrap
+import unittest
+
+from scripts.csharp_declarations import ParsedSource, parse_source
+from scripts.generate_api_index import render_signatures
+from scripts.generate_api_migration_report import render_api_items
+from scripts.generate_control_reference_docs import add_declared_types
+
+SOURCE = textwrap.dedent(
+    """\
+    namespace Avalonia.Controls
+    {
+        public delegate void ClosingHandler(object sender);
+
+        public class Expander : HeaderedContentControl, IExpandable<Expander>
+            where T : class
+        {
+            public enum Direction { Up, Down }
+
+            public class Options : Base.Options(42)
+            {
+                public int Depth { get; set; }
+            }
+
+            public bool IsExpanded { get; set; }
+
+            internal class Hidden
+            {
+                public class StillHidden { }
+            }
+        }
+
+        public abstract record Snapshot(int Value) : SnapshotBase;
+
+        public interface IExpandable<T>
+        {
+            bool CanExpand { get; }
+        }
+    }
+    """
+)
+
+
+class CSharpDeclarationTests(unittest.TestCase):
+    def test_records_carry_namespace_containers_and_bases(self) -> None:
+        parsed = parse_source(SOURCE)
+        by_symbol = {item.symbol: item for item in parsed.declarations}
+
+        self.assertEqual(parsed.namespace, "Avalonia.Controls")
+        self.assertNotIn("Hidden", by_symbol)
+        self.assertNotIn("StillHidden", by_symbol)
+
+        expander = by_symbol["Expander"]
+        self.assertEqual(expander.type_kind, "class")
+        self.assertEqual(expander.bases, ("HeaderedContentControl", "IExpandable<Expander>"))
+        self.assertEqual(expander.head, "public class Expander : HeaderedContentControl, IExpandable<Expander>")
+
+        self.assertEqual(by_symbol["Options"].containers, ("Expander",))
+        self.assertEqual(by_symbol["Options"].bases, ("Base.Options",))
+        self.assertEqual(by_symbol["Depth"].containers, ("Expander", "Options"))
+        self.assertEqual(by_symbol["IsExpanded"].containers, ("Expander",))
+        self.assertEqual(by_symbol["ClosingHandler"].kind, "delegate")
+
+        snapshot = by_symbol["Snapshot"]
+        self.assertEqual(snapshot.type_kind, "record")
+        self.assertEqual(snapshot.modifiers, ("public", "abstract"))
+        self.assertEqual(snapshot.bases, ("SnapshotBase",))
+
+    def test_generators_render_the_same_records(self) -> None:
+        parsed = parse_source(SOURCE)
+
+        _, signatures = render_signatures(parsed)
+        self.assertIn("public class Expander : HeaderedContentControl, IExpandable<Expander>", signatures)
+        self.assertIn("bool CanExpand { get; }", signatures)
+
+        items = render_api_items("src/Avalonia.Controls/Expander.cs", parsed)
+        self.assertEqual(len(items), len(signatures))
+        self.assertTrue(all(item.namespace == "Avalonia.Controls" for item in items))
+
+        type_infos = {}
+        add_declared_types(type_infos, "src/Avalonia.Controls/Expander.cs", parsed)
+        expander = type_infos["Avalonia.Controls.Expander"]
+        self.assertEqual(expander.base_names, {"HeaderedContentControl", "IExpandable"})
+        # The property follows a nested type but still belongs to Expander.
+        self.assertEqual(expander.members, ["public bool IsExpanded { get; set; }"])
+        self.assertTrue(type_infos["Avalonia.Controls.Snapshot"].is_abstract)
+
+    def test_payload_round_trip(self) -> None:
+        parsed = parse_source(SOURCE)
+        self.assertEqual(ParsedSource.from_payload(parsed.to_payload()), parsed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import textwrap
+import unittest
+
+from scripts.csharp_lexer import iter_code_lines
+from scripts.generate_api_index import parse_signatures
+
+
+class CSharpLexerTests(unittest.TestCase):
+    def test_literals_do_not_affect_brace_depth(self) -> None:
+        source = textwrap.dedent(
+            r'''
+            public class Sample
+            {
+                string a = "http://example.com/{";
+                string b = @"C:\path\""{""";
+                string c = $"{(flag ? "}" : "{")} {{";
+                char d = '{';
+            }
+            '''
+        )
+
+        lines = list(iter_code_lines(source))
+
+        self.assertEqual([line.depth for line in lines], [0, 0, 1, 1, 1, 1, 1])
+        self.assertEqual(lines[-1].end_depth, 0)
+        self.assertEqual(lines[2].text.strip(), 'string a = "http://example.com/{";')
+        self.assertEqual(lines[2].clean.strip(), 'string a = "";')
+
+    def test_multiline_raw_and_verbatim_strings_are_collapsed(self) -> None:
+        source = textwrap.dedent(
+            '''\
+            public class Sample
+            {
+                string raw = """
+                    public class Fake {
+                    """;
+                string verbatim = @"line one {
+            public class AlsoFake";
+            }
+            '''
+        )
+
+        lines = list(iter_code_lines(source))
+        texts = [line.text.strip() for line in lines]
+
+        self.assertNotIn("public class Fake {", texts)
+        self.assertNotIn("public class AlsoFake\";", texts)
+        self.assertEqual(lines[-1].end_depth, 0)
+
+    def test_comments_are_removed_and_line_numbers_kept(self) -> None:
+        source = "\ufeffnamespace A; // trailing {\r\n/* block {\r\n still */ public class B { }\r\n"
+
+        lines = list(iter_code_lines(source))
+
+        self.assertEqual([(line.number, line.text) for line in lines], [(1, "namespace A; "), (3, " public class B { }")])
+        self.assertEqual(lines[-1].end_depth, 0)
+
+    def test_verbatim_string_braces_no_longer_drop_following_types(self) -> None:
+        source = textwrap.dedent(
+            """\
+            namespace Sample;
+
+            public static class Formats
+            {
+                public const string Template = @"{""name"": 1";
+            }
+
+            public class Next
+            {
+                public void Run() { }
+            }
+            """
+        )
+
+        _, signatures = parse_signatures(source)
+
+        self.assertIn("public class Next", signatures)
+        self.assertIn("public void Run() { }", signatures)
+
+
+if __name__ == "__main__":
+    unittest.main()
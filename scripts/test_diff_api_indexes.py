@@ -0,0 +1,115 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.diff_api_indexes import diff_api_indexes, iter_report_lines, merge_diff, read_api_index
+from scripts.generate_api_migration_report import ApiItem
+
+OLD_INDEX = """# Avalonia Public API Index (Generated)
+
+- Repository: `Avalonia@11.3.12`
+
+## Application Model and Controls
+
+### `src/Avalonia.Controls/TopLevel.cs`
+- Namespace: `Avalonia.Controls`
+- `public class TopLevel : ContentControl`
+- `public Size ClientSize {`
+- `public double RenderScaling {`
+
+### `src/Avalonia.Controls/Old/Helpers.cs`
+- Namespace: `Avalonia.Controls`
+- `public static class Helpers`
+- `public static void Run() {`
+
+## Property, Data, Styling, Threading
+
+### `src/Avalonia.Base/Media/Colors.cs`
+- `public static class Colors`
+- `public static Color AliceBlue => KnownColor.AliceBlue.ToColor();`
+- `... 3 more signatures omitted (increase --max-per-file to include them).`
+"""
+
+NEW_INDEX = """# Avalonia Public API Index (Generated)
+
+- Repository: `Avalonia@12.0.0-rc1`
+
+## Application Model and Controls
+
+### `src/Avalonia.Controls/Helpers.cs`
+- Namespace: `Avalonia.Controls`
+- `public static class Helpers`
+- `public static void Run() {`
+
+### `src/Avalonia.Controls/TopLevel.cs`
+- Namespace: `Avalonia.Controls`
+- `public class TopLevel : ContentControl`
+- `public Size ClientSize {`
+- `public Thickness InsetsManagerPadding {`
+
+## Property, Data, Styling, Threading
+
+### `src/Avalonia.Base/Media/Colors.cs`
+- `public static class Colors`
+- `public static Color AliceBlue => KnownColor.AliceBlue.ToColor();`
+- `public static Color AntiqueWhite => KnownColor.AntiqueWhite.ToColor();`
+"""
+
+
+def item(source_file: str, signature: str) -> ApiItem:
+    return ApiItem(
+        area="Other",
+        source_file=source_file,
+        namespace=None,
+        container=None,
+        kind="method",
+        symbol=signature,
+        signature=signature,
+    )
+
+
+class MergeDiffTests(unittest.TestCase):
+    def test_merge_join_of_sorted_items(self) -> None:
+        old = [item("a.cs", "public void A()"), item("a.cs", "public void B()"), item("c.cs", "public void C()")]
+        new = [item("a.cs", "public void B()"), item("b.cs", "public void D()"), item("c.cs", "public void C()")]
+
+        added, removed = merge_diff(old, new)
+
+        self.assertEqual([current.signature for current in added], ["public void D()"])
+        self.assertEqual([current.signature for current in removed], ["public void A()"])
+
+    def test_signature_moved_to_another_file_is_unchanged(self) -> None:
+        added, removed = merge_diff([item("b.cs", "public void A()")], [item("a.cs", "public void A()")])
+
+        self.assertEqual((added, removed), ([], []))
+
+
+class DiffApiIndexesTests(unittest.TestCase):
+    def test_diff_skips_truncated_files_and_renders_report_sections(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            old_path = Path(temp_dir) / "api-index-generated.md"
+            new_path = Path(temp_dir) / "api-index-12-generated.md"
+            old_path.write_text(OLD_INDEX, encoding="utf-8")
+            new_path.write_text(NEW_INDEX, encoding="utf-8")
+
+            old = read_api_index(old_path)
+            new = read_api_index(new_path)
+            added, removed, skipped = diff_api_indexes(old, new)
+            lines = list(iter_report_lines(old, new, added, removed, [], skipped))
+
+        self.assertEqual((old.label, new.label), ("Avalonia@11.3.12", "Avalonia@12.0.0-rc1"))
+        self.assertEqual(old.truncated, {"src/Avalonia.Base/Media/Colors.cs"})
+        self.assertEqual(skipped, ["src/Avalonia.Base/Media/Colors.cs"])
+        self.assertEqual(
+            [(current.area, current.container, current.signature) for current in added],
+            [("Application Model and Controls", "TopLevel", "public Thickness InsetsManagerPadding {")],
+        )
+        self.assertEqual([current.signature for current in removed], ["public double RenderScaling {"])
+        self.assertIn("## Added Public APIs", lines)
+        self.assertIn("## Removed Public Signatures (Parser View)", lines)
+        self.assertIn("- `TopLevel` -> `public Thickness InsetsManagerPadding {`", lines)
+        self.assertIn("  - `src/Avalonia.Base/Media/Colors.cs`", lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,23 @@
+import json
+import re
+import tempfile
 import unittest
+from pathlib import Path
 
-from scripts.find_uncovered_apis import parse_signature
+from scripts.find_uncovered_apis import (
+    ApiEntry,
+    attribute_coverage,
+    build_cached_corpus_index,
+    build_corpus_index,
+    coverage_phrases,
+    find_phrases,
+    has_backticked,
+    has_token,
+    is_covered,
+    parse_signature,
+    write_attribution,
+)
+from scripts.parse_cache import ParseCache
 
 
 class ParseSignatureTests(unittest.TestCase):
@@ -56,5 +73,126 @@ class ParseSignatureTests(unittest.TestCase):
         self.assertEqual(symbol, "Register")
 
 
+class CoverageIndexTests(unittest.TestCase):
+    CORPUS = (
+        "Use `Button` and `Window.Show` in docs. Compare with operator >= and operator ==x.\n"
+        "Größe operator Größe here; avoid 9operator + mixups, but operator +.\n"
+        "`a`Between`b` this[0]"
+    )
+
+    def test_phrase_scan_matches_boundary_regex(self) -> None:
+        phrases = ["operator >", "operator >=", "operator ==", "operator +", "operator Größe", "Größe", "ße"]
+        expected = {
+            phrase
+            for phrase in phrases
+            if re.search(rf"(?<![A-Za-z0-9_]){re.escape(phrase)}(?![A-Za-z0-9_])", self.CORPUS)
+        }
+
+        self.assertEqual(find_phrases(self.CORPUS, phrases), expected)
+        self.assertIn("operator >=", expected)
+        self.assertNotIn("operator ==", expected)
+
+    def test_precomputed_lookups_match_corpus_scans(self) -> None:
+        entries = [
+            ApiEntry("a.cs", "public class Button", "type", "Button"),
+            ApiEntry("a.cs", "public class Between", "type", "Between"),
+            ApiEntry("a.cs", "public class Größe", "type", "Größe"),
+            ApiEntry("a.cs", "public static bool operator >=(A a, A b)", "operator", ">="),
+            ApiEntry("a.cs", "public static bool operator ==(A a, A b)", "operator", "=="),
+            ApiEntry("a.cs", "public int this[int i] { get; }", "indexer", "this[]"),
+            ApiEntry("a.cs", "public void Show()", "method", "Show", "Window"),
+        ]
+        plain = build_corpus_index(self.CORPUS)
+        index = build_corpus_index(self.CORPUS, coverage_phrases(entries))
+
+        self.assertEqual(index.phrases, {"Größe", "operator >=", "operator =="})
+        for text in ["Button", "Between", "Window.Show", "a", "missing", "x`y"]:
+            self.assertEqual(has_backticked(index, text), f"`{text}`" in self.CORPUS, text)
+        for entry in entries:
+            self.assertEqual(is_covered(entry, index), is_covered(entry, plain), entry.signature)
+        self.assertTrue(has_token(index, "Größe"))
+        self.assertFalse(has_token(index, "perator"))
+
+    def test_cached_index_matches_full_build_and_reindexes_only_edits(self) -> None:
+        texts = [
+            "# Buttons\nUse `Button.Click` and Foo(1).\n",
+            "# Ops\nSee operator >= and `Größe` with this[0].\n",
+            "# Tail\nCall Window . Show ( ) here",
+        ]
+        phrases = {"operator >=", "Größe"}
+        fields = ["tokens", "qualified", "method_calls", "phrases", "phrase_hits", "has_indexer"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "cache.sqlite"
+            full = build_corpus_index("\n\n".join(texts), phrases)
+            with ParseCache(cache_path) as cache:
+                cached = build_cached_corpus_index(texts, phrases, cache)
+            for field in fields:
+                self.assertEqual(getattr(cached, field), getattr(full, field), field)
+            self.assertTrue(cached.backtick_spans <= full.backtick_spans)
+
+            texts[1] = "# Ops\nNothing here.\n"
+            with ParseCache(cache_path) as cache:
+                cached = build_cached_corpus_index(texts, phrases, cache)
+                self.assertEqual((cache.stats.hits, cache.stats.misses), (4, 2))
+            full = build_corpus_index("\n\n".join(texts), phrases)
+            for field in fields:
+                self.assertEqual(getattr(cached, field), getattr(full, field), field)
+
+    def test_cached_index_handles_matches_across_documents(self) -> None:
+        texts = ["Call Window.", "Show and Render", "(value)"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with ParseCache(Path(temp_dir) / "cache.sqlite") as cache:
+                cached = build_cached_corpus_index(texts, (), cache)
+        full = build_corpus_index("\n\n".join(texts))
+
+        self.assertIn(("Window", "Show"), full.qualified)
+        self.assertIn("Render", full.method_calls)
+        self.assertEqual(cached.qualified, full.qualified)
+        self.assertEqual(cached.method_calls, full.method_calls)
+
+
+class AttributionTests(unittest.TestCase):
+    def test_attributes_covered_entries_to_doc_lines(self) -> None:
+        entries = [
+            ApiEntry("Button.cs", "public class Button", "type", "Button"),
+            ApiEntry("Button.cs", "public void Click()", "method", "Click", "Button"),
+            ApiEntry("Button.cs", "public bool IsDefault { get; }", "member", "IsDefault", "Button"),
+            ApiEntry("Button.cs", "public static bool operator ==(Button a, Button b)", "operator", "==", "Button"),
+            ApiEntry("Button.cs", "public int this[int index] { get; }", "indexer", "this[]", "Button"),
+        ]
+        docs = ["buttons.md", "misc.md"]
+        texts = [
+            "# Buttons\n\nCall `Click` on a\nButton via button.Click().\n",
+            "Use operator == and this[0].\n\nSet `IsDefault`.",
+        ]
+
+        attribution = dict(attribute_coverage(entries, docs, texts))
+
+        self.assertEqual(attribution[entries[0]], {"buttons.md": [4]})
+        self.assertEqual(attribution[entries[1]], {"buttons.md": [3, 4]})
+        self.assertEqual(attribution[entries[2]], {"misc.md": [3]})
+        self.assertEqual(attribution[entries[3]], {"misc.md": [1]})
+        self.assertEqual(attribution[entries[4]], {"misc.md": [1]})
+
+        index = build_corpus_index("\n\n".join(texts), coverage_phrases(entries))
+        self.assertEqual(set(attribution), {entry for entry in entries if is_covered(entry, index)})
+
+    def test_attribution_rows_keep_the_namespace(self) -> None:
+        entries = [
+            ApiEntry("A/Thickness.cs", "public struct Thickness", "type", "Thickness", None, "Avalonia"),
+            ApiEntry("B/Thickness.cs", "public struct Thickness", "type", "Thickness", None, "Avalonia.Layout"),
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_path = Path(temp_dir) / "api-index-generated.md"
+            index_path.write_text("# API Index\n", encoding="utf-8")
+            path = Path(temp_dir) / "attribution.jsonl"
+            write_attribution(path, index_path, [(entry, {"layout.md": [2]}) for entry in entries])
+            lines = path.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(json.loads(lines[0])["version"], 2)
+        self.assertEqual([json.loads(line)["namespace"] for line in lines[1:]], ["Avalonia", "Avalonia.Layout"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,103 @@
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from scripts.find_uncovered_apis import load_api_index, parse_api_index, read_api_index_sidecar, sidecar_path_for
+from scripts.generate_api_index import write_markdown
+from scripts.output_files import file_sha256
+from scripts.tree_readers import FilesystemTreeReader
+
+
+def write_sample_repo(repo: Path) -> None:
+    sources = {
+        "src/Avalonia.Controls/Button.cs": """\
+            namespace Avalonia.Controls;
+
+            public class Button : ContentControl
+            {
+                public void Click() { }
+                public string? Text { get; set; }
+            }
+            """,
+        "src/Avalonia.Base/Threading/Dispatcher.cs": """\
+            namespace Avalonia.Threading
+            {
+                public interface IDispatcher
+                {
+                    void Post(Action action);
+                }
+
+                internal class Hidden
+                {
+                    public void Run() { }
+                }
+            }
+            """,
+        "src/Markup/Avalonia.Markup.Xaml/Loader.cs": """\
+            namespace Avalonia.Markup.Xaml;
+
+            public static class AvaloniaXamlLoader
+            {
+                public static object Load(
+                    Uri uri,
+                    Uri? baseUri = null);
+            }
+            """,
+    }
+    for rel, content in sources.items():
+        path = repo / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(content), encoding="utf-8")
+
+
+def without_run_details(text: str) -> str:
+    return "\n".join(
+        line
+        for line in text.splitlines()
+        if not line.startswith(("- Generated at (UTC):", "python3 scripts/generate_api_index.py"))
+    )
+
+
+class GenerateApiIndexTests(unittest.TestCase):
+    def test_parallel_scan_matches_serial_output(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir) / "repo"
+            write_sample_repo(repo)
+            tree = FilesystemTreeReader(repo)
+            files = tree.list_files(["src/**/*.cs"])
+
+            serial = Path(temp_dir) / "serial" / "index.md"
+            parallel = Path(temp_dir) / "parallel" / "index.md"
+            serial_counts = write_markdown(serial, tree, "repo", files, max_per_file=300)
+            parallel_counts = write_markdown(parallel, tree, "repo", files, max_per_file=300, jobs=2)
+
+            self.assertEqual(serial_counts, parallel_counts)
+            self.assertEqual(
+                without_run_details(serial.read_text(encoding="utf-8")),
+                without_run_details(parallel.read_text(encoding="utf-8")),
+            )
+            self.assertIn("- `public static object Load( Uri uri, Uri? baseUri = null);`", serial.read_text(encoding="utf-8"))
+
+    def test_sidecar_matches_parsed_markdown(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir) / "repo"
+            write_sample_repo(repo)
+            tree = FilesystemTreeReader(repo)
+            output = Path(temp_dir) / "index.md"
+            write_markdown(output, tree, "repo", tree.list_files(["src/**/*.cs"]), max_per_file=1)
+
+            expected = parse_api_index(output)
+            sidecar = read_api_index_sidecar(sidecar_path_for(output), file_sha256(output))
+            self.assertEqual(sidecar, expected)
+            self.assertIn("Avalonia.Controls", {entry.namespace for entry in expected})
+
+            # A markdown edited after generation no longer matches its sidecar.
+            output.write_text(output.read_text(encoding="utf-8") + "\n- `public void Added() { }`", encoding="utf-8")
+            self.assertIsNone(read_api_index_sidecar(sidecar_path_for(output), file_sha256(output)))
+            self.assertEqual(load_api_index(output), parse_api_index(output))
+            self.assertEqual(load_api_index(output)[-1].symbol, "Added")
+
+
+if __name__ == "__main__":
+    unittest.main()
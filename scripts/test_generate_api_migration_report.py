@@ -1,3 +1,4 @@
+import subprocess
 import sys
 import tempfile
 import textwrap
@@ -7,13 +8,39 @@ from unittest.mock import patch
 
 from scripts.generate_api_migration_report import (
     ApiItem,
+    SuppressionEntry,
     build_added_api_section,
+    build_breaking_summary,
+    build_rename_section,
+    detect_renames,
+    diff_added_items,
+    diff_changed_api_items,
+    diff_removed_items,
+    doc_id_key_for_target,
     extract_api_items,
     main,
     normalize_target_name,
+    parse_api_items,
+    parse_suppression_documents,
     parse_suppressions,
+    scan_api_item_sets,
+    scan_api_items,
 )
 from scripts.generate_api_index import extract_signatures
+from scripts.tree_readers import GitTreeReader
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def commit_tree(repo: Path, tag: str, files: dict[str, str]) -> None:
+    for rel, content in files.items():
+        (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+        (repo / rel).write_text(textwrap.dedent(content), encoding="utf-8")
+    git(repo, "add", "-A")
+    git(repo, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", tag)
+    git(repo, "tag", tag)
 
 
 class GenerateApiMigrationReportTests(unittest.TestCase):
@@ -57,6 +84,111 @@ class GenerateApiMigrationReportTests(unittest.TestCase):
         self.assertEqual(entries[0].diagnostic_id, "CP0002")
         self.assertEqual(entries[0].target, "M:Avalonia.Controls.Window.Show")
 
+    def test_parse_suppression_documents_streams_top_level_entries_in_parallel(self) -> None:
+        def document(framework: str) -> bytes:
+            return textwrap.dedent(
+                f"""\
+                <?xml version="1.0" encoding="utf-8"?>
+                <Suppressions>
+                  <Suppression>
+                    <DiagnosticId>CP0002</DiagnosticId>
+                    <Target>M:Avalonia.Controls.Window.Show</Target>
+                    <Left>baseline/{framework}/Avalonia.Controls.dll</Left>
+                    <Right>current/{framework}/Avalonia.Controls.dll</Right>
+                  </Suppression>
+                  <Group>
+                    <Suppression><DiagnosticId>CP0001</DiagnosticId><Target>T:Nested</Target></Suppression>
+                  </Group>
+                  <Suppression><DiagnosticId>CP0001</DiagnosticId></Suppression>
+                  <Suppression><DiagnosticId>CP0009</DiagnosticId><Target>T:Avalonia.Controls.Button</Target></Suppression>
+                </Suppressions>
+                """
+            ).encode("utf-8")
+
+        documents = [
+            ("api/Avalonia.nupkg.xml", document("net8.0")),
+            ("api/Avalonia.Desktop.nupkg.xml", document("net8.0")),
+            ("api/Avalonia.nupkg.xml", document("net10.0")),
+        ]
+
+        entries = parse_suppression_documents(documents)
+
+        self.assertEqual(parse_suppression_documents(documents, jobs=2), entries)
+        self.assertEqual(
+            [(entry.package, entry.diagnostic_id, entry.target, entry.left) for entry in entries],
+            [
+                ("Avalonia", "CP0002", "M:Avalonia.Controls.Window.Show", "baseline/net8.0/Avalonia.Controls.dll"),
+                ("Avalonia", "CP0009", "T:Avalonia.Controls.Button", ""),
+                ("Avalonia.Desktop", "CP0002", "M:Avalonia.Controls.Window.Show", "baseline/net8.0/Avalonia.Controls.dll"),
+                ("Avalonia.Desktop", "CP0009", "T:Avalonia.Controls.Button", ""),
+            ],
+        )
+
+    def test_doc_id_keys_match_parsed_items(self) -> None:
+        source = textwrap.dedent(
+            """\
+            namespace Avalonia.Collections;
+            public class AvaloniaList<T>
+            {
+                public AvaloniaList(int capacity) { }
+                public T this[int index] => default!;
+                public void Move<TItem>(TItem item) { }
+                public static bool operator ==(AvaloniaList<T> left, AvaloniaList<T> right) => true;
+                public static implicit operator T[](AvaloniaList<T> list) => null!;
+                public class Enumerator { }
+            }
+            """
+        )
+        keys = {item.doc_id_key for item in parse_api_items("src/Avalonia.Base/Collections/AvaloniaList.cs", source)}
+
+        targets = {
+            "T:Avalonia.Collections.AvaloniaList`1": "Avalonia.Collections.AvaloniaList",
+            "T:Avalonia.Collections.AvaloniaList`1.Enumerator": "Avalonia.Collections.AvaloniaList.Enumerator",
+            "M:Avalonia.Collections.AvaloniaList`1.#ctor(System.Int32)": "Avalonia.Collections.AvaloniaList.AvaloniaList",
+            "P:Avalonia.Collections.AvaloniaList`1.Item(System.Int32)": "Avalonia.Collections.AvaloniaList.this[]",
+            "M:Avalonia.Collections.AvaloniaList`1.Move``1(``0)": "Avalonia.Collections.AvaloniaList.Move",
+            "M:Avalonia.Collections.AvaloniaList`1.op_Equality(Avalonia.Collections.AvaloniaList{`0},Avalonia.Collections.AvaloniaList{`0})": "Avalonia.Collections.AvaloniaList.==",
+        }
+        for target, expected in targets.items():
+            self.assertEqual(doc_id_key_for_target(target), expected, target)
+            self.assertIn(expected, keys, target)
+
+        self.assertEqual(doc_id_key_for_target("M:Avalonia.Size.op_Implicit(Avalonia.Vector)~Avalonia.Size"), "Avalonia.Size.Size")
+        self.assertIsNone(doc_id_key_for_target("N:Avalonia.Collections"))
+
+    def test_breaking_summary_shows_linked_signatures(self) -> None:
+        def item(signature: str) -> ApiItem:
+            return ApiItem(
+                area="Application Model and Controls",
+                source_file="src/Avalonia.Controls/Window.cs",
+                namespace="Avalonia.Controls",
+                container="Window",
+                kind="method",
+                symbol="Show",
+                signature=signature,
+            )
+
+        suppressions = [
+            SuppressionEntry("Avalonia", "CP0002", "M:Avalonia.Controls.Window.Show", "baseline", "current"),
+            SuppressionEntry("Avalonia", "CP0002", "M:Avalonia.Controls.Window.Hide", "baseline", "current"),
+        ]
+        lines = list(
+            build_breaking_summary(
+                suppressions,
+                removed_items=[item("public void Show() { }")],
+                added_items=[item("public void Show(Window owner) { }")],
+            )
+        )
+
+        self.assertIn("- Suppressions linked to changed source signatures: `1`", lines)
+        show = lines.index("- `Avalonia.Controls.Window.Show` (method/member; baseline `baseline` -> current `current`)")
+        self.assertEqual(
+            lines[show + 1 : show + 3],
+            ["  - before: `public void Show() { }`", "  - after: `public void Show(Window owner) { }`"],
+        )
+        hide = lines.index("- `Avalonia.Controls.Window.Hide` (method/member; baseline `baseline` -> current `current`)")
+        self.assertFalse(lines[hide + 1].startswith("  - "))
+
     def test_build_added_api_section_formats_container_separately(self) -> None:
         lines = build_added_api_section(
             "Added Public APIs",
@@ -227,6 +359,228 @@ class GenerateApiMigrationReportTests(unittest.TestCase):
         self.assertEqual(exit_code, 4)
         self.assertEqual(cleanup_calls, ["from"])
 
+    def test_changed_only_diff_matches_full_scan(self) -> None:
+        shared_part = """
+            namespace Demo;
+            public partial class Foo
+            {
+                public void Shared() { }
+                public void Kept() { }
+            }
+            """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir)
+            git(repo, "init", "-q")
+            commit_tree(
+                repo,
+                "v1",
+                {
+                    "src/Shared.cs": shared_part,
+                    "src/Foo.cs": """
+                        namespace Demo;
+                        public partial class Foo
+                        {
+                            public void Run() { }
+                            public void Kept() { }
+                        }
+                        """,
+                    "src/Bar.cs": "namespace Demo;\npublic class Bar { }\n",
+                },
+            )
+            commit_tree(
+                repo,
+                "v2",
+                {
+                    "src/Foo.cs": """
+                        namespace Demo;
+                        public partial class Foo
+                        {
+                            public void Shared() { }
+                            public int this[int index] => index;
+                        }
+                        """,
+                },
+            )
+
+            old_tree = GitTreeReader(repo, "v1")
+            new_tree = GitTreeReader(repo, "v2")
+            try:
+                old_items = scan_api_items(old_tree)
+                new_items = scan_api_items(new_tree)
+                added, removed = diff_changed_api_items(repo, "v1", "v2", old_tree, new_tree)
+            finally:
+                old_tree.close()
+                new_tree.close()
+
+        self.assertEqual(added, diff_added_items(old_items, new_items))
+        self.assertEqual(removed, diff_removed_items(old_items, new_items))
+        self.assertEqual([item.symbol for item in added], ["this[]"])
+        self.assertEqual([item.symbol for item in removed], ["Run"])
+
+    def test_concurrent_main_cleans_up_prepared_ref_if_other_ref_fails(self) -> None:
+        cleanup_calls: list[str] = []
+
+        def prepare(repo: Path, git_ref: str, backend: str):
+            if git_ref == "bad-ref":
+                raise RuntimeError("unknown ref: bad-ref")
+            return repo, git_ref, lambda: cleanup_calls.append(git_ref)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir)
+            argv = [
+                "generate_api_migration_report.py",
+                "--repo",
+                str(repo),
+                "--from-ref",
+                "good-ref",
+                "--to-ref",
+                "bad-ref",
+                "--output",
+                str(repo / "report.md"),
+                "--concurrent",
+            ]
+
+            with (
+                patch.object(sys, "argv", argv),
+                patch("scripts.generate_api_migration_report.prepare_scan_repo", side_effect=prepare),
+            ):
+                exit_code = main()
+
+        self.assertEqual(exit_code, 4)
+        self.assertEqual(cleanup_calls, ["good-ref"])
+
+    def test_scanning_both_sides_together_matches_separate_scans(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir)
+            git(repo, "init", "-q")
+            commit_tree(
+                repo,
+                "v1",
+                {
+                    "src/Foo.cs": "namespace Demo;\npublic class Foo\n{\n    public void Run() { }\n}\n",
+                    "src/Bar.cs": "namespace Demo;\npublic class Bar { }\n",
+                },
+            )
+            commit_tree(repo, "v2", {"src/Foo.cs": "namespace Demo;\npublic class Foo\n{\n    public void Stop() { }\n}\n"})
+
+            old_tree = GitTreeReader(repo, "v1")
+            new_tree = GitTreeReader(repo, "v2")
+            try:
+                together = scan_api_item_sets([(old_tree, None), (new_tree, None)])
+                separate = [scan_api_items(old_tree), scan_api_items(new_tree)]
+            finally:
+                old_tree.close()
+                new_tree.close()
+
+        self.assertEqual(together, separate)
+        self.assertEqual([item.symbol for item in together[1]], ["Bar", "Foo", "Stop"])
+
+    def test_detect_renames_pairs_renames_and_moves(self) -> None:
+        removed = parse_api_items(
+            "src/Old.cs",
+            """
+            namespace Demo;
+            public class TextRange
+            {
+                public virtual void Recalulate(int start, int length) { }
+                public void Dispose() { }
+            }
+            public class LegacyRange
+            {
+                public static readonly StyledProperty<int> StartProperty = AvaloniaProperty.Register<LegacyRange, int>(nameof(Start));
+            }
+            """,
+        )
+        added = parse_api_items(
+            "src/New.cs",
+            """
+            namespace Demo;
+            public class TextRange
+            {
+                public void Recalculate(int start, int length) { }
+                public bool Dispose() => true;
+            }
+            public class CodepointRange
+            {
+                public static readonly StyledProperty<int> StartProperty = AvaloniaProperty.Register<CodepointRange, int>(nameof(Start));
+            }
+            public class Unrelated
+            {
+                public string Describe(object value, IFormatProvider provider) => "";
+            }
+            """,
+        )
+        removed = diff_removed_items(removed, added)
+        added = diff_added_items(parse_api_items("src/Old.cs", ""), added)
+
+        pairs = {
+            (candidate.removed.doc_id_key, candidate.added.doc_id_key): candidate.relation
+            for candidate in detect_renames(removed, added)
+        }
+
+        self.assertEqual(
+            pairs,
+            {
+                ("Demo.TextRange.Recalulate", "Demo.TextRange.Recalculate"): "rename",
+                ("Demo.LegacyRange.StartProperty", "Demo.CodepointRange.StartProperty"): "move",
+            },
+        )
+        lines = list(build_rename_section(detect_renames(removed, added)))
+        self.assertIn("- `rename`: `1`", lines)
+        self.assertIn("  - after: `public void Recalculate(int start, int length) { }`", lines)
+
+    def test_detect_renames_ignores_signatures_changed_in_place(self) -> None:
+        old_items = parse_api_items(
+            "src/Controls.cs",
+            """
+            namespace Demo;
+            public class Button
+            {
+                public void Dispose() { }
+                public static readonly StyledProperty<string?> WatermarkProperty = TextBox.WatermarkProperty.AddOwner<Button>();
+            }
+            public class TextBox
+            {
+                public void Dispose() { }
+                public static readonly StyledProperty<string?> WatermarkProperty = AvaloniaProperty.Register<TextBox, string?>(nameof(Watermark));
+            }
+            public class Slider
+            {
+                public void Dispose() { }
+            }
+            """,
+        )
+        new_items = parse_api_items(
+            "src/Controls.cs",
+            """
+            namespace Demo;
+            public class Button
+            {
+                public void Dispose(bool disposing) { }
+                public static readonly StyledProperty<string?> WatermarkProperty = PlaceholderTextProperty;
+            }
+            public class TextBox
+            {
+                public void Dispose(bool disposing) { }
+                public static readonly StyledProperty<string?> WatermarkProperty = PlaceholderTextProperty;
+            }
+            public class Slider
+            {
+                public void Dispose(bool disposing) { }
+                public void Reset() { }
+            }
+            public class Track
+            {
+                public void Reset() { }
+            }
+            """,
+        )
+        removed = diff_removed_items(old_items, new_items)
+        added = diff_added_items(old_items, new_items)
+
+        self.assertEqual(len(removed), 5)
+        self.assertEqual(detect_renames(removed, added), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,193 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+from scripts.generate_control_reference_docs import (
+    TypeInfo,
+    base_reference,
+    collect_types,
+    determine_control_types,
+    list_control_files,
+    main,
+    resolve_generated_at,
+)
+from scripts.tree_readers import GitTreeReader
+
+FILES = {
+    "src/Avalonia.Controls/Control.cs": "namespace Avalonia.Controls;\npublic class Control { }\n",
+    "src/Avalonia.Controls/Primitives/TemplatedControl.cs": (
+        "namespace Avalonia.Controls.Primitives;\npublic abstract class TemplatedControl : Control\n{\n"
+        "    public void ApplyTemplate() { }\n}\n"
+    ),
+    "src/Avalonia.Controls.ColorPicker/ColorPicker.cs": (
+        "namespace Avalonia.Controls;\npublic class ColorPicker : Primitives.TemplatedControl { }\n"
+    ),
+    "src/Avalonia.Controls/Button.xaml": "<Style />\n",
+    "src/Avalonia.Base/Visual.cs": "namespace Avalonia;\npublic class Visual { }\n",
+}
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+def commit_files(repo: Path, message: str, files: dict[str, str | None]) -> None:
+    for rel, content in files.items():
+        if content is None:
+            (repo / rel).unlink()
+            continue
+        (repo / rel).parent.mkdir(parents=True, exist_ok=True)
+        (repo / rel).write_text(content, encoding="utf-8")
+    git(repo, "add", "-A")
+    git(repo, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", message)
+    git(repo, "tag", message)
+
+
+class ControlReferenceDocsTests(unittest.TestCase):
+    def test_collects_control_types_from_git_ref(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir)
+            git(repo, "init", "-q")
+            commit_files(repo, "v1", FILES)
+            (repo / "src/Avalonia.Controls/Control.cs").unlink()
+
+            tree = GitTreeReader(repo, "HEAD")
+            try:
+                files = list_control_files(tree)
+                type_infos = collect_types(tree, files)
+            finally:
+                tree.close()
+
+        self.assertEqual(
+            files,
+            [
+                "src/Avalonia.Controls.ColorPicker/ColorPicker.cs",
+                "src/Avalonia.Controls/Control.cs",
+                "src/Avalonia.Controls/Primitives/TemplatedControl.cs",
+            ],
+        )
+        self.assertEqual(
+            determine_control_types(type_infos),
+            {
+                "Avalonia.Controls.Control": 0,
+                "Avalonia.Controls.Primitives.TemplatedControl": 1,
+                "Avalonia.Controls.ColorPicker": 2,
+            },
+        )
+        self.assertEqual(type_infos["Avalonia.Controls.Primitives.TemplatedControl"].members, ["public void ApplyTemplate() { }"])
+
+    def test_control_hierarchy_resolves_bases_by_namespace(self) -> None:
+        def type_info(full_name: str, *bases: str) -> TypeInfo:
+            namespace, _, name = full_name.rpartition(".")
+            return TypeInfo(
+                name=name,
+                namespace=namespace,
+                source_file="src/Avalonia.Controls/Types.cs",
+                assembly="Avalonia.Controls",
+                declaration=f"public class {name}",
+                is_abstract=False,
+                base_names={base.split(".")[-1] for base in bases},
+                base_refs={base_reference(base) for base in bases},
+            )
+
+        infos = [
+            type_info("Avalonia.Controls.Control", "InputElement"),
+            type_info("Avalonia.Controls.WindowBase", "TopLevel"),
+            type_info("Avalonia.Controls.TopLevel", "ContentControl"),
+            type_info("Avalonia.Controls.ContentControl", "Primitives.TemplatedControl"),
+            type_info("Avalonia.Controls.Primitives.TemplatedControl", "Control"),
+            type_info("Avalonia.Controls.Window", "WindowBase", "IDisposable"),
+            type_info("Avalonia.Controls.Documents.Control", "Avalonia.StyledElement"),
+            type_info("Avalonia.Controls.Documents.Run", "Control"),
+            type_info("Avalonia.Diagnostics.Panel", "global::Avalonia.Controls.Control"),
+        ]
+        type_infos = {info.full_name: info for info in infos}
+
+        depths = determine_control_types(type_infos)
+
+        self.assertEqual(
+            depths,
+            {
+                "Avalonia.Controls.Control": 0,
+                "Avalonia.Controls.TopLevel": 0,
+                "Avalonia.Controls.WindowBase": 0,
+                "Avalonia.Controls.Primitives.TemplatedControl": 1,
+                "Avalonia.Diagnostics.Panel": 1,
+                "Avalonia.Controls.Window": 1,
+                "Avalonia.Controls.ContentControl": 2,
+            },
+        )
+
+    def test_incremental_run_rewrites_only_changed_docs(self) -> None:
+        def run(output_dir: Path, git_ref: str) -> tuple[int, str]:
+            argv = ["generate_control_reference_docs.py", "--repo", str(repo), "--git-ref", git_ref]
+            argv += ["--output-dir", str(output_dir), "--incremental", "--no-cache"]
+            stdout = io.StringIO()
+            with patch.object(sys, "argv", argv), redirect_stdout(stdout):
+                exit_code = main()
+            return exit_code, stdout.getvalue()
+
+        def snapshot(output_dir: Path) -> dict[str, tuple[int, bytes]]:
+            return {path.name: (path.stat().st_mtime_ns, path.read_bytes()) for path in output_dir.iterdir()}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir) / "repo"
+            output_dir = Path(temp_dir) / "controls"
+            repo.mkdir()
+            git(repo, "init", "-q")
+            commit_files(repo, "v1", FILES)
+            commit_files(
+                repo,
+                "v2",
+                {
+                    "src/Avalonia.Controls.ColorPicker/ColorPicker.cs": FILES[
+                        "src/Avalonia.Controls.ColorPicker/ColorPicker.cs"
+                    ].replace("{ }", "{\n    public void Pick() { }\n}"),
+                    "src/Avalonia.Controls/Primitives/TemplatedControl.cs": None,
+                    "src/Avalonia.Controls/Primitives/Templated.cs": FILES[
+                        "src/Avalonia.Controls/Primitives/TemplatedControl.cs"
+                    ],
+                },
+            )
+
+            self.assertEqual(run(output_dir, "v1")[0], 0)
+            # Force distinct mtimes for anything rewritten below.
+            for path in output_dir.iterdir():
+                os.utime(path, ns=(0, 0))
+            first = snapshot(output_dir)
+
+            exit_code, stdout = run(output_dir, "v1")
+            self.assertEqual(exit_code, 0)
+            self.assertIn("Docs written: 0; unchanged: 0; skipped by manifest: 3; removed: 0", stdout)
+            self.assertEqual(snapshot(output_dir), first)
+
+            exit_code, stdout = run(output_dir, "v2")
+            self.assertEqual(exit_code, 0)
+            self.assertIn("Docs written: 2; unchanged: 0; skipped by manifest: 1; removed: 0", stdout)
+            second = snapshot(output_dir)
+            changed = {name for name in second if second[name] != first.get(name)}
+            self.assertEqual(changed, {"color-picker.md", "primitives-templated-control.md", "README.md", ".manifest.json"})
+            self.assertIn(b"public void Pick() { }", second["color-picker.md"][1])
+            self.assertIn(b"Primitives/Templated.cs", second["primitives-templated-control.md"][1])
+
+            manifest = json.loads(second[".manifest.json"][1])
+            self.assertEqual(manifest["git_ref"], "v2")
+            self.assertEqual(sorted(manifest["docs"]), ["color-picker.md", "control.md", "primitives-templated-control.md"])
+
+    def test_resolve_generated_at_prefers_timestamp_then_source_date_epoch(self) -> None:
+        with patch.dict(os.environ, {"SOURCE_DATE_EPOCH": "1700000000"}):
+            self.assertEqual(resolve_generated_at(None), "2023-11-14 22:13:20Z")
+            self.assertEqual(resolve_generated_at("2026-01-02T03:04:05+01:00"), "2026-01-02 02:04:05Z")
+        with self.assertRaises(ValueError):
+            resolve_generated_at("yesterday")
+
+
+if __name__ == "__main__":
+    unittest.main()
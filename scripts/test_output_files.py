@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.output_files import write_bytes_atomic, write_lines_atomic, write_text_if_changed
+
+
+class WriteLinesAtomicTests(unittest.TestCase):
+    def test_matches_joined_write_text(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "nested" / "report.md"
+            lines = ["# Title", "", "- `public void Run() { }`", "ünïcode", ""]
+
+            write_lines_atomic(output, iter(lines))
+
+            self.assertEqual(output.read_text(encoding="utf-8"), "\n".join(lines))
+
+    def test_failed_render_keeps_previous_output(self) -> None:
+        def failing_lines():
+            yield "partial"
+            raise RuntimeError("render failed")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "report.md"
+            output.write_text("previous", encoding="utf-8")
+
+            with self.assertRaises(RuntimeError):
+                write_lines_atomic(output, failing_lines())
+
+            self.assertEqual(output.read_text(encoding="utf-8"), "previous")
+            self.assertEqual([path.name for path in Path(temp_dir).iterdir()], ["report.md"])
+
+    def test_write_text_if_changed_skips_identical_content(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "doc.md"
+
+            self.assertTrue(write_text_if_changed(output, "# Doc\n"))
+            self.assertFalse(write_text_if_changed(output, "# Doc\n"))
+            self.assertTrue(write_text_if_changed(output, "# Doc!\n"))
+
+            self.assertEqual(output.read_text(encoding="utf-8"), "# Doc!\n")
+
+    def test_write_bytes_atomic_replaces_content(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "nested" / "index.lookup"
+
+            write_bytes_atomic(output, b"\x00\x01old")
+            write_bytes_atomic(output, b"\x00\x01new")
+
+            self.assertEqual(output.read_bytes(), b"\x00\x01new")
+            self.assertEqual([path.name for path in output.parent.iterdir()], ["index.lookup"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.pack_context import (
+    build_bundle,
+    pack_sections,
+    parse_workflow,
+    read_bundle_texts,
+    render_bundle,
+    workflow_boosts,
+)
+from scripts.search_references import SearchIndex, SectionHit
+
+SKILL = """# Skill
+
+## Workflow
+
+1. Lock platform bootstrap and storage access.
+- Read `references/05-platforms.md`.
+- Read `references/29-storage-provider.md`.
+
+2. Build item lists with virtualization.
+- Read `references/20-virtualization.md`.
+- Use detailed topic docs under `references/wpf-to-avalonia/`.
+
+## Execution Rules
+
+- Read `references/99-ignored.md`.
+"""
+
+
+def hit(path: str, score: float, tokens: int, offset: int = 0) -> SectionHit:
+    return SectionHit(
+        path=path,
+        heading_path=f"{path} section",
+        start_line=1,
+        end_line=2,
+        score=score,
+        offset=offset,
+        size=tokens * 4,
+        tokens=tokens,
+    )
+
+
+class WorkflowTests(unittest.TestCase):
+    def test_parse_workflow_collects_step_references(self) -> None:
+        steps = parse_workflow(SKILL)
+
+        self.assertEqual([step.number for step in steps], [1, 2])
+        self.assertEqual(steps[0].references, ["05-platforms.md", "29-storage-provider.md"])
+        self.assertEqual(steps[1].references, ["20-virtualization.md", "wpf-to-avalonia/"])
+
+    def test_best_matching_steps_boost_their_references(self) -> None:
+        boosts = workflow_boosts(parse_workflow(SKILL), "virtualization of long item lists")
+
+        self.assertEqual(boosts, {"20-virtualization.md": 1.0, "wpf-to-avalonia/": 1.0})
+        self.assertEqual(workflow_boosts(parse_workflow(SKILL), "nothing relevant"), {})
+
+
+class PackSectionsTests(unittest.TestCase):
+    def test_fills_budget_by_score_per_token_with_same_doc_decay(self) -> None:
+        hits = [
+            hit("a.md", 10.0, 100),
+            hit("a.md", 9.0, 100, offset=400),
+            hit("b.md", 8.0, 100),
+            hit("c.md", 9.5, 500),
+            hit("d.md", 1.0, 10),
+        ]
+
+        packed = pack_sections(hits, budget=250, boosts={})
+
+        # b.md beats the second a.md section once a.md's value decays; c.md never fits; d.md is below the score floor.
+        self.assertEqual([(item.hit.path, item.hit.offset) for item in packed], [("a.md", 0), ("b.md", 0)])
+        self.assertLessEqual(sum(item.hit.tokens for item in packed), 250)
+
+    def test_skips_heading_only_and_table_of_contents_sections(self) -> None:
+        title = hit("a.md", 20.0, 6)
+        title.has_body = False
+        contents = hit("a.md", 18.0, 40, offset=20)
+        contents.navigation = True
+        hits = [title, contents, hit("a.md", 10.0, 100, offset=200), hit("b.md", 2.5, 50)]
+
+        packed = pack_sections(hits, budget=1000, boosts={})
+
+        # The score floor is relative to the best section with content, so b.md still qualifies.
+        self.assertEqual([(item.hit.path, item.hit.offset) for item in packed], [("a.md", 200), ("b.md", 0)])
+
+    def test_workflow_boost_can_reorder_sections(self) -> None:
+        hits = [hit("a.md", 10.0, 100), hit("wpf-to-avalonia/b.md", 8.0, 100)]
+
+        packed = pack_sections(hits, budget=100, boosts={"wpf-to-avalonia/": 1.0})
+
+        self.assertEqual([item.hit.path for item in packed], ["wpf-to-avalonia/b.md"])
+
+
+class BuildBundleTests(unittest.TestCase):
+    def test_bundle_holds_exact_section_text_with_provenance(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            references = Path(temp_dir) / "references"
+            references.mkdir()
+            (references / "20-virtualization.md").write_text(
+                "# Virtualization\n\nLists.\n\n## Recycling\n\nRecycle item containers.\n\n## Styling\n\nBrushes.\n",
+                encoding="utf-8",
+            )
+            (references / "04-styles.md").write_text("# Styles\n\nSelectors and brushes.\n", encoding="utf-8")
+
+            with SearchIndex(Path(temp_dir) / "index.sqlite") as index:
+                index.update(references, [])
+                bundle = build_bundle(index, "recycle item containers", 1000, [])
+            texts = read_bundle_texts(references, bundle)
+
+        self.assertEqual([packed.hit.heading_path for packed in bundle.sections], ["Virtualization > Recycling"])
+        self.assertEqual(texts, ["## Recycling\n\nRecycle item containers.\n\n"])
+        lines = render_bundle("references", bundle, texts)
+        self.assertTrue(lines[2].startswith("<!-- source: references/20-virtualization.md:5-8 | Virtualization > Recycling"))
+        self.assertEqual(lines[3], "## Recycling\n\nRecycle item containers.")
+
+
+if __name__ == "__main__":
+    unittest.main()
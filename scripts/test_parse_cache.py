@@ -0,0 +1,74 @@
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from scripts.generate_api_index import scan_signatures
+from scripts.parse_cache import ParseCache, content_digest
+from scripts.tree_readers import FilesystemTreeReader
+
+
+class ParseCacheTests(unittest.TestCase):
+    def test_get_put_round_trip_counts_hits_and_misses(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache.sqlite"
+            digest = content_digest(b"public class Foo {}")
+
+            with ParseCache(path) as cache:
+                self.assertIsNone(cache.get("extractor", "1", digest))
+                cache.put("extractor", "1", digest, ["Sample", ["public class Foo {}"]])
+                self.assertEqual(cache.get("extractor", "1", digest), ["Sample", ["public class Foo {}"]])
+                self.assertIsNone(cache.get("extractor", "2", digest))
+                self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 2))
+
+            with ParseCache(path) as cache:
+                self.assertEqual(cache.get("extractor", "1", digest), ["Sample", ["public class Foo {}"]])
+
+    def test_close_evicts_least_recently_used_entries_over_cap(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache.sqlite"
+            payload = ["x" * 100]
+
+            with ParseCache(path, max_bytes=250) as cache:
+                for name in ("a", "b", "c"):
+                    cache.put("extractor", "1", name, payload)
+                cache.get("extractor", "1", "a")
+
+            self.assertEqual(cache.stats.evictions, 1)
+            with ParseCache(path, max_bytes=250) as cache:
+                self.assertIsNotNone(cache.get("extractor", "1", "a"))
+                self.assertIsNone(cache.get("extractor", "1", "b"))
+                self.assertIsNotNone(cache.get("extractor", "1", "c"))
+
+    def test_scan_signatures_reuses_cached_results_for_identical_content(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            source = textwrap.dedent(
+                """\
+                namespace Sample;
+
+                public class Foo
+                {
+                    public void Run() { }
+                }
+                """
+            )
+            (root / "First.cs").write_text(source, encoding="utf-8")
+            (root / "Second.cs").write_text(source, encoding="utf-8")
+            tree = FilesystemTreeReader(root)
+            files = ["First.cs", "Second.cs"]
+
+            uncached = scan_signatures(tree, files[:1])
+            with ParseCache(root / "cache.sqlite") as cache:
+                first_run = scan_signatures(tree, files, cache=cache)
+                self.assertEqual((cache.stats.hits, cache.stats.misses), (0, 1))
+            with ParseCache(root / "cache.sqlite") as cache:
+                second_run = scan_signatures(tree, files, cache=cache)
+                self.assertEqual((cache.stats.hits, cache.stats.misses), (2, 0))
+
+        self.assertEqual(first_run, uncached * 2)
+        self.assertEqual(second_run, uncached * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
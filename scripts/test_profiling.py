@@ -0,0 +1,124 @@
+import argparse
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+from scripts import profiling
+from scripts.csharp_declarations import scan_sources
+from scripts.generate_api_index import main as generate_api_index_main
+from scripts.profiling import (
+    Profiler,
+    add_profile_arguments,
+    current_profiler,
+    finish_profiling,
+    phase,
+    run_profiled,
+    start_profiling,
+)
+from scripts.tree_readers import FilesystemTreeReader
+
+
+def profile_args(*argv: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    add_profile_arguments(parser)
+    return parser.parse_args(list(argv))
+
+
+class ProfilingTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        profiling._active = Profiler()
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertIsNone(start_profiling(profile_args()))
+        with phase("parse"):
+            current_profiler().record_file("src/A.cs", 1.0)
+
+        self.assertEqual(current_profiler().phases, [])
+        self.assertEqual(current_profiler().slowest_files(), [])
+
+    def test_nested_phases_and_slowest_files_form_a_chrome_trace(self) -> None:
+        profiler = Profiler(enabled=True, top_files=2)
+        with profiler.phase("scan"):
+            with profiler.phase("parse"):
+                for rel, seconds in [("a.cs", 0.1), ("b.cs", 0.3), ("c.cs", 0.2)]:
+                    profiler.record_file(rel, seconds)
+
+        trace = profiler.to_trace("generate_api_index")
+
+        events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual([event["name"] for event in events], ["scan", "parse"])
+        self.assertLessEqual(events[0]["ts"], events[1]["ts"])
+        self.assertGreaterEqual(events[0]["dur"], events[1]["dur"])
+        self.assertEqual(
+            trace["otherData"]["slowest_files"],
+            [{"file": "b.cs", "ms": 300.0}, {"file": "c.cs", "ms": 200.0}],
+        )
+        self.assertEqual(trace["otherData"]["files_timed"], 3)
+
+    def test_zero_top_files_counts_files_without_keeping_any(self) -> None:
+        profiler = Profiler(enabled=True, top_files=0)
+        profiler.record_file("a.cs", 0.1)
+
+        self.assertEqual(profiler.slowest_files(), [])
+        self.assertEqual(profiler.to_trace("test")["otherData"]["files_timed"], 1)
+        self.assertEqual(profile_args("--profile-top", "0").profile_top, 0)
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            profile_args("--profile-top", "-1")
+
+    def test_env_var_enables_profiling_and_scans_record_parsed_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for name in ["A", "B"]:
+                (root / f"{name}.cs").write_text(f"public class {name} {{ }}\n", encoding="utf-8")
+            trace_path = root / "trace.json"
+
+            with patch.dict("os.environ", {profiling.PROFILE_ENV: str(trace_path)}):
+                self.assertEqual(start_profiling(profile_args("--profile-top", "1")), trace_path.resolve())
+            with phase("parse sources"):
+                scan_sources(FilesystemTreeReader(root), ["A.cs", "B.cs"])
+            with patch("builtins.print"):
+                finish_profiling(trace_path.resolve(), "test")
+
+            trace = json.loads(trace_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(trace["otherData"]["files_timed"], 2)
+        self.assertEqual(len(trace["otherData"]["slowest_files"]), 1)
+        self.assertIn(trace["otherData"]["slowest_files"][0]["file"], {"A.cs", "B.cs"})
+        self.assertEqual([event["name"] for event in trace["traceEvents"] if event["ph"] == "X"], ["parse sources"])
+
+    def test_failed_run_still_writes_its_trace(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_path = Path(temp_dir) / "trace.json"
+            argv = ["generate_api_index.py", "--repo", str(Path(temp_dir) / "missing"), "--output", "out.md"]
+            argv += ["--profile", str(trace_path)]
+            with patch.object(sys, "argv", argv), redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                exit_code = generate_api_index_main()
+
+            trace = json.loads(trace_path.read_text(encoding="utf-8"))
+
+        self.assertEqual(exit_code, 2)
+        self.assertEqual(trace["otherData"]["files_timed"], 0)
+
+    def test_unwritable_trace_does_not_replace_the_run_outcome(self) -> None:
+        def run(args: argparse.Namespace) -> int:
+            raise RuntimeError("scan failed")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blocker = Path(temp_dir) / "file"
+            blocker.write_text("", encoding="utf-8")
+            args = profile_args("--profile", str(blocker / "trace.json"))
+            stderr = io.StringIO()
+            with redirect_stderr(stderr), self.assertRaisesRegex(RuntimeError, "scan failed"):
+                run_profiled(args, "test", run)
+
+        self.assertIn("error: could not write profile", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
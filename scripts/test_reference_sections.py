@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts import reference_sections
+from scripts.reference_sections import (
+    find_manifest_doc,
+    load_doc_sections,
+    read_sections,
+    scan_sections,
+    select_sections,
+    update_manifest,
+)
+
+DOC = """Intro before any heading.
+
+# Virtualization
+
+## Authoring Patterns
+
+### Enable virtualizing panel
+
+```xml
+# not a heading
+<VirtualizingStackPanel />
+```
+
+### Recycling-friendly template
+
+Use `FuncDataTemplate` with `supportsRecycling`.
+
+## Troubleshooting
+
+Check `ItemsPanel`.
+"""
+
+
+class ScanSectionsTests(unittest.TestCase):
+    def test_sections_carry_heading_paths_and_byte_ranges(self) -> None:
+        data = DOC.encode("utf-8")
+        sections = scan_sections(data)
+
+        self.assertEqual(
+            [(section.heading_path, section.level, section.line) for section in sections],
+            [
+                ("", 0, 1),
+                ("Virtualization", 1, 3),
+                ("Virtualization > Authoring Patterns", 2, 5),
+                ("Virtualization > Authoring Patterns > Enable virtualizing panel", 3, 7),
+                ("Virtualization > Authoring Patterns > Recycling-friendly template", 3, 14),
+                ("Virtualization > Troubleshooting", 2, 18),
+            ],
+        )
+        self.assertEqual(sum(section.length for section in sections), len(data))
+        recycling = sections[4]
+        self.assertEqual(
+            data[recycling.offset : recycling.offset + recycling.length].decode("utf-8"),
+            "### Recycling-friendly template\n\nUse `FuncDataTemplate` with `supportsRecycling`.\n\n",
+        )
+        self.assertEqual(recycling.tokens, (recycling.length + 3) // 4)
+
+    def test_select_sections_by_heading_and_line(self) -> None:
+        sections = scan_sections(DOC.encode("utf-8"))
+
+        self.assertEqual(select_sections(sections, ["troubleshooting"]), [5])
+        self.assertEqual(select_sections(sections, ["authoring patterns"], [15]), [2])
+        self.assertEqual(select_sections(sections, ["authoring patterns"], [15], include_subsections=False), [2, 4])
+        self.assertEqual(select_sections(sections, ["panel"]), [3])
+        self.assertEqual(select_sections(sections, ["missing"]), [])
+
+
+class ManifestTests(unittest.TestCase):
+    def test_reads_only_requested_sections_with_and_without_mmap(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            references = Path(temp_dir)
+            (references / "20-virtualization.md").write_text(DOC, encoding="utf-8")
+            manifest = references / "sections.jsonl"
+
+            doc = load_doc_sections(references, manifest, "20-virtualization.md")
+            indexes = select_sections(doc.sections, ["Authoring Patterns"])
+            seek_read = read_sections(references, doc, indexes)
+            own_text = read_sections(references, doc, indexes, include_subsections=False)
+            with mock.patch.object(reference_sections, "MMAP_MIN_BYTES", 1):
+                mapped_read = read_sections(references, doc, indexes)
+
+        start = DOC.index("## Authoring Patterns")
+        self.assertEqual(seek_read[0][1], DOC[start : DOC.index("## Troubleshooting")])
+        self.assertEqual(own_text[0][1], "## Authoring Patterns\n\n")
+        self.assertEqual(mapped_read, seek_read)
+
+    def test_update_rescans_only_changed_docs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            references = Path(temp_dir)
+            (references / "nested").mkdir()
+            (references / "20-virtualization.md").write_text(DOC, encoding="utf-8")
+            (references / "nested" / "04-styles.md").write_text("# Styles\n\nText.\n", encoding="utf-8")
+            (references / "07-old.md").write_text("# Old\n", encoding="utf-8")
+            manifest = references / "sections.jsonl"
+
+            _, first = update_manifest(references, manifest)
+            os.utime(references / "20-virtualization.md", ns=(0, 0))
+            (references / "nested" / "04-styles.md").write_text("# Styles\n\n## Selectors\n", encoding="utf-8")
+            (references / "07-old.md").unlink()
+            docs, second = update_manifest(references, manifest)
+            _, third = update_manifest(references, manifest)
+            styles = find_manifest_doc(manifest, "nested/04-styles.md")
+
+        self.assertEqual((first.docs, first.scanned, first.removed), (3, 3, 0))
+        self.assertEqual((second.docs, second.scanned, second.removed), (2, 1, 1))
+        self.assertEqual((third.scanned, third.removed), (0, 0))
+        self.assertEqual(docs["20-virtualization.md"].mtime_ns, 0)
+        self.assertEqual([section.heading_path for section in styles.sections], ["Styles", "Styles > Selectors"])
+
+
+if __name__ == "__main__":
+    unittest.main()
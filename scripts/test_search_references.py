@@ -0,0 +1,144 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.reference_sections import scan_sections
+from scripts.search_references import SearchIndex, locate_matches, query_terms, split_sections
+
+VIRTUALIZATION_DOC = """# ItemsControl Virtualization and Recycling
+
+Intro text about lists.
+
+## Recycling Containers
+
+Containers are reused while scrolling.
+
+```csharp
+// # not a heading
+var panel = new VirtualizingStackPanel();
+```
+
+## Scroll to Item
+
+Call `ScrollIntoView` on the `ListBox`.
+"""
+
+REPEATER_DOC = """# WinUI Migration
+
+## ItemsRepeater
+
+Use `ItemsRepeater` with a `StackLayout`; containers are recycled.
+"""
+
+STYLES_DOC = """# Styles
+
+Selectors and themes. Recycling is not covered here.
+"""
+
+
+def write_docs(root: Path) -> None:
+    (root / "winui").mkdir(parents=True, exist_ok=True)
+    (root / "20-virtualization.md").write_text(VIRTUALIZATION_DOC, encoding="utf-8")
+    (root / "winui" / "35-itemsrepeater.md").write_text(REPEATER_DOC, encoding="utf-8")
+    (root / "04-styles.md").write_text(STYLES_DOC, encoding="utf-8")
+    (root / "api-index-generated.md").write_text("# API Index\n\n- `ItemsRepeater`\n", encoding="utf-8")
+
+
+class SplitSectionsTests(unittest.TestCase):
+    def test_sections_follow_headings_outside_code_fences(self) -> None:
+        data = VIRTUALIZATION_DOC.encode("utf-8")
+        sections = split_sections(data)
+        manifest = {section.line: (section.offset, section.length) for section in scan_sections(data)}
+
+        self.assertEqual(
+            [(section.heading_path, section.start_line, section.end_line) for section in sections],
+            [
+                ("ItemsControl Virtualization and Recycling", 1, 4),
+                ("ItemsControl Virtualization and Recycling > Recycling Containers", 5, 13),
+                ("ItemsControl Virtualization and Recycling > Scroll to Item", 14, 16),
+            ],
+        )
+        for section in sections:
+            self.assertEqual(manifest[section.start_line], (section.offset, section.size))
+        recycling = sections[1].terms
+        self.assertEqual(recycling["containers"], 3 + 1)
+        self.assertEqual(recycling["recycling"], 3 + 1)
+        self.assertEqual(recycling["virtualizingstackpanel"], 1)
+        self.assertIn("`scrollintoview`", sections[2].terms)
+        self.assertEqual(recycling["`scrollintoview`"], 0)
+
+    def test_sections_record_heading_only_and_table_of_contents(self) -> None:
+        sections = split_sections(
+            b"# Guide\n\n## Table of Contents\n\n1. [Patterns](#patterns)\n\n## Patterns\n\n### Recycling\n\nReuse containers.\n"
+        )
+
+        self.assertEqual(
+            [(section.headings[-1], section.has_body, section.navigation) for section in sections],
+            [
+                ("Guide", False, False),
+                ("Table of Contents", True, True),
+                ("Patterns", False, False),
+                ("Recycling", True, False),
+            ],
+        )
+
+    def test_query_words_also_match_code_spans(self) -> None:
+        self.assertEqual(
+            query_terms("ItemsRepeater `StackLayout`"),
+            {"itemsrepeater": 1.0, "`itemsrepeater`": 0.5, "stacklayout": 1.0, "`stacklayout`": 1.0},
+        )
+
+
+class SearchIndexTests(unittest.TestCase):
+    def test_ranks_heading_and_code_span_matches_first(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            references = Path(temp_dir) / "references"
+            write_docs(references)
+
+            with SearchIndex(Path(temp_dir) / "index.sqlite") as index:
+                stats = index.update(references, ["api-index*-generated.md"])
+                sections, docs = index.search("recycling ItemsRepeater", limit=10)
+                locate_matches(references, sections, "recycling ItemsRepeater")
+
+        self.assertEqual((stats.docs, stats.indexed), (3, 3))
+        self.assertEqual(
+            [doc.path for doc in docs],
+            ["winui/35-itemsrepeater.md", "20-virtualization.md", "04-styles.md"],
+        )
+        best = sections[0]
+        self.assertEqual(best.heading_path, "WinUI Migration > ItemsRepeater")
+        self.assertEqual((best.start_line, best.match_line), (3, 3))
+        self.assertEqual(docs[1].sections, 3)
+        self.assertGreater(sections[1].score, docs[2].score)
+
+    def test_update_reindexes_only_changed_docs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            references = Path(temp_dir) / "references"
+            index_path = Path(temp_dir) / "index.sqlite"
+            write_docs(references)
+
+            with SearchIndex(index_path) as index:
+                index.update(references, [])
+
+            styles = references / "04-styles.md"
+            os.utime(styles, ns=(0, 0))
+            (references / "20-virtualization.md").write_text(
+                VIRTUALIZATION_DOC + "\n## Prefetch\n\nBuffer items ahead of the viewport.\n", encoding="utf-8"
+            )
+            (references / "winui" / "35-itemsrepeater.md").unlink()
+
+            with SearchIndex(index_path) as index:
+                stats = index.update(references, [])
+                sections, _ = index.search("prefetch buffer")
+                stale, _ = index.search("ItemsRepeater")
+                unchanged = index.update(references, [])
+
+        self.assertEqual((stats.docs, stats.indexed, stats.touched, stats.removed), (3, 1, 1, 1))
+        self.assertEqual(sections[0].heading_path, "ItemsControl Virtualization and Recycling > Prefetch")
+        self.assertEqual([hit.path for hit in stale], ["api-index-generated.md"])
+        self.assertEqual((unchanged.indexed, unchanged.touched, unchanged.removed), (0, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
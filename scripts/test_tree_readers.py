@@ -0,0 +1,66 @@
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.tree_readers import FilesystemTreeReader, GitTreeReader, glob_to_regex
+
+PATTERNS = ["src/**/*.cs", "build/**/*.props", "api/*.xml"]
+FILES = {
+    "src/Avalonia.Controls/Button.cs": "namespace Avalonia.Controls;\npublic class Button { }\n",
+    "src/Avalonia.Controls.cs": "// sorts between the directory and its children\n",
+    "src/Avalonia.Controls/Primitives/Popup.cs": "public class Popup { }\r\n",
+    "src/Avalonia.Controls/Button.xaml": "<Style />\n",
+    "build/Shared.props": "<Project />\n",
+    "api/Avalonia.nupkg.xml": "<Suppressions />\n",
+    "api/nested/Ignored.xml": "<Suppressions />\n",
+}
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, capture_output=True)
+
+
+class TreeReaderTests(unittest.TestCase):
+    def test_glob_to_regex_follows_pathlib_semantics(self) -> None:
+        regex = glob_to_regex("src/**/*.cs")
+        self.assertTrue(regex.match("src/Button.cs"))
+        self.assertTrue(regex.match("src/Avalonia.Controls/Primitives/Popup.cs"))
+        self.assertFalse(regex.match("src/Button.cs.bak"))
+        self.assertFalse(regex.match("tests/src/Button.cs"))
+        self.assertFalse(glob_to_regex("api/*.xml").match("api/nested/Ignored.xml"))
+
+    def test_git_tree_reader_matches_filesystem_reader(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir)
+            for rel, content in FILES.items():
+                path = repo / rel
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(content.encode("utf-8"))
+
+            git(repo, "init", "-q")
+            git(repo, "add", "-A")
+            git(repo, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init")
+            git(repo, "tag", "v1")
+
+            filesystem = FilesystemTreeReader(repo)
+            tree = GitTreeReader(repo, "v1")
+            try:
+                files = tree.list_files(PATTERNS)
+                self.assertEqual(files, filesystem.list_files(PATTERNS))
+                self.assertNotIn("src/Avalonia.Controls/Button.xaml", files)
+                for rel in files:
+                    self.assertEqual(tree.read_bytes(rel), filesystem.read_bytes(rel))
+            finally:
+                tree.close()
+
+    def test_git_tree_reader_rejects_unknown_ref(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = Path(temp_dir)
+            git(repo, "init", "-q")
+            with self.assertRaises(RuntimeError):
+                GitTreeReader(repo, "does-not-exist")
+
+
+if __name__ == "__main__":
+    unittest.main()
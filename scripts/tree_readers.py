@@ -0,0 +1,207 @@
+"""Read Avalonia source trees from a checkout or straight from the git object database.
+
+Both readers expose the same small surface used by the generators:
+- `list_files(patterns)` returns repo-relative POSIX paths matching pathlib-style globs,
+- `read_bytes(rel)` returns the raw file content,
+- `close()` releases any helper process.
+
+`GitTreeReader` lists paths with `git ls-tree` and streams blobs through a single
+long-lived `git cat-file --batch` process, so scanning a tag never writes a checkout.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import pathlib
+import re
+import subprocess
+
+
+def glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a pathlib-style glob (`*`, `?`, `[...]`, `**`) into a full-path regex."""
+    segments = pattern.split("/")
+    out: list[str] = []
+
+    for index, segment in enumerate(segments):
+        is_last = index == len(segments) - 1
+        if segment == "**":
+            # A trailing `**` only matches directories in pathlib, never files.
+            out.append("(?!)" if is_last else "(?:[^/]+/)*")
+            continue
+
+        out.append(translate_segment(segment))
+        if not is_last:
+            out.append("/")
+
+    return re.compile("".join(out) + r"\Z")
+
+
+def translate_segment(segment: str) -> str:
+    out: list[str] = []
+    i = 0
+    while i < len(segment):
+        ch = segment[i]
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            end = segment.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(ch))
+            else:
+                body = segment[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return "".join(out)
+
+
+def path_sort_key(rel: str) -> list[str]:
+    # Match pathlib.Path ordering, which compares path components rather than raw strings.
+    return rel.split("/")
+
+
+class FilesystemTreeReader:
+    """Reads a tree from a directory on disk (a checkout or a detached worktree)."""
+
+    def __init__(self, root: pathlib.Path) -> None:
+        self.root = root
+
+    def list_files(self, patterns: Iterable[str]) -> list[str]:
+        files: set[str] = set()
+        for pattern in patterns:
+            for match in self.root.glob(pattern):
+                if match.is_file():
+                    files.add(match.relative_to(self.root).as_posix())
+        return sorted(files, key=path_sort_key)
+
+    def read_bytes(self, rel: str) -> bytes:
+        return (self.root / rel).read_bytes()
+
+    def close(self) -> None:
+        pass
+
+
+class GitBlobReader:
+    """A persistent `git cat-file --batch` session for reading many objects cheaply."""
+
+    def __init__(self, repo: pathlib.Path) -> None:
+        self.repo = repo
+        self._process = subprocess.Popen(
+            ["git", "-C", str(repo), "cat-file", "--batch"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def read(self, object_name: str) -> bytes | None:
+        """Return the content of `object_name` (a blob SHA or `<ref>:<path>`), or None if missing."""
+        process = self._process
+        assert process.stdin is not None and process.stdout is not None
+
+        process.stdin.write(object_name.encode("utf-8") + b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline()
+        if not header:
+            raise RuntimeError(f"git cat-file exited while reading '{object_name}'")
+        fields = header.split()
+        if len(fields) != 3:
+            # `<name> missing` or `<name> ambiguous`.
+            return None
+
+        size = int(fields[2])
+        data = process.stdout.read(size)
+        process.stdout.read(1)
+        return data
+
+    def close(self) -> None:
+        process = self._process
+        if process.poll() is not None:
+            return
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout is not None:
+            process.stdout.close()
+
+    def __enter__(self) -> GitBlobReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class GitTreeReader:
+    """Reads the tree of a git ref without materializing it on disk."""
+
+    def __init__(self, repo: pathlib.Path, git_ref: str) -> None:
+        self.repo = repo
+        self.git_ref = git_ref
+        self._blobs: dict[str, str] | None = None
+
+        result = subprocess.run(
+            ["git", "-C", str(repo), "rev-parse", "--verify", "--quiet", f"{git_ref}^{{tree}}"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            message = result.stderr.strip() or f"unknown revision '{git_ref}'"
+            raise RuntimeError(f"failed to resolve git ref '{git_ref}': {message}")
+        self.tree = result.stdout.strip()
+        self._reader = GitBlobReader(repo)
+
+    def blobs(self) -> dict[str, str]:
+        """Map every regular file in the tree to its blob SHA."""
+        if self._blobs is None:
+            output = subprocess.run(
+                ["git", "-C", str(self.repo), "ls-tree", "-r", "-z", "--full-tree", self.tree],
+                check=True,
+                capture_output=True,
+            ).stdout
+
+            blobs: dict[str, str] = {}
+            for record in output.split(b"\0"):
+                if not record:
+                    continue
+                meta, _, rel = record.partition(b"\t")
+                mode, object_type, sha = meta.split(b" ")
+                # Skip submodules (commit entries) and symlinks; a worktree scan would not
+                # read submodule content either.
+                if object_type != b"blob" or mode == b"120000":
+                    continue
+                blobs[rel.decode("utf-8", errors="surrogateescape")] = sha.decode("ascii")
+            self._blobs = blobs
+        return self._blobs
+
+    def list_files(self, patterns: Iterable[str]) -> list[str]:
+        compiled = [glob_to_regex(pattern) for pattern in patterns]
+        return sorted(
+            (rel for rel in self.blobs() if any(regex.match(rel) for regex in compiled)),
+            key=path_sort_key,
+        )
+
+    def blob_id(self, rel: str) -> str | None:
+        return self.blobs().get(rel)
+
+    def read_bytes(self, rel: str) -> bytes:
+        sha = self.blob_id(rel)
+        data = self._reader.read(sha if sha is not None else f"{self.tree}:{rel}")
+        if data is None:
+            raise FileNotFoundError(f"{self.git_ref}:{rel}")
+        return data
+
+    def close(self) -> None:
+        self._reader.close()
+
+
+TreeReader = FilesystemTreeReader | GitTreeReader